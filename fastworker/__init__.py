@@ -2,7 +2,18 @@
 
 __version__ = "0.3.0"
 
-from fastworker.clients.client import Client
-from fastworker.tasks.registry import task
-
 __all__ = ["task", "Client", "__version__"]
+
+
+def __getattr__(name: str):
+    # Resolved on first access so importing a submodule (e.g. the CLI) does not
+    # load the client and task stack up front
+    if name == "Client":
+        from fastworker.clients.client import Client
+
+        return Client
+    if name == "task":
+        from fastworker.tasks.registry import task
+
+        return task
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
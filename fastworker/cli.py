@@ -1,16 +1,67 @@
 """CLI interface for FastWorker."""
 
 import argparse
-import asyncio
+import functools
 import importlib
 import logging
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from fastworker.clients.client import Client
+    from fastworker.tasks.models import TaskResult, TaskStatus
+    from fastworker.tasks.registry import task_registry
+    from fastworker.workers.control_plane import ControlPlaneWorker
+    from fastworker.workers.subworker import SubWorker
+    from fastworker.workers.worker import Worker
+
+# Runtime dependencies of the command handlers, imported on first use so that
+# `fastworker --help` and argument errors skip pydantic, pynng and the worker stack.
+# Module attribute access (including test patches) resolves them via __getattr__.
+_LAZY_IMPORTS = {
+    "asyncio": ("asyncio", None),
+    "Client": ("fastworker.clients.client", "Client"),
+    "ControlPlaneWorker": ("fastworker.workers.control_plane", "ControlPlaneWorker"),
+    "SubWorker": ("fastworker.workers.subworker", "SubWorker"),
+    "TaskResult": ("fastworker.tasks.models", "TaskResult"),
+    "TaskStatus": ("fastworker.tasks.models", "TaskStatus"),
+    "Worker": ("fastworker.workers.worker", "Worker"),
+    "task_registry": ("fastworker.tasks.registry", "task_registry"),
+}
+
+
+def _import_lazy(name: str):
+    module_name, attr = _LAZY_IMPORTS[name]
+    module = importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = globals()[name] = _import_lazy(name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _with_runtime(func):
+    """Bind the lazily imported names as globals before running a command handler.
+
+    Names that are already bound (e.g. replaced by a test patch) are left alone.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        module_globals = globals()
+        for name in _LAZY_IMPORTS:
+            if name not in module_globals:
+                module_globals[name] = _import_lazy(name)
+        return func(*args, **kwargs)
+
+    return wrapper
 
-from fastworker.clients.client import Client
-from fastworker.tasks.models import TaskResult, TaskStatus
-from fastworker.tasks.registry import task_registry
-from fastworker.workers.control_plane import ControlPlaneWorker
-from fastworker.workers.subworker import SubWorker
-from fastworker.workers.worker import Worker
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +71,35 @@ logging.basicConfig(
 )
 
 
+@_with_runtime
+def install_uvloop() -> bool:
+    """Use uvloop for the event loop when it is installed.
+
+    Only the long-running worker commands call this; uvloop speeds up the socket I/O
+    that dominates their event loop. Set FASTWORKER_UVLOOP=false to keep the stdlib
+    loop, or FASTWORKER_UVLOOP=true to warn when uvloop is missing.
+
+    Returns:
+        True if the uvloop event loop policy was installed.
+    """
+    setting = os.getenv("FASTWORKER_UVLOOP", "").lower()
+    if setting in ("false", "0", "no"):
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        if setting in ("true", "1", "yes"):
+            logging.getLogger(__name__).warning(
+                "FASTWORKER_UVLOOP is set but uvloop is not installed. "
+                "Install with: pip install fastworker[uvloop]"
+            )
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def convert_arg_type(arg: str):
     """Try to convert string argument to appropriate type."""
     # Try boolean
@@ -47,16 +127,29 @@ def convert_args(args_list):
     return tuple(convert_arg_type(arg) for arg in args_list)
 
 
+def _cached_import(module_name: str):
+    """Return an already imported module directly, importing it otherwise.
+
+    Skips the import lock and finder walk of import_module for modules that are
+    already loaded, e.g. when several commands load the same task modules.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    return importlib.import_module(module_name)
+
+
 def load_tasks(task_modules):
     """Load task modules."""
     for module_name in task_modules:
         try:
-            importlib.import_module(module_name)
+            _cached_import(module_name)
             print(f"Loaded tasks from {module_name}")
         except ImportError as e:
             print(f"Failed to import {module_name}: {e}")
 
 
+@_with_runtime
 def start_worker(args):
     """Start a worker."""
     # Load task modules
@@ -76,6 +169,8 @@ def start_worker(args):
     print(f"Discovery address: {args.discovery_address}")
     print("Press Ctrl+C to stop")
 
+    install_uvloop()
+
     try:
         asyncio.run(worker.start())
     except KeyboardInterrupt:
@@ -83,6 +178,7 @@ def start_worker(args):
         worker.stop()
 
 
+@_with_runtime
 def submit_task(args):
     """Submit a task."""
     # Load task modules
@@ -150,6 +246,7 @@ def submit_task(args):
             print(f"Error: {result.error}")
 
 
+@_with_runtime
 def list_tasks(args):
     """List available tasks."""
     # Load task modules
@@ -187,6 +284,7 @@ def list_tasks(args):
         print(f"  - {name}")
 
 
+@_with_runtime
 def _print_task_tree():
     """Print a tree view of tasks organized by module."""
     from collections import defaultdict
@@ -242,6 +340,7 @@ def _print_task_tree():
     _print_level(module_parts)
 
 
+@_with_runtime
 def start_control_plane(args):
     """Start a control plane worker."""
     # Load task modules
@@ -269,6 +368,8 @@ def start_control_plane(args):
         print(f"Management GUI: http://{args.gui_host}:{args.gui_port}")
     print("Press Ctrl+C to stop")
 
+    install_uvloop()
+
     try:
         asyncio.run(control_plane.start())
     except KeyboardInterrupt:
@@ -276,6 +377,7 @@ def start_control_plane(args):
         control_plane.stop()
 
 
+@_with_runtime
 def start_subworker(args):
     """Start a subworker."""
     # Load task modules
@@ -295,6 +397,8 @@ def start_subworker(args):
     print(f"Control plane: {args.control_plane_address}")
     print("Press Ctrl+C to stop")
 
+    install_uvloop()
+
     try:
         asyncio.run(subworker.start())
     except KeyboardInterrupt:
@@ -302,6 +406,7 @@ def start_subworker(args):
         subworker.stop()
 
 
+@_with_runtime
 def cancel_task(args):
     """Cancel a task by task ID."""
     client = Client(discovery_address=args.discovery_address)
@@ -326,6 +431,7 @@ def cancel_task(args):
     return exit_code
 
 
+@_with_runtime
 def get_task_status(args):
     """Get the status/result of a task by task ID."""
     # Create client
@@ -372,8 +478,13 @@ def get_task_status(args):
     return exit_code
 
 
-def main():
-    """Main CLI entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once per process.
+
+    Commands store their handler's name rather than the function, so the cached
+    parser always dispatches to the current module attribute.
+    """
     parser = argparse.ArgumentParser(description="FastWorker CLI - Brokerless task queue using nng")
 
     # Global logging level option
@@ -406,7 +517,7 @@ def main():
         default=None,
         help="Max concurrent task executions (default: 1, env: FASTWORKER_WORKER_CONCURRENCY)",
     )
-    worker_parser.set_defaults(func=start_worker)
+    worker_parser.set_defaults(func="start_worker")
 
     # Submit command
     submit_parser = subparsers.add_parser("submit", help="Submit a task")
@@ -435,7 +546,7 @@ def main():
         default=None,
         help="Delay execution by N seconds",
     )
-    submit_parser.set_defaults(func=submit_task)
+    submit_parser.set_defaults(func="submit_task")
 
     # List command
     list_parser = subparsers.add_parser("list", help="List available tasks")
@@ -450,7 +561,7 @@ def main():
         action="store_true",
         help="Show tasks organized by module tree",
     )
-    list_parser.set_defaults(func=list_tasks)
+    list_parser.set_defaults(func="list_tasks")
 
     # Control plane command
     control_plane_parser = subparsers.add_parser("control-plane", help="Start control plane worker")
@@ -504,7 +615,7 @@ def main():
         default=None,
         help="Max concurrent task executions (default: 1, env: FASTWORKER_WORKER_CONCURRENCY)",
     )
-    control_plane_parser.set_defaults(func=start_control_plane)
+    control_plane_parser.set_defaults(func="start_control_plane")
 
     # Subworker command
     subworker_parser = subparsers.add_parser("subworker", help="Start a subworker")
@@ -531,7 +642,7 @@ def main():
         default=None,
         help="Max concurrent task executions (default: 1, env: FASTWORKER_WORKER_CONCURRENCY)",
     )
-    subworker_parser.set_defaults(func=start_subworker)
+    subworker_parser.set_defaults(func="start_subworker")
 
     # Cancel command
     cancel_parser = subparsers.add_parser("cancel", help="Cancel a task by task ID")
@@ -541,7 +652,7 @@ def main():
         default="tcp://127.0.0.1:5550",
         help="Discovery address (default: tcp://127.0.0.1:5550)",
     )
-    cancel_parser.set_defaults(func=cancel_task)
+    cancel_parser.set_defaults(func="cancel_task")
 
     # Status command
     status_parser = subparsers.add_parser("status", help="Get task status by task ID")
@@ -551,7 +662,14 @@ def main():
         default="tcp://127.0.0.1:5550",
         help="Discovery address (default: tcp://127.0.0.1:5550)",
     )
-    status_parser.set_defaults(func=get_task_status)
+    status_parser.set_defaults(func="get_task_status")
+
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = _build_parser()
 
     # Parse arguments
     args = parser.parse_args()
@@ -565,7 +683,7 @@ def main():
         return
 
     # Call the appropriate function
-    args.func(args)
+    globals()[args.func](args)
 
 
 if __name__ == "__main__":
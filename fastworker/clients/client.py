@@ -3,9 +3,8 @@
 import asyncio
 import logging
 import os
-from collections import deque
+from collections import OrderedDict, deque
 from typing import Any, Dict, Optional
-from urllib.parse import urlparse
 
 from fastworker.patterns.nng_patterns import (
     BusPattern,
@@ -20,19 +19,32 @@ from fastworker.tasks.models import (
 )
 from fastworker.tasks.serializer import SerializationFormat, TaskSerializer
 from fastworker.telemetry.metrics import record_task_metric
-from fastworker.telemetry.tracer import trace_operation
+from fastworker.telemetry.tracer import trace_operation, tracing_active
+from fastworker.utils.addresses import (
+    RESULT_QUERY_PORT_OFFSET,
+    offset_address,
+    priority_addresses,
+)
+from fastworker.utils.announce import decode_announcement
 
 logger = logging.getLogger(__name__)
 
+# Longest start() waits for a first worker announcement (control planes announce every 2s)
+DISCOVERY_WAIT = 2.0
+
+# Most discovery frames handled per wakeup of the announcement listener
+DISCOVERY_DRAIN_BATCH = 32
+
 
 class Client:
     """Client for submitting tasks to workers with built-in service discovery.
 
     Configuration can be provided via environment variables:
     - FASTWORKER_DISCOVERY_ADDRESS: Discovery address (default: tcp://...:5550)
-    - FASTWORKER_SERIALIZATION_FORMAT: Serialization format (JSON or PICKLE)
+    - FASTWORKER_SERIALIZATION_FORMAT: Serialization format (JSON, PICKLE or MSGPACK)
     - FASTWORKER_TIMEOUT: Task timeout in seconds (default: 30)
     - FASTWORKER_RETRIES: Number of retries for failed submissions (default: 3)
+    - FASTWORKER_CLIENT_MAX_RESULTS: Task results kept in memory (default: 10000)
     """
 
     def __init__(
@@ -41,6 +53,7 @@ class Client:
         serialization_format: Optional[SerializationFormat] = None,
         timeout: Optional[int] = None,
         retries: Optional[int] = None,
+        max_results: Optional[int] = None,
     ):
         # Load from environment variables with fallback to defaults
         self.discovery_address = discovery_address or os.getenv(
@@ -49,15 +62,18 @@ class Client:
 
         # Parse serialization format from string if needed
         if serialization_format is None:
-            format_str = os.getenv("FASTWORKER_SERIALIZATION_FORMAT", "JSON").upper()
-            self.serialization_format = (
-                SerializationFormat.PICKLE if format_str == "PICKLE" else SerializationFormat.JSON
-            )
+            self.serialization_format = SerializationFormat.from_env()
         else:
             self.serialization_format = serialization_format
+        self._serialize, self._deserialize = TaskSerializer.bind(self.serialization_format)
+        self._serialize_model = TaskSerializer.bind_model(self.serialization_format)
+        self._decode_result = TaskSerializer.bind_model_decoder(
+            TaskResult, self.serialization_format
+        )
 
         self.timeout = timeout or int(os.getenv("FASTWORKER_TIMEOUT", "30"))
         self.retries = retries or int(os.getenv("FASTWORKER_RETRIES", "3"))
+        self.max_results = max_results or int(os.getenv("FASTWORKER_CLIENT_MAX_RESULTS", "10000"))
         self.running = False
 
         # Built-in service discovery bus
@@ -66,9 +82,15 @@ class Client:
 
         # Task queue for pending tasks (when no workers available)
         self.pending_tasks: deque = deque()
+        # Set when a worker is discovered or a task is queued, so the pending-task
+        # processor sleeps instead of polling
+        self._pending_event = asyncio.Event()
+        # Set on the first worker announcement; start() returns as soon as it is
+        self._worker_discovered = asyncio.Event()
 
-        # Task results storage (task_id -> TaskResult)
-        self.task_results: Dict[str, TaskResult] = {}
+        # Task results storage (task_id -> TaskResult), least recently used first and
+        # capped at max_results so long-running clients do not grow without bound
+        self.task_results: OrderedDict[str, TaskResult] = OrderedDict()
 
         # Background task processor
         self._task_processor_task = None
@@ -87,31 +109,34 @@ class Client:
         # Start background task processor
         self._task_processor_task = asyncio.create_task(self._process_pending_tasks())
 
-        # Give more time to discover workers (especially if control plane starts after client)
+        # Wait for the first announcement (the control plane may start after the client),
+        # but no longer than one announcement period
         logger.info("Waiting for worker discovery...")
-        await asyncio.sleep(2.0)  # Increased from 0.5 to 2.0 seconds
+        try:
+            await asyncio.wait_for(self._worker_discovered.wait(), timeout=DISCOVERY_WAIT)
+        except asyncio.TimeoutError:
+            pass
         logger.info(f"Client started. Discovered {len(self.workers)} workers: {list(self.workers)}")
 
     async def _listen_for_workers(self):
         """Listen for worker announcements."""
         logger.info("Started listening for worker announcements...")
+        bus = self.discovery_bus
         while self.running:
             try:
-                data = await self.discovery_bus.recv()
-                message = data.decode()
-                logger.debug(f"Received discovery message: {message}")
-
-                if message.startswith("WORKER_ANNOUNCE:"):
-                    # Parse: WORKER_ANNOUNCE:worker_id:address
-                    # Address may contain colons (e.g., tcp://127.0.0.1:5555)
-                    parts = message.split(":", 2)  # Split into max 3 parts
-                    if len(parts) >= 3:
-                        worker_id = parts[1]
-                        worker_address = parts[2]  # This is the full address
-                        self.workers.add((worker_id, worker_address))
-                        logger.info(f"Discovered worker: {worker_id} at {worker_address}")
-                    else:
-                        logger.warning(f"Invalid WORKER_ANNOUNCE format: {message}")
+                # Announcements arrive in bursts; take whatever else is queued in one pass
+                frames = [await bus.recv()]
+                frames.extend(bus.recv_pending(DISCOVERY_DRAIN_BATCH - 1))
+
+                for data in frames:
+                    logger.debug("Received discovery message: %r", data)
+                    announcement = decode_announcement(data)
+                    if announcement is None or announcement in self.workers:
+                        continue
+                    self.workers.add(announcement)
+                    self._pending_event.set()
+                    self._worker_discovered.set()
+                    logger.info("Discovered worker: %s at %s", *announcement)
 
             except (OSError, RuntimeError, ValueError) as e:
                 # Handle closed socket or other errors gracefully
@@ -130,14 +155,22 @@ class Client:
         """Process pending tasks when workers become available."""
         while self.running:
             try:
-                # If we have workers and pending tasks, process them
+                # If we have workers and pending tasks, process them all
                 if self.workers and self.pending_tasks:
-                    task = self.pending_tasks.popleft()
-                    # Submit task in background (don't await, fire and forget)
-                    asyncio.create_task(self._submit_task_internal(task))
-                else:
-                    # Wait a bit before checking again
-                    await asyncio.sleep(0.1)
+                    while self.pending_tasks:
+                        task = self.pending_tasks.popleft()
+                        # Submit task in background (don't await, fire and forget)
+                        asyncio.create_task(self._submit_task_internal(task))
+                    await asyncio.sleep(0)
+                    continue
+
+                # Wait for a worker or a new task; the timeout also picks up workers
+                # and tasks added directly to the collections
+                self._pending_event.clear()
+                try:
+                    await asyncio.wait_for(self._pending_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
             except Exception as e:
                 logger.error(f"Error processing pending tasks: {e}")
                 await asyncio.sleep(0.1)
@@ -148,6 +181,7 @@ class Client:
         if not self.workers:
             logger.debug(f"No workers available, queuing task {task.id}")
             self.pending_tasks.append(task)
+            self._pending_event.set()
             # Return pending result
             result = TaskResult(
                 task_id=task.id,
@@ -157,27 +191,23 @@ class Client:
                 started_at=None,
                 completed_at=None,
             )
-            self.task_results[task.id] = result
+            self._record_result(result)
             return result
 
         # Use the first available worker
         worker_id, worker_address = next(iter(self.workers))
 
-        # Parse worker address and create priority-specific address
-        parsed = urlparse(worker_address)
-        host = parsed.hostname or "127.0.0.1"
-        base_port = parsed.port or 5555
-        scheme = parsed.scheme or "tcp"
-
-        # Map priority to port offset
-        priority_ports = {
-            "critical": base_port,
-            "high": base_port + 1,
-            "normal": base_port + 2,
-            "low": base_port + 3,
-        }
+        priority_address = priority_addresses(worker_address)[task.priority.value]
 
-        priority_address = f"{scheme}://{host}:{priority_ports[task.priority.value]}"
+        # Serialize once; every retry sends the same bytes. A task that cannot be
+        # serialized fails immediately instead of being retried.
+        try:
+            task_data = self._serialize_model(task)
+        except Exception as e:
+            logger.error(f"Error serializing task {task.id}: {e}")
+            result = TaskResult(task_id=task.id, status=TaskStatus.FAILURE, error=str(e))
+            self._record_result(result)
+            return result
 
         # Try to submit task with retries
         for attempt in range(self.retries + 1):
@@ -187,19 +217,14 @@ class Client:
                 await requester.start()
 
                 try:
-                    # Serialize and send task
-                    task_data = TaskSerializer.serialize(
-                        task.model_dump(), self.serialization_format
-                    )
                     await requester.send(task_data)
 
                     # Receive result with timeout
                     result_data = await asyncio.wait_for(requester.recv(), timeout=self.timeout)
-                    result_dict = TaskSerializer.deserialize(result_data, self.serialization_format)
-                    result = TaskResult(**result_dict)
+                    result = self._decode_result(result_data)
 
                     # Store result
-                    self.task_results[task.id] = result
+                    self._record_result(result)
 
                     return result
                 finally:
@@ -219,7 +244,7 @@ class Client:
                         status=TaskStatus.FAILURE,
                         error=f"Task submission timed out after {self.retries} retries",
                     )
-                    self.task_results[task.id] = result
+                    self._record_result(result)
                     return result
             except Exception as e:
                 logger.error(f"Error submitting task: {e}")
@@ -228,7 +253,7 @@ class Client:
                     await asyncio.sleep(0.1 * (2**attempt))  # Exponential backoff
                 else:
                     result = TaskResult(task_id=task.id, status=TaskStatus.FAILURE, error=str(e))
-                    self.task_results[task.id] = result
+                    self._record_result(result)
                     return result
 
     async def submit_task(
@@ -281,13 +306,16 @@ class Client:
         if countdown is not None:
             eta = datetime.now() + timedelta(seconds=countdown)
 
-        with trace_operation(
-            "client.submit_task",
-            attributes={
+        span_attributes = (
+            {
                 "task.name": task_name,
                 "task.priority": (priority.value if hasattr(priority, "value") else str(priority)),
-            },
-        ):
+            }
+            if tracing_active()
+            else None
+        )
+
+        with trace_operation("client.submit_task", attributes=span_attributes):
             task = Task(
                 name=task_name,
                 args=args,
@@ -306,7 +334,7 @@ class Client:
                 started_at=None,
                 completed_at=None,
             )
-            self.task_results[task.id] = result
+            self._record_result(result)
 
         asyncio.create_task(self._submit_task_internal_with_error_handling(task))
         return task.id
@@ -325,15 +353,26 @@ class Client:
                 started_at=None,
                 completed_at=None,
             )
-            self.task_results[task.id] = result
+            self._record_result(result)
+
+    def _record_result(self, result: TaskResult):
+        """Store a task result, evicting the least recently used ones beyond max_results."""
+        results = self.task_results
+        results[result.task_id] = result
+        results.move_to_end(result.task_id)
+        while len(results) > self.max_results:
+            results.popitem(last=False)
 
     def get_result(self, task_id: str) -> Optional[TaskResult]:
         """Get task result by task ID."""
-        return self.task_results.get(task_id)
+        result = self.task_results.get(task_id)
+        if result is not None:
+            self.task_results.move_to_end(task_id)
+        return result
 
     def get_status(self, task_id: str) -> Optional[TaskStatus]:
         """Get task status by task ID."""
-        result = self.task_results.get(task_id)
+        result = self.get_result(task_id)
         return result.status if result else None
 
     async def delay_with_callback(
@@ -372,7 +411,7 @@ class Client:
             started_at=None,
             completed_at=None,
         )
-        self.task_results[task.id] = result
+        self._record_result(result)
 
         # Submit task in background (non-blocking)
         asyncio.create_task(self._submit_task_internal_with_error_handling(task))
@@ -416,30 +455,17 @@ class Client:
             task_objects.append(task)
 
             # Initialize pending result
-            self.task_results[task.id] = TaskResult(
-                task_id=task.id,
-                status=TaskStatus.PENDING,
-            )
+            self._record_result(TaskResult(task_id=task.id, status=TaskStatus.PENDING))
 
         task_ids = [t.id for t in task_objects]
 
         if not self.workers:
-            for t in task_objects:
-                self.pending_tasks.append(t)
+            self.pending_tasks.extend(task_objects)
+            self._pending_event.set()
             return task_ids
 
         worker_id, worker_address = next(iter(self.workers))
-        parsed = urlparse(worker_address)
-        host = parsed.hostname or "127.0.0.1"
-        base_port = parsed.port or 5555
-        scheme = parsed.scheme or "tcp"
-        priority_ports = {
-            "critical": base_port,
-            "high": base_port + 1,
-            "normal": base_port + 2,
-            "low": base_port + 3,
-        }
-        priority_address = f"{scheme}://{host}:{priority_ports[default_priority.value]}"
+        priority_address = priority_addresses(worker_address)[default_priority.value]
 
         batch_data = {
             "action": "batch_submit",
@@ -451,10 +477,10 @@ class Client:
                 requester = ReqRepPattern(priority_address, is_server=False)
                 await requester.start()
                 try:
-                    serialized = TaskSerializer.serialize(batch_data, self.serialization_format)
+                    serialized = self._serialize(batch_data)
                     await requester.send(serialized)
                     response_data = await asyncio.wait_for(requester.recv(), timeout=self.timeout)
-                    response = TaskSerializer.deserialize(response_data, self.serialization_format)
+                    response = self._deserialize(response_data)
                     if response.get("batch_accepted"):
                         logger.info(f"Batch of {len(task_ids)} tasks accepted: {task_ids}")
                     return task_ids
@@ -480,23 +506,17 @@ class Client:
             return False
 
         worker_id, worker_address = next(iter(self.workers))
-        parsed = urlparse(worker_address)
-        host = parsed.hostname or "127.0.0.1"
-        base_port = parsed.port or 5555
-        scheme = parsed.scheme or "tcp"
-        result_query_port = base_port + 4
-
-        result_query_address = f"{scheme}://{host}:{result_query_port}"
+        result_query_address = offset_address(worker_address, RESULT_QUERY_PORT_OFFSET)
 
         try:
             requester = ReqRepPattern(result_query_address, is_server=False)
             await requester.start()
             try:
                 query = {"action": "cancel", "task_id": task_id}
-                query_data = TaskSerializer.serialize(query, self.serialization_format)
+                query_data = self._serialize(query)
                 await requester.send(query_data)
                 response_data = await requester.recv()
-                response = TaskSerializer.deserialize(response_data, self.serialization_format)
+                response = self._deserialize(response_data)
                 success = response.get("cancelled", False)
                 if success:
                     logger.info(f"Task {task_id} cancelled")
@@ -526,14 +546,7 @@ class Client:
         # Use the first available worker (control plane)
         worker_id, worker_address = next(iter(self.workers))
 
-        # Parse worker address to get result query port (base_port + 4)
-        parsed = urlparse(worker_address)
-        host = parsed.hostname or "127.0.0.1"
-        base_port = parsed.port or 5555
-        scheme = parsed.scheme or "tcp"
-        result_query_port = base_port + 4
-
-        result_query_address = f"{scheme}://{host}:{result_query_port}"
+        result_query_address = offset_address(worker_address, RESULT_QUERY_PORT_OFFSET)
 
         try:
             # Create requester to query result
@@ -543,16 +556,16 @@ class Client:
             try:
                 # Send query
                 query = {"task_id": task_id}
-                query_data = TaskSerializer.serialize(query, self.serialization_format)
+                query_data = self._serialize(query)
                 await requester.send(query_data)
 
                 # Receive response
                 response_data = await requester.recv()
-                response = TaskSerializer.deserialize(response_data, self.serialization_format)
+                response = self._deserialize(response_data)
 
                 if response.get("found"):
                     result_dict = response.get("result")
-                    return TaskResult(**result_dict)
+                    return TaskResult.model_validate(result_dict)
                 else:
                     logger.debug(f"Result not found for task {task_id}: {response.get('error')}")
                     return None
@@ -1,23 +1,100 @@
 """Service discovery for FastWorker."""
 
 import asyncio
-import json
 import logging
-from typing import Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional
 
 from fastworker.patterns.nng_patterns import BusPattern
+from fastworker.tasks.serializer import SerializationFormat, TaskSerializer
 
 logger = logging.getLogger(__name__)
 
 
+class _ServiceTable(dict):
+    """Service records keyed by service id, indexed by service type.
+
+    ``by_type`` maps each type to its records in registration order. Every dict
+    mutation keeps it in step, including writes made directly to
+    ``ServiceDiscovery.services``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.by_type: Dict[Any, Dict[str, Dict]] = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, service_id: str, record: Dict):
+        old = self.get(service_id)
+        if old is not None and old.get("type") != record.get("type"):
+            self._unindex(service_id, old)
+        super().__setitem__(service_id, record)
+        self.by_type.setdefault(record.get("type"), {})[service_id] = record
+
+    def __delitem__(self, service_id: str):
+        record = self[service_id]
+        super().__delitem__(service_id)
+        self._unindex(service_id, record)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def _unindex(self, service_id: str, record: Dict):
+        service_type = record.get("type")
+        bucket = self.by_type.get(service_type)
+        if bucket is not None:
+            bucket.pop(service_id, None)
+            if not bucket:
+                del self.by_type[service_type]
+
+    def pop(self, service_id: str, *default):
+        if service_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(service_id)
+        record = self[service_id]
+        del self[service_id]
+        return record
+
+    def popitem(self):
+        service_id, record = super().popitem()
+        self._unindex(service_id, record)
+        return service_id, record
+
+    def setdefault(self, service_id: str, default: Optional[Dict] = None):
+        if service_id not in self:
+            self[service_id] = default
+        return self[service_id]
+
+    def update(self, *args, **kwargs):
+        for service_id, record in dict(*args, **kwargs).items():
+            self[service_id] = record
+
+    def clear(self):
+        super().clear()
+        self.by_type.clear()
+
+
 class ServiceDiscovery:
     """Service discovery using nng Bus pattern."""
 
     def __init__(self, discovery_address: str):
         self.discovery_address = discovery_address
         self.bus_pattern = BusPattern(discovery_address, listen=True)
-        self.services: Dict[str, Dict] = {}
+        self._services = _ServiceTable()
         self.running = False
+        # Announcements are JSON; encoded and parsed straight from bytes (orjson if installed)
+        self._serialize, self._deserialize = TaskSerializer.bind(SerializationFormat.JSON)
+
+    @property
+    def services(self) -> Dict[str, Dict]:
+        """Registered services by id; writes keep the by-type index up to date."""
+        return self._services
+
+    @services.setter
+    def services(self, services: Dict[str, Dict]):
+        self._services = _ServiceTable(services)
 
     async def start(self):
         """Start the service discovery."""
@@ -33,10 +110,13 @@ class ServiceDiscovery:
         while self.running:
             try:
                 data = await self.bus_pattern.recv()
-                announcement = json.loads(data.decode("utf-8"))
+                announcement = self._deserialize(data)
 
                 service_id = announcement.get("service_id")
                 service_type = announcement.get("service_type")
+                if isinstance(service_type, str):
+                    # A handful of types repeat across every record; share one string each
+                    service_type = sys.intern(service_type)
                 address = announcement.get("address")
                 action = announcement.get("action")
 
@@ -44,7 +124,7 @@ class ServiceDiscovery:
                     self.services[service_id] = {
                         "type": service_type,
                         "address": address,
-                        "timestamp": asyncio.get_event_loop().time(),
+                        "timestamp": asyncio.get_running_loop().time(),
                     }
                     logger.info(f"Registered service {service_id} at {address}")
                 elif action == "unregister":
@@ -63,22 +143,18 @@ class ServiceDiscovery:
             "address": address,
             "action": "register",
         }
-        data = json.dumps(announcement).encode("utf-8")
-        await self.bus_pattern.send(data)
+        await self.bus_pattern.send(self._serialize(announcement))
 
     async def unregister_service(self, service_id: str):
         """Unregister a service."""
         announcement = {"service_id": service_id, "action": "unregister"}
-        data = json.dumps(announcement).encode("utf-8")
-        await self.bus_pattern.send(data)
+        await self.bus_pattern.send(self._serialize(announcement))
 
     def get_services(self, service_type: Optional[str] = None) -> List[Dict]:
-        """Get registered services."""
+        """Get registered services, optionally only those of one type."""
         if service_type:
-            return [
-                service for service in self.services.values() if service["type"] == service_type
-            ]
-        return list(self.services.values())
+            return list(self._services.by_type.get(service_type, {}).values())
+        return list(self._services.values())
 
     def stop(self):
         """Stop the service discovery."""
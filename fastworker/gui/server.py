@@ -6,11 +6,14 @@ import os
 import queue
 import socketserver
 import threading
+import time
 from datetime import datetime
 from http.server import SimpleHTTPRequestHandler
 from typing import TYPE_CHECKING, Any, Dict, Optional
 from urllib.parse import parse_qs, urlparse
 
+from fastworker.utils.timestamps import result_last_accessed, subworker_last_seen
+
 if TYPE_CHECKING:
     from fastworker.utils.event_bus import EventBus
     from fastworker.workers.control_plane import ControlPlaneWorker
@@ -19,6 +22,49 @@ logger = logging.getLogger(__name__)
 
 STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
 
+# Events buffered per SSE client; a client that falls further behind loses the oldest
+SSE_QUEUE_SIZE = 1000
+
+# Minimum seconds between warnings about events dropped for slow SSE clients
+SSE_DROP_WARNING_INTERVAL = 60.0
+
+# Drops since the last warning; only the event bridge thread touches these
+_dropped_events = 0
+_last_drop_warning = float("-inf")
+
+
+def _record_dropped_event() -> None:
+    """Count an event dropped for a slow SSE client, warning at most once per interval."""
+    global _dropped_events, _last_drop_warning
+    _dropped_events += 1
+    now = time.monotonic()
+    if now - _last_drop_warning >= SSE_DROP_WARNING_INTERVAL:
+        logger.warning(
+            "SSE client is not keeping up: dropped %d event(s) since the last warning",
+            _dropped_events,
+        )
+        _dropped_events = 0
+        _last_drop_warning = now
+
+
+def _offer_event(q: queue.Queue, event: Dict[str, Any]) -> None:
+    """Queue an event for an SSE client, dropping its oldest event when the queue is full."""
+    try:
+        q.put_nowait(event)
+        return
+    except queue.Full:
+        pass
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    _record_dropped_event()
+    try:
+        q.put_nowait(event)
+    except queue.Full:
+        # The queue refilled concurrently; drop this event rather than block the bridge
+        _record_dropped_event()
+
 
 class ThreadingHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
     """HTTP server that handles each request in a new thread."""
@@ -189,7 +235,7 @@ class ManagementRequestHandler(SimpleHTTPRequestHandler):
         self.end_headers()
 
         # Create a thread-safe queue and register with the event bus
-        t_queue: queue.Queue = queue.Queue()
+        t_queue: queue.Queue = queue.Queue(maxsize=SSE_QUEUE_SIZE)
         self.server.sse_queues.append(t_queue)
 
         try:
@@ -257,7 +303,7 @@ class ManagementRequestHandler(SimpleHTTPRequestHandler):
             return
 
         cp = self.control_plane
-        active_workers = sum(1 for w in cp.subworkers.values() if w["status"] == "active")
+        active_workers = cp.active_subworker_count()
         inactive_workers = len(cp.subworkers) - active_workers
         total_queued = sum(len(q) for q in cp.task_queue.values())
 
@@ -315,9 +361,9 @@ class ManagementRequestHandler(SimpleHTTPRequestHandler):
                     "status": info["status"],
                     "load": info["load"],
                     "last_seen": (
-                        info["last_seen"].isoformat()
-                        if isinstance(info["last_seen"], datetime)
-                        else str(info["last_seen"])
+                        last_seen.isoformat()
+                        if isinstance(last_seen := subworker_last_seen(info), datetime)
+                        else str(last_seen)
                     ),
                     "registered_at": (
                         info.get("registered_at", "").isoformat()
@@ -366,7 +412,7 @@ class ManagementRequestHandler(SimpleHTTPRequestHandler):
                         result.completed_at.isoformat() if result.completed_at else None
                     ),
                     "cached_at": entry["stored_at"].isoformat(),
-                    "last_accessed": entry["last_accessed"].isoformat(),
+                    "last_accessed": result_last_accessed(entry).isoformat(),
                 }
             )
 
@@ -497,10 +543,7 @@ class ManagementServer:
         async def bridge():
             async for event in self.event_bus.subscribe():
                 for q in list(self.sse_queues):
-                    try:
-                        q.put_nowait(event)
-                    except queue.Full:
-                        pass
+                    _offer_event(q, event)
 
         try:
             loop = asyncio.new_event_loop()
@@ -1,8 +1,15 @@
 from fastworker.patterns.nng_patterns import (
     BusPattern,
     PairPattern,
+    ReplyContext,
     ReqRepPattern,
     SurveyorRespondentPattern,
 )
 
-__all__ = ["ReqRepPattern", "BusPattern", "PairPattern", "SurveyorRespondentPattern"]
+__all__ = [
+    "ReqRepPattern",
+    "ReplyContext",
+    "BusPattern",
+    "PairPattern",
+    "SurveyorRespondentPattern",
+]
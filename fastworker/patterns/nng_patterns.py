@@ -1,10 +1,22 @@
 """NNG patterns implementation for FastWorker."""
 
+from contextlib import suppress
 from enum import Enum
+from typing import List, Tuple
 
 import pynng
 
 
+def _close_context(context) -> None:
+    """Close an nng context, ignoring that its socket may already be closed.
+
+    Closing the socket tears down its contexts, and a second close would raise
+    ``pynng.Closed`` over whatever error is already propagating.
+    """
+    with suppress(pynng.Closed):
+        context.close()
+
+
 class PatternType(Enum):
     """NNG pattern types."""
 
@@ -29,6 +41,10 @@ class ReqRepPattern:
             self.socket = pynng.Rep0(listen=self.address)
         else:
             self.socket = pynng.Req0(dial=self.address)
+        # Every message on the hot paths goes through send/recv; point them straight
+        # at the socket so each call skips the wrapper coroutine
+        self.send = self.socket.asend
+        self.recv = self.socket.arecv
 
     async def send(self, data: bytes):
         """Send data."""
@@ -38,12 +54,66 @@ class ReqRepPattern:
         """Receive data."""
         return await self.socket.arecv()
 
+    async def recv_request(self) -> Tuple[bytes, "ReplyContext"]:
+        """Receive a request on its own nng context (servers only).
+
+        A plain Rep0 socket tracks a single pending request: receiving again before
+        replying makes the next send answer the newer request. Each context carries
+        its own request state, so any number of requests can be in flight and
+        answered in any order through the returned :class:`ReplyContext`.
+        """
+        return await _recv_on_context(self.socket)
+
+    async def request(self, data: bytes) -> bytes:
+        """Send a request and return its reply on a fresh nng context (clients only).
+
+        Each context runs its own request/reply exchange, so concurrent requests
+        can share one socket without waiting for each other.
+        """
+        context = self.socket.new_context()
+        try:
+            await context.asend(data)
+            return await context.arecv()
+        finally:
+            _close_context(context)
+
     def close(self):
         """Close the socket."""
         if self.socket:
             self.socket.close()
 
 
+async def _recv_on_context(socket) -> Tuple[bytes, "ReplyContext"]:
+    """Receive one message on a new context of ``socket`` and wrap it for the reply."""
+    context = socket.new_context()
+    try:
+        data = await context.arecv()
+    except BaseException:
+        _close_context(context)
+        raise
+    return data, ReplyContext(context)
+
+
+class ReplyContext:
+    """Reply handle for one request received with :meth:`ReqRepPattern.recv_request`."""
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context):
+        self._context = context
+
+    async def send(self, data: bytes):
+        """Send the reply and release the context."""
+        try:
+            await self._context.asend(data)
+        finally:
+            _close_context(self._context)
+
+    def close(self):
+        """Release the context without replying."""
+        _close_context(self._context)
+
+
 class PubSubPattern:
     """Publish/Subscribe pattern for priority queues."""
 
@@ -105,6 +175,14 @@ class SurveyorRespondentPattern:
         """Receive data."""
         return await self.socket.arecv()
 
+    async def recv_request(self) -> Tuple[bytes, ReplyContext]:
+        """Receive a survey on its own nng context (respondents only).
+
+        Like :meth:`ReqRepPattern.recv_request`: each survey is answered through the
+        returned :class:`ReplyContext`, in any order.
+        """
+        return await _recv_on_context(self.socket)
+
     def close(self):
         """Close the socket."""
         if self.socket:
@@ -134,6 +212,16 @@ class BusPattern:
         """Receive data."""
         return await self.socket.arecv()
 
+    def recv_pending(self, limit: int) -> List[bytes]:
+        """Return up to ``limit`` messages that are already queued, without waiting."""
+        messages = []
+        while len(messages) < limit:
+            try:
+                messages.append(self.socket.recv(block=False))
+            except pynng.TryAgain:
+                break
+        return messages
+
     def close(self):
         """Close the socket."""
         if self.socket:
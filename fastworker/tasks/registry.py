@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Dict, Optional
 
 from fastworker.tasks.schedules import ScheduleConfig
@@ -21,6 +22,15 @@ class TaskInfo:
     schedule: Optional[ScheduleConfig] = None
     before: Optional[Callable] = None
     after: Optional[Callable] = None
+    # Whether func/before/after are coroutine functions, resolved once at registration
+    is_async: bool = field(init=False)
+    before_is_async: bool = field(init=False)
+    after_is_async: bool = field(init=False)
+
+    def __post_init__(self):
+        self.is_async = inspect.iscoroutinefunction(self.func)
+        self.before_is_async = inspect.iscoroutinefunction(self.before)
+        self.after_is_async = inspect.iscoroutinefunction(self.after)
 
 
 class TaskRegistry:
@@ -28,6 +38,9 @@ class TaskRegistry:
 
     def __init__(self):
         self._tasks: Dict[str, TaskInfo] = {}
+        # Workers look up every task they execute; point get_task_info straight at the
+        # dict so each lookup skips the wrapper method. _tasks is never rebound.
+        self.get_task_info = self._tasks.get
 
     def register(
         self,
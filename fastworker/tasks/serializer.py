@@ -1,22 +1,115 @@
 """Task serialization for FastWorker."""
 
 import json
+import os
 import pickle
 import warnings
+from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
 
 class SerializationFormat(str, Enum):
     """Serialization formats.
 
     Attributes:
-        JSON: JSON serialization (safe, recommended for untrusted networks).
+        JSON: JSON serialization (safe, recommended for untrusted networks). Uses
+            orjson when installed (``pip install fastworker[orjson]``).
         PICKLE: Python pickle serialization (NOT secure, use only on trusted networks).
+        MSGPACK: MessagePack serialization (safe, compact and faster than JSON;
+            requires ``pip install fastworker[msgpack]``).
     """
 
     JSON = "json"
     PICKLE = "pickle"
+    MSGPACK = "msgpack"
+
+    @classmethod
+    def from_env(cls) -> "SerializationFormat":
+        """Read the format from FASTWORKER_SERIALIZATION_FORMAT (default: JSON).
+
+        ``ORJSON`` is accepted as an alias for ``JSON``, which is encoded with orjson
+        whenever it is installed. Unknown names fall back to JSON.
+        """
+        name = os.getenv("FASTWORKER_SERIALIZATION_FORMAT", "JSON").upper()
+        return cls.__members__.get(_FORMAT_ALIASES.get(name, name), cls.JSON)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Alternative names accepted in FASTWORKER_SERIALIZATION_FORMAT
+_FORMAT_ALIASES = {"ORJSON": "JSON"}
+
+
+def _json_default(value: Any) -> str:
+    # Match orjson, which writes datetimes in ISO format rather than as str(dt)
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _stdlib_json_serialize(data: Any) -> bytes:
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+def _stdlib_json_deserialize(data: bytes) -> Any:
+    return json.loads(data.decode("utf-8"))
+
+
+if ORJSON_AVAILABLE:
+
+    def _json_serialize(data: Any) -> bytes:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. integers wider than 64 bits) go through json
+            return _stdlib_json_serialize(data)
+
+    def _json_deserialize(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json accepts NaN/Infinity literals from peers encoding with the stdlib
+            return _stdlib_json_deserialize(data)
+
+else:
+    _json_serialize = _stdlib_json_serialize
+    _json_deserialize = _stdlib_json_deserialize
+
+
+def _json_serialize_model(model: BaseModel) -> bytes:
+    # pydantic-core encodes the model straight to JSON bytes without building a dict;
+    # values it has no encoder for fall back to str() like the dict path
+    return to_json(model, serialize_unknown=True)
+
+
+def _msgpack_pack() -> Callable[[Any], bytes]:
+    # msgpack.packb builds a new Packer (and its buffer) on every call; a bound
+    # Packer reuses both. Packers are not thread-safe, so each bind() gets its own.
+    return msgpack.Packer(use_bin_type=True, default=str).pack
+
+
+def _require_msgpack():
+    if not MSGPACK_AVAILABLE:
+        raise ImportError(
+            "MSGPACK serialization requires msgpack. Install with: pip install fastworker[msgpack]"
+        )
 
 
 class TaskSerializer:
@@ -43,7 +136,7 @@ class TaskSerializer:
             Serialized data as bytes.
         """
         if format == SerializationFormat.JSON:
-            return json.dumps(data, default=str).encode("utf-8")
+            return _json_serialize(data)
         elif format == SerializationFormat.PICKLE:
             warnings.warn(
                 "PICKLE serialization is NOT secure and can execute arbitrary code. "
@@ -52,9 +145,33 @@ class TaskSerializer:
                 stacklevel=2,
             )
             return pickle.dumps(data)
+        elif format == SerializationFormat.MSGPACK:
+            _require_msgpack()
+            # Like JSON, fall back to str() for values msgpack has no type for (e.g. datetime)
+            return msgpack.packb(data, use_bin_type=True, default=str)
         else:
             raise ValueError(f"Unsupported serialization format: {format}")
 
+    @staticmethod
+    def serialize_model(
+        model: BaseModel, format: SerializationFormat = SerializationFormat.JSON
+    ) -> bytes:
+        """Serialize a pydantic model (e.g. a Task or TaskResult) to bytes.
+
+        Equivalent to ``serialize(model.model_dump(), format)``, but JSON is encoded
+        directly from the model without the intermediate dict.
+
+        Args:
+            model: Model to serialize.
+            format: Serialization format to use.
+
+        Returns:
+            Serialized data as bytes.
+        """
+        if format == SerializationFormat.JSON:
+            return _json_serialize_model(model)
+        return TaskSerializer.serialize(model.model_dump(), format)
+
     @staticmethod
     def deserialize(data: bytes, format: SerializationFormat = SerializationFormat.JSON) -> Any:
         """Deserialize bytes to data.
@@ -70,7 +187,7 @@ class TaskSerializer:
             Deserializing untrusted data with PICKLE can lead to code execution.
         """
         if format == SerializationFormat.JSON:
-            return json.loads(data.decode("utf-8"))
+            return _json_deserialize(data)
         elif format == SerializationFormat.PICKLE:
             warnings.warn(
                 "PICKLE deserialization is NOT secure. Only deserialize data from trusted sources.",
@@ -78,5 +195,92 @@ class TaskSerializer:
                 stacklevel=2,
             )
             return pickle.loads(data)
+        elif format == SerializationFormat.MSGPACK:
+            _require_msgpack()
+            return msgpack.unpackb(data, raw=False)
+        else:
+            raise ValueError(f"Unsupported serialization format: {format}")
+
+    @staticmethod
+    def bind(
+        format: SerializationFormat = SerializationFormat.JSON,
+    ) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+        """Resolve the serialize/deserialize functions for a format once.
+
+        Workers and clients call this at construction so the per-message path is a
+        direct function call instead of a format dispatch.
+
+        Args:
+            format: Serialization format to use.
+
+        Returns:
+            A ``(serialize, deserialize)`` pair of single-argument callables.
+        """
+        if format == SerializationFormat.JSON:
+            return _json_serialize, _json_deserialize
+        elif format == SerializationFormat.PICKLE:
+            warnings.warn(
+                "PICKLE serialization is NOT secure and can execute arbitrary code. "
+                "Consider using JSON serialization for untrusted networks.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return pickle.dumps, pickle.loads
+        elif format == SerializationFormat.MSGPACK:
+            _require_msgpack()
+            return _msgpack_pack(), partial(msgpack.unpackb, raw=False)
+        else:
+            raise ValueError(f"Unsupported serialization format: {format}")
+
+    @staticmethod
+    def bind_model(
+        format: SerializationFormat = SerializationFormat.JSON,
+    ) -> Callable[[Any], bytes]:
+        """Resolve the :meth:`serialize_model` function for a format once.
+
+        Meant to be used next to :meth:`bind`, which emits the PICKLE warning.
+
+        Args:
+            format: Serialization format to use.
+
+        Returns:
+            A single-argument callable taking a pydantic model.
+        """
+        if format == SerializationFormat.JSON:
+            return _json_serialize_model
+        elif format == SerializationFormat.PICKLE:
+            return lambda model: pickle.dumps(model.model_dump())
+        elif format == SerializationFormat.MSGPACK:
+            _require_msgpack()
+            pack = _msgpack_pack()
+            return lambda model: pack(model.model_dump())
+        else:
+            raise ValueError(f"Unsupported serialization format: {format}")
+
+    @staticmethod
+    def bind_model_decoder(
+        model_type: Type[ModelT], format: SerializationFormat = SerializationFormat.JSON
+    ) -> Callable[[bytes], ModelT]:
+        """Resolve a bytes -> model decoder for a format once.
+
+        For JSON, pydantic-core parses and validates the bytes in one pass, without
+        building the intermediate dict that ``model_validate(deserialize(data))``
+        needs. Meant to be used next to :meth:`bind`, which emits the PICKLE warning.
+
+        Args:
+            model_type: Pydantic model to validate into, e.g. ``Task``.
+            format: Serialization format the bytes use.
+
+        Returns:
+            A single-argument callable returning a ``model_type`` instance.
+        """
+        if format == SerializationFormat.JSON:
+            return model_type.model_validate_json
+        elif format == SerializationFormat.PICKLE:
+            return lambda data: model_type.model_validate(pickle.loads(data))
+        elif format == SerializationFormat.MSGPACK:
+            _require_msgpack()
+            unpack = partial(msgpack.unpackb, raw=False)
+            return lambda data: model_type.model_validate(unpack(data))
         else:
             raise ValueError(f"Unsupported serialization format: {format}")
@@ -13,16 +13,34 @@ Configuration via environment variables:
 - FASTWORKER_TELEMETRY_ENABLED: Enable telemetry (default: false)
 - OTEL_SERVICE_NAME: Service name (default: fastworker)
 - OTEL_EXPORTER_OTLP_ENDPOINT: OTLP endpoint (default: http://localhost:4317)
+- FASTWORKER_TELEMETRY_PROBE_TIMEOUT: Startup connect check for the endpoint in
+  seconds, 0 to skip (default: 0.5)
+
+The tracer and meter are set up when their modules are imported, so hot paths
+never check for initialization. The enable flag is only read at that point: with
+telemetry off, the public entry points are rebound to stand-ins that do nothing,
+and spans and instruments are one shared no-op object, so the disabled path
+allocates nothing. A forked child rebuilds its own exporter, because the
+parent's gRPC channel does not survive fork().
 """
 
-from .metrics import get_meter, record_task_metric, record_worker_metric
-from .tracer import get_tracer, trace_operation, trace_task
+from .metrics import (
+    get_meter,
+    record_task_metric,
+    record_worker_metric,
+    register_queue_size_source,
+    unregister_queue_size_sources,
+)
+from .tracer import get_tracer, trace_operation, trace_task, tracing_active
 
 __all__ = [
     "get_tracer",
     "trace_task",
     "trace_operation",
+    "tracing_active",
     "get_meter",
     "record_task_metric",
     "record_worker_metric",
+    "register_queue_size_source",
+    "unregister_queue_size_sources",
 ]
@@ -0,0 +1,23 @@
+"""Import-time setup shared by the tracer and metrics modules."""
+
+import os
+from typing import Any, Callable, Dict
+
+
+def telemetry_enabled() -> bool:
+    """Read FASTWORKER_TELEMETRY_ENABLED (default: false)."""
+    return os.getenv("FASTWORKER_TELEMETRY_ENABLED", "false").lower() in ("true", "1", "yes")
+
+
+def bootstrap(
+    namespace: Dict[str, Any],
+    initialize: Callable[[], None],
+    reinitialize_after_fork: Callable[[], None],
+    disabled_entry_points: Dict[str, Callable],
+):
+    """Initialize a telemetry module, rebinding its entry points when telemetry is off."""
+    initialize()
+    if not telemetry_enabled():
+        namespace.update(disabled_entry_points)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=reinitialize_after_fork)
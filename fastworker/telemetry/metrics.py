@@ -2,7 +2,11 @@
 
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastworker.telemetry.bootstrap import bootstrap, telemetry_enabled
+from fastworker.telemetry.probe import endpoint_reachable
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +16,7 @@ try:
     from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
         OTLPMetricExporter,
     )
+    from opentelemetry.metrics import Observation
     from opentelemetry.sdk.metrics import MeterProvider
     from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
     from opentelemetry.sdk.resources import Resource
@@ -24,53 +29,39 @@ except ImportError:
     )
 
 
-class NoOpMeter:
-    """No-op meter when OpenTelemetry is not available or disabled."""
-
-    def create_counter(self, name: str, unit: str = "", description: str = ""):
-        """Create no-op counter."""
-        return NoOpCounter()
-
-    def create_histogram(self, name: str, unit: str = "", description: str = ""):
-        """Create no-op histogram."""
-        return NoOpHistogram()
+class _NoOp:
+    """No-op meter and instrument, shared as one singleton."""
 
-    def create_up_down_counter(self, name: str, unit: str = "", description: str = ""):
-        """Create no-op up-down counter."""
-        return NoOpUpDownCounter()
+    __slots__ = ()
 
+    def create_counter(self, name: str, unit: str = "", description: str = ""):
+        """Create no-op instrument (returns the shared singleton)."""
+        return self
 
-class NoOpCounter:
-    """No-op counter."""
+    create_histogram = create_counter
+    create_up_down_counter = create_counter
+    create_observable_gauge = create_counter
 
     def add(self, amount: int, attributes: Optional[Dict[str, Any]] = None) -> None:
         """No-op add."""
         pass
 
-
-class NoOpHistogram:
-    """No-op histogram."""
-
     def record(self, amount: float, attributes: Optional[Dict[str, Any]] = None) -> None:
         """No-op record."""
         pass
 
 
-class NoOpUpDownCounter:
-    """No-op up-down counter."""
+_NOOP = _NoOp()
 
-    def add(self, amount: int, attributes: Optional[Dict[str, Any]] = None) -> None:
-        """No-op add."""
-        pass
+# Backward-compatible names for the former per-instrument no-op classes
+NoOpMeter = NoOpCounter = NoOpHistogram = NoOpUpDownCounter = _NoOp
 
 
-# Global meter instance
+# Global meter instance (set by _ensure_meter() at import time and after fork)
 _meter: Optional[Any] = None
-_telemetry_enabled = os.getenv("FASTWORKER_TELEMETRY_ENABLED", "false").lower() in (
-    "true",
-    "1",
-    "yes",
-)
+_init_lock = threading.Lock()
+_provider_installed = False
+_telemetry_enabled = telemetry_enabled()
 
 # Metric instruments
 _task_submitted_counter: Optional[Any] = None
@@ -80,34 +71,43 @@ _task_duration_histogram: Optional[Any] = None
 _worker_active_gauge: Optional[Any] = None
 _queue_size_gauge: Optional[Any] = None
 
+# Queue size sources polled by the observable gauge: (worker_id, priority) -> size callable
+_queue_size_sources: Dict[Tuple[str, str], Callable[[], int]] = {}
+
+# Per-worker activity counts behind the workers.active gauge (only non-zero entries)
+_worker_active_counts: Dict[str, int] = {}
+
+
+def _use_noop():
+    """Point the meter and all instruments at the shared no-op singleton."""
+    global _meter, _task_submitted_counter, _task_completed_counter, _task_failed_counter
+    global _task_duration_histogram, _worker_active_gauge, _queue_size_gauge
+
+    _meter = _NOOP
+    _task_submitted_counter = _NOOP
+    _task_completed_counter = _NOOP
+    _task_failed_counter = _NOOP
+    _task_duration_histogram = _NOOP
+    _worker_active_gauge = _NOOP
+    _queue_size_gauge = _NOOP
+
 
 def _initialize_meter():
     """Initialize OpenTelemetry meter."""
     global _meter, _task_submitted_counter, _task_completed_counter, _task_failed_counter
     global _task_duration_histogram, _worker_active_gauge, _queue_size_gauge
+    global _provider_installed
+
+    if not _telemetry_enabled:
+        logger.debug("Telemetry disabled. Set FASTWORKER_TELEMETRY_ENABLED=true to enable.")
+        _use_noop()
+        return
 
     if not OTEL_AVAILABLE:
         logger.warning(
             "OpenTelemetry metrics not available. Install with: pip install fastworker[telemetry]"
         )
-        _meter = NoOpMeter()
-        _task_submitted_counter = NoOpCounter()
-        _task_completed_counter = NoOpCounter()
-        _task_failed_counter = NoOpCounter()
-        _task_duration_histogram = NoOpHistogram()
-        _worker_active_gauge = NoOpUpDownCounter()
-        _queue_size_gauge = NoOpUpDownCounter()
-        return
-
-    if not _telemetry_enabled:
-        logger.debug("Telemetry disabled. Set FASTWORKER_TELEMETRY_ENABLED=true to enable.")
-        _meter = NoOpMeter()
-        _task_submitted_counter = NoOpCounter()
-        _task_completed_counter = NoOpCounter()
-        _task_failed_counter = NoOpCounter()
-        _task_duration_histogram = NoOpHistogram()
-        _worker_active_gauge = NoOpUpDownCounter()
-        _queue_size_gauge = NoOpUpDownCounter()
+        _use_noop()
         return
 
     try:
@@ -115,6 +115,11 @@ def _initialize_meter():
         service_name = os.getenv("OTEL_SERVICE_NAME", "fastworker")
         otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
 
+        # Fail fast instead of letting every export stall on a missing collector
+        if not endpoint_reachable(otlp_endpoint):
+            _use_noop()
+            return
+
         # Create resource with service name
         resource = Resource.create({"service.name": service_name})
 
@@ -127,11 +132,14 @@ def _initialize_meter():
         # Create meter provider
         provider = MeterProvider(resource=resource, metric_readers=[reader])
 
-        # Set global meter provider
-        metrics.set_meter_provider(provider)
+        # Set global meter provider (only once per process tree - a forked child
+        # inherits the parent's global and keeps its own provider private)
+        if not _provider_installed:
+            metrics.set_meter_provider(provider)
+            _provider_installed = True
 
         # Get meter
-        _meter = metrics.get_meter(__name__)
+        _meter = provider.get_meter(__name__)
 
         # Create metric instruments
         _task_submitted_counter = _meter.create_counter(
@@ -164,25 +172,44 @@ def _initialize_meter():
             description="Number of active workers",
         )
 
-        _queue_size_gauge = _meter.create_up_down_counter(
+        _queue_size_gauge = _meter.create_observable_gauge(
             name="fastworker.queue.size",
+            callbacks=[_collect_queue_sizes],
             unit="1",
             description="Number of tasks in queue",
         )
 
         logger.info(
-            f"OpenTelemetry metrics initialized: service={service_name}, endpoint={otlp_endpoint}"
+            "OpenTelemetry metrics initialized: service=%s, endpoint=%s",
+            service_name,
+            otlp_endpoint,
         )
 
     except Exception as e:
-        logger.error(f"Failed to initialize OpenTelemetry metrics: {e}")
-        _meter = NoOpMeter()
-        _task_submitted_counter = NoOpCounter()
-        _task_completed_counter = NoOpCounter()
-        _task_failed_counter = NoOpCounter()
-        _task_duration_histogram = NoOpHistogram()
-        _worker_active_gauge = NoOpUpDownCounter()
-        _queue_size_gauge = NoOpUpDownCounter()
+        logger.error("Failed to initialize OpenTelemetry metrics: %s", e)
+        _use_noop()
+
+
+def _collect_queue_sizes(options: Any) -> Iterable[Any]:
+    """Observable gauge callback: report the current size of every registered queue."""
+    for (worker_id, priority), size_fn in list(_queue_size_sources.items()):
+        yield Observation(size_fn(), {"worker.id": worker_id, "queue.priority": priority})
+
+
+def _ensure_meter():
+    """Initialize the meter exactly once, even if called from several threads."""
+    if _meter is None:
+        with _init_lock:
+            if _meter is None:
+                _initialize_meter()
+
+
+def _reinitialize_after_fork():
+    """Rebuild the meter (and its lock) in a forked child."""
+    global _meter, _init_lock
+    _init_lock = threading.Lock()
+    _meter = None
+    _ensure_meter()
 
 
 def get_meter():
@@ -191,8 +218,7 @@ def get_meter():
     Returns:
         Meter instance (OpenTelemetry meter or NoOpMeter)
     """
-    if _meter is None:
-        _initialize_meter()
+    _ensure_meter()
     return _meter
 
 
@@ -202,6 +228,7 @@ def record_task_metric(
     priority: Optional[str] = None,
     worker_id: Optional[str] = None,
     duration_ms: Optional[float] = None,
+    duration_ns: Optional[int] = None,
 ):
     """Record a task metric.
 
@@ -211,15 +238,16 @@ def record_task_metric(
         priority: Task priority (optional)
         worker_id: Worker ID (optional)
         duration_ms: Task duration in milliseconds (for completed tasks)
+        duration_ns: Task duration in integer nanoseconds, e.g. the difference of two
+            ``time.perf_counter_ns()`` readings; converted to milliseconds only when
+            recorded. Takes precedence over ``duration_ms``.
 
     Example:
         record_task_metric("submitted", "process_data", priority="high")
         record_task_metric("completed", "process_data", worker_id="worker1", duration_ms=150.5)
+        record_task_metric("completed", "process_data", worker_id="worker1", duration_ns=150_500_000)
         record_task_metric("failed", "process_data", worker_id="worker1")
     """
-    if _meter is None:
-        _initialize_meter()
-
     attributes = {"task.name": task_name}
     if priority:
         attributes["task.priority"] = priority
@@ -230,7 +258,9 @@ def record_task_metric(
         _task_submitted_counter.add(1, attributes)
     elif metric_type == "completed":
         _task_completed_counter.add(1, attributes)
-        if duration_ms is not None:
+        if duration_ns is not None:
+            _task_duration_histogram.record(duration_ns / 1_000_000, attributes)
+        elif duration_ms is not None:
             _task_duration_histogram.record(duration_ms, attributes)
     elif metric_type == "failed":
         _task_failed_counter.add(1, attributes)
@@ -240,42 +270,83 @@ def record_worker_metric(metric_type: str, worker_id: str, count: int = 1):
     """Record a worker metric.
 
     Args:
-        metric_type: Type of metric ('active', 'queue_size')
+        metric_type: Type of metric ('active')
         worker_id: Worker ID
         count: Count to add (positive or negative)
 
+    Only transitions between idle and active are emitted, so repeated calls for a
+    worker that is already active add nothing to the exported gauge.
+
+    Queue sizes are not recorded here; register a source with
+    :func:`register_queue_size_source` and the gauge samples it on export.
+
     Example:
         record_worker_metric("active", "worker1", 1)  # Worker started
         record_worker_metric("active", "worker1", -1)  # Worker stopped
-        record_worker_metric("queue_size", "control-plane", 5)  # 5 tasks added to queue
     """
-    if _meter is None:
-        _initialize_meter()
+    if metric_type == "active":
+        delta = _active_transition(worker_id, count)
+        if delta:
+            _worker_active_gauge.add(delta, {"worker.id": worker_id})
 
-    attributes = {"worker.id": worker_id}
 
-    if metric_type == "active":
-        _worker_active_gauge.add(count, attributes)
-    elif metric_type == "queue_size":
-        _queue_size_gauge.add(count, attributes)
+def _active_transition(worker_id: str, count: int) -> int:
+    """Track a worker's activity count and return the gauge change it causes.
 
+    Each worker contributes at most 1 to ``fastworker.workers.active``, so only the
+    idle -> active (+1) and active -> idle (-1) transitions are emitted; changes
+    between non-zero counts return 0. The SDK keeps the cumulative sum and
+    re-exports it every interval, which keeps the gauge in sync without a
+    separate heartbeat.
+    """
+    previous = _worker_active_counts.get(worker_id, 0)
+    current = max(previous + count, 0)
+    if current:
+        _worker_active_counts[worker_id] = current
+    else:
+        _worker_active_counts.pop(worker_id, None)
+
+    if previous == 0 and current > 0:
+        return 1
+    if previous > 0 and current == 0:
+        return -1
+    return 0
+
+
+def register_queue_size_source(worker_id: str, priority: str, size_fn: Callable[[], int]):
+    """Register a queue whose size is reported by the ``fastworker.queue.size`` gauge.
 
-def record_queue_size(worker_id: str, priority: str, size: int):
-    """Record current queue size for a specific priority.
+    The gauge polls ``size_fn`` once per export interval instead of being updated
+    on every enqueue/dequeue.
 
     Args:
         worker_id: Worker ID (usually control plane)
         priority: Task priority level
-        size: Current queue size
+        size_fn: Zero-argument callable returning the current queue size
 
     Example:
-        record_queue_size("control-plane", "high", 10)
+        register_queue_size_source("control-plane", "high", lambda: len(queue))
     """
-    if _meter is None:
-        _initialize_meter()
+    _queue_size_sources[(worker_id, priority)] = size_fn
+
 
-    attributes = {"worker.id": worker_id, "queue.priority": priority}
+def unregister_queue_size_sources(worker_id: str):
+    """Stop reporting queue sizes for a worker.
 
-    # This would ideally be an observable gauge, but we use up-down counter for simplicity
-    # In a real implementation, you might want to use callbacks for observable gauges
-    _queue_size_gauge.add(size, attributes)
+    Args:
+        worker_id: Worker ID passed to :func:`register_queue_size_source`
+    """
+    for key in [key for key in _queue_size_sources if key[0] == worker_id]:
+        del _queue_size_sources[key]
+
+
+def _record_nothing(*args, **kwargs):
+    """Stand-in for the record_* functions when telemetry is disabled."""
+
+
+bootstrap(
+    globals(),
+    _ensure_meter,
+    _reinitialize_after_fork,
+    {"record_task_metric": _record_nothing, "record_worker_metric": _record_nothing},
+)
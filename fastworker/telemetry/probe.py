@@ -0,0 +1,64 @@
+"""Connectivity check for the OTLP collector endpoint."""
+
+import logging
+import os
+import socket
+from functools import lru_cache
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OTLP_PORT = 4317
+DEFAULT_PROBE_TIMEOUT = 0.5  # seconds
+
+
+def _probe_timeout() -> float:
+    """Read the probe timeout from FASTWORKER_TELEMETRY_PROBE_TIMEOUT (0 disables it)."""
+    value = os.getenv("FASTWORKER_TELEMETRY_PROBE_TIMEOUT")
+    if value is None:
+        return DEFAULT_PROBE_TIMEOUT
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            "Invalid FASTWORKER_TELEMETRY_PROBE_TIMEOUT=%r, using %s",
+            value,
+            DEFAULT_PROBE_TIMEOUT,
+        )
+        return DEFAULT_PROBE_TIMEOUT
+
+
+@lru_cache(maxsize=None)
+def _check(endpoint: str, timeout: float) -> bool:
+    # OTLP endpoints may be given with or without a scheme ("localhost:4317")
+    parsed = urlparse(endpoint if "://" in endpoint else f"//{endpoint}")
+    host = parsed.hostname or "localhost"
+    port = parsed.port or DEFAULT_OTLP_PORT
+
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError as e:
+        logger.warning("OTLP endpoint %s is unreachable (%s); telemetry disabled", endpoint, e)
+        return False
+
+
+def endpoint_reachable(endpoint: str) -> bool:
+    """Check that something is listening on the OTLP endpoint.
+
+    The OTLP exporters connect lazily and retry with long timeouts, so a missing
+    collector otherwise only shows up as stalled exports. A short TCP connect lets
+    the caller fall back to no-op instruments instead. The result is cached per
+    endpoint so the meter and tracer share a single probe.
+
+    Args:
+        endpoint: OTLP endpoint, e.g. ``http://localhost:4317``
+
+    Returns:
+        True if a TCP connection succeeded or the probe is disabled
+        (FASTWORKER_TELEMETRY_PROBE_TIMEOUT=0), False otherwise
+    """
+    timeout = _probe_timeout()
+    if timeout <= 0:
+        return True
+    return _check(endpoint, timeout)
@@ -1,11 +1,16 @@
 """OpenTelemetry tracing support for FastWorker."""
 
+import inspect
 import logging
 import os
+import threading
 from contextlib import contextmanager
 from functools import wraps
 from typing import Any, Dict, Optional
 
+from fastworker.telemetry.bootstrap import bootstrap, telemetry_enabled
+from fastworker.telemetry.probe import endpoint_reachable
+
 logger = logging.getLogger(__name__)
 
 # Check if OpenTelemetry is available
@@ -23,21 +28,18 @@ except ImportError:
     logger.debug("OpenTelemetry not available. Install with: pip install fastworker[telemetry]")
 
 
-class NoOpTracer:
-    """No-op tracer when OpenTelemetry is not available or disabled."""
+class _NoOp:
+    """No-op tracer, span and span context manager, shared as one singleton."""
+
+    __slots__ = ()
 
-    @contextmanager
     def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
-        """No-op context manager."""
-        yield None
+        """No-op context manager (returns the shared singleton)."""
+        return self
 
     def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
-        """No-op span."""
-        return NoOpSpan()
-
-
-class NoOpSpan:
-    """No-op span when OpenTelemetry is not available or disabled."""
+        """No-op span (returns the shared singleton)."""
+        return self
 
     def set_attribute(self, key: str, value: Any) -> None:
         """No-op set attribute."""
@@ -59,32 +61,36 @@ class NoOpSpan:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        return False
+
+
+_NOOP = _NoOp()
 
+# Backward-compatible names for the former no-op tracer and span classes
+NoOpTracer = NoOpSpan = _NoOp
 
-# Global tracer instance
+
+# Global tracer instance (set by _ensure_tracer() at import time and after fork)
 _tracer: Optional[Any] = None
-_telemetry_enabled = os.getenv("FASTWORKER_TELEMETRY_ENABLED", "false").lower() in (
-    "true",
-    "1",
-    "yes",
-)
+_init_lock = threading.Lock()
+_provider_installed = False
+_telemetry_enabled = telemetry_enabled()
 
 
 def _initialize_tracer():
     """Initialize OpenTelemetry tracer."""
-    global _tracer
+    global _tracer, _provider_installed
+
+    if not _telemetry_enabled:
+        logger.debug("Telemetry disabled. Set FASTWORKER_TELEMETRY_ENABLED=true to enable.")
+        _tracer = _NOOP
+        return
 
     if not OTEL_AVAILABLE:
         logger.warning(
             "OpenTelemetry not available. Install with: pip install fastworker[telemetry]"
         )
-        _tracer = NoOpTracer()
-        return
-
-    if not _telemetry_enabled:
-        logger.debug("Telemetry disabled. Set FASTWORKER_TELEMETRY_ENABLED=true to enable.")
-        _tracer = NoOpTracer()
+        _tracer = _NOOP
         return
 
     try:
@@ -92,6 +98,11 @@ def _initialize_tracer():
         service_name = os.getenv("OTEL_SERVICE_NAME", "fastworker")
         otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
 
+        # Fail fast instead of letting every export stall on a missing collector
+        if not endpoint_reachable(otlp_endpoint):
+            _tracer = _NOOP
+            return
+
         # Create resource with service name
         resource = Resource.create({"service.name": service_name})
 
@@ -105,19 +116,40 @@ def _initialize_tracer():
         processor = BatchSpanProcessor(otlp_exporter)
         provider.add_span_processor(processor)
 
-        # Set global tracer provider
-        trace.set_tracer_provider(provider)
+        # Set global tracer provider (only once per process tree - a forked child
+        # inherits the parent's global and keeps its own provider private)
+        if not _provider_installed:
+            trace.set_tracer_provider(provider)
+            _provider_installed = True
 
         # Get tracer
-        _tracer = trace.get_tracer(__name__)
+        _tracer = provider.get_tracer(__name__)
 
         logger.info(
-            f"OpenTelemetry tracer initialized: service={service_name}, endpoint={otlp_endpoint}"
+            "OpenTelemetry tracer initialized: service=%s, endpoint=%s",
+            service_name,
+            otlp_endpoint,
         )
 
     except Exception as e:
-        logger.error(f"Failed to initialize OpenTelemetry tracer: {e}")
-        _tracer = NoOpTracer()
+        logger.error("Failed to initialize OpenTelemetry tracer: %s", e)
+        _tracer = _NOOP
+
+
+def _ensure_tracer():
+    """Initialize the tracer exactly once, even if called from several threads."""
+    if _tracer is None:
+        with _init_lock:
+            if _tracer is None:
+                _initialize_tracer()
+
+
+def _reinitialize_after_fork():
+    """Rebuild the tracer (and its lock) in a forked child."""
+    global _tracer, _init_lock
+    _init_lock = threading.Lock()
+    _tracer = None
+    _ensure_tracer()
 
 
 def get_tracer():
@@ -126,12 +158,19 @@ def get_tracer():
     Returns:
         Tracer instance (OpenTelemetry tracer or NoOpTracer)
     """
-    if _tracer is None:
-        _initialize_tracer()
+    _ensure_tracer()
     return _tracer
 
 
-@contextmanager
+def tracing_active() -> bool:
+    """Whether spans are actually recorded.
+
+    Lets hot paths skip building span attributes that the no-op tracer would
+    discard anyway.
+    """
+    return _tracer is not None and _tracer is not _NOOP
+
+
 def trace_operation(operation_name: str, attributes: Optional[Dict[str, Any]] = None):
     """Context manager for tracing operations.
 
@@ -144,12 +183,20 @@ def trace_operation(operation_name: str, attributes: Optional[Dict[str, Any]] =
             # Your code here
             pass
     """
-    tracer = get_tracer()
-    with tracer.start_as_current_span(operation_name, attributes=attributes) as span:
+    # Disabled tracing: the no-op singleton is its own context manager, no generator needed
+    if _tracer is _NOOP:
+        return _NOOP
+    return _trace_operation(operation_name, attributes)
+
+
+@contextmanager
+def _trace_operation(operation_name: str, attributes: Optional[Dict[str, Any]]):
+    """Generator-based context manager backing trace_operation() for a real tracer."""
+    with _tracer.start_as_current_span(operation_name, attributes=attributes) as span:
         try:
             yield span
         except Exception as e:
-            if span and OTEL_AVAILABLE and _telemetry_enabled:
+            if span:
                 span.set_status(Status(StatusCode.ERROR))
                 span.record_exception(e)
             raise
@@ -168,54 +215,74 @@ def trace_task(func):
             return x * 2
     """
 
-    @wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        task_name = func.__name__
-        tracer = get_tracer()
+    # Nothing to record - hand back the original function so calls carry no overhead
+    if not (OTEL_AVAILABLE and _telemetry_enabled):
+        return func
 
-        with tracer.start_as_current_span(f"task.{task_name}") as span:
-            if span and OTEL_AVAILABLE and _telemetry_enabled:
-                span.set_attribute("task.name", task_name)
-                span.set_attribute("task.args_count", len(args))
-                span.set_attribute("task.kwargs_count", len(kwargs))
+    task_name = func.__name__
+    span_name = f"task.{task_name}"
 
+    @wraps(func)
+    async def async_wrapper(*args, **kwargs):
+        # Set all attributes at span creation instead of one set_attribute() call each
+        attributes = {
+            "task.name": task_name,
+            "task.args_count": len(args),
+            "task.kwargs_count": len(kwargs),
+        }
+
+        with _tracer.start_as_current_span(span_name, attributes=attributes) as span:
             try:
                 result = await func(*args, **kwargs)
-                if span and OTEL_AVAILABLE and _telemetry_enabled:
+                if span:
                     span.set_status(Status(StatusCode.OK))
                 return result
             except Exception as e:
-                if span and OTEL_AVAILABLE and _telemetry_enabled:
+                if span:
                     span.set_status(Status(StatusCode.ERROR))
                     span.record_exception(e)
                 raise
 
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
-        task_name = func.__name__
-        tracer = get_tracer()
-
-        with tracer.start_as_current_span(f"task.{task_name}") as span:
-            if span and OTEL_AVAILABLE and _telemetry_enabled:
-                span.set_attribute("task.name", task_name)
-                span.set_attribute("task.args_count", len(args))
-                span.set_attribute("task.kwargs_count", len(kwargs))
+        attributes = {
+            "task.name": task_name,
+            "task.args_count": len(args),
+            "task.kwargs_count": len(kwargs),
+        }
 
+        with _tracer.start_as_current_span(span_name, attributes=attributes) as span:
             try:
                 result = func(*args, **kwargs)
-                if span and OTEL_AVAILABLE and _telemetry_enabled:
+                if span:
                     span.set_status(Status(StatusCode.OK))
                 return result
             except Exception as e:
-                if span and OTEL_AVAILABLE and _telemetry_enabled:
+                if span:
                     span.set_status(Status(StatusCode.ERROR))
                     span.record_exception(e)
                 raise
 
     # Return appropriate wrapper based on function type
-    import asyncio as aio
-
-    if aio.iscoroutinefunction(func):
+    if inspect.iscoroutinefunction(func):
         return async_wrapper
     else:
         return sync_wrapper
+
+
+def _untraced_operation(operation_name: str, attributes: Optional[Dict[str, Any]] = None):
+    """Stand-in for trace_operation() when telemetry is disabled."""
+    return _NOOP
+
+
+def _untraced_task(func):
+    """Stand-in for trace_task() when telemetry is disabled."""
+    return func
+
+
+bootstrap(
+    globals(),
+    _ensure_tracer,
+    _reinitialize_after_fork,
+    {"trace_operation": _untraced_operation, "trace_task": _untraced_task},
+)
@@ -0,0 +1,46 @@
+"""Derive per-port socket addresses from a node's base address."""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
+from urllib.parse import urlparse
+
+# Port offsets from a node's base port
+PRIORITY_PORT_OFFSETS = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+RESULT_QUERY_PORT_OFFSET = 4
+MANAGEMENT_PORT_OFFSET = 5
+
+
+@lru_cache(maxsize=256)
+def _split(address: str) -> Tuple[str, str, int]:
+    """(scheme, host, port) of an address, defaulting to ``tcp://127.0.0.1:5555``."""
+    parsed = urlparse(address)
+    return parsed.scheme or "tcp", parsed.hostname or "127.0.0.1", parsed.port or 5555
+
+
+def port_address(address: str, port: int) -> str:
+    """Same scheme and host as ``address``, on ``port``."""
+    scheme, host, _ = _split(address)
+    return f"{scheme}://{host}:{port}"
+
+
+@lru_cache(maxsize=256)
+def offset_address(address: str, offset: int) -> str:
+    """Address ``offset`` ports above the base port of ``address``.
+
+    Clients derive these on every submission, so results are cached per
+    (address, offset) instead of re-parsing the URL each time.
+    """
+    scheme, host, base_port = _split(address)
+    return f"{scheme}://{host}:{base_port + offset}"
+
+
+@lru_cache(maxsize=256)
+def priority_addresses(address: str) -> Mapping[str, str]:
+    """Per-priority socket addresses for a base address (read-only, cached)."""
+    return MappingProxyType(
+        {
+            priority: offset_address(address, offset)
+            for priority, offset in PRIORITY_PORT_OFFSETS.items()
+        }
+    )
@@ -0,0 +1,51 @@
+"""Wire format of worker announcements on the discovery bus."""
+
+import struct
+from typing import Optional, Tuple
+
+# Frame: tag, 2-byte big-endian worker id length, worker id, address (rest of frame).
+# The leading NUL keeps binary frames distinct from the legacy text form.
+ANNOUNCE_TAG = b"\x00WA"
+_LEGACY_PREFIX = b"WORKER_ANNOUNCE:"
+_ID_LENGTH = struct.Struct("!H")
+_HEADER_SIZE = len(ANNOUNCE_TAG) + _ID_LENGTH.size
+
+
+def encode_announcement(worker_id: str, address: str) -> bytes:
+    """Encode a worker announcement.
+
+    The worker id is length-prefixed, so ids and addresses may contain any
+    character (addresses always contain ``:``).
+    """
+    worker_id_bytes = worker_id.encode()
+    return b"".join(
+        (
+            ANNOUNCE_TAG,
+            _ID_LENGTH.pack(len(worker_id_bytes)),
+            worker_id_bytes,
+            address.encode(),
+        )
+    )
+
+
+def decode_announcement(data: bytes) -> Optional[Tuple[str, str]]:
+    """Decode a worker announcement into ``(worker_id, address)``.
+
+    Also accepts the legacy ``WORKER_ANNOUNCE:<id>:<address>`` text form sent by
+    older nodes. Returns None for anything that is not a well-formed announcement.
+    """
+    try:
+        if data.startswith(ANNOUNCE_TAG):
+            (id_length,) = _ID_LENGTH.unpack_from(data, len(ANNOUNCE_TAG))
+            id_end = _HEADER_SIZE + id_length
+            if id_end >= len(data):
+                return None
+            return data[_HEADER_SIZE:id_end].decode(), data[id_end:].decode()
+
+        if data.startswith(_LEGACY_PREFIX):
+            worker_id, sep, address = data[len(_LEGACY_PREFIX) :].decode().partition(":")
+            if sep and address:
+                return worker_id, address
+    except (struct.error, UnicodeDecodeError):
+        pass
+    return None
@@ -0,0 +1,22 @@
+"""Wall-clock display times derived from monotonic readings."""
+
+from datetime import datetime, timedelta
+from typing import Dict
+
+
+def subworker_last_seen(info: Dict) -> datetime:
+    """Wall-clock time a subworker was last heard from, for display.
+
+    Heartbeats only record ``time.monotonic()``; the datetime is derived from the
+    registration time when it is needed.
+    """
+    if "last_seen_mono" in info:
+        return info["registered_at"] + timedelta(
+            seconds=info["last_seen_mono"] - info["registered_mono"]
+        )
+    return info["last_seen"]
+
+
+def result_last_accessed(entry: Dict) -> datetime:
+    """Wall-clock time a cached result was last read, for display."""
+    return entry["stored_at"] + timedelta(seconds=entry["accessed_mono"] - entry["stored_mono"])
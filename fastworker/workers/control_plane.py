@@ -1,13 +1,16 @@
 """Control Plane Worker implementation for FastWorker."""
 
 import asyncio
+import heapq
+import itertools
 import logging
 import os
-import signal
+import time
 from collections import OrderedDict, deque
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Optional
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import pynng
 
 from fastworker.patterns.nng_patterns import ReqRepPattern
 from fastworker.tasks.models import (
@@ -16,16 +19,46 @@ from fastworker.tasks.models import (
     TaskResult,
     TaskStatus,
 )
-from fastworker.tasks.serializer import SerializationFormat, TaskSerializer
+from fastworker.tasks.serializer import SerializationFormat
+from fastworker.telemetry.metrics import (
+    register_queue_size_source,
+    unregister_queue_size_sources,
+)
+from fastworker.utils.addresses import (
+    RESULT_QUERY_PORT_OFFSET,
+    offset_address,
+    port_address,
+    priority_addresses,
+)
 from fastworker.utils.event_bus import EventBus
+from fastworker.utils.timestamps import subworker_last_seen
 from fastworker.workers.state import WorkerState
-from fastworker.workers.worker import Worker
+from fastworker.workers.worker import PRIORITY_ORDER, Worker
 
 if TYPE_CHECKING:
     from fastworker.gui.server import ManagementServer
 
 logger = logging.getLogger(__name__)
 
+# Most queued tasks handed out per distributor pass before yielding to the event loop
+MAX_DISPATCH_BATCH = 100
+
+# Seconds a subworker may take beyond the task timeout before its reply is abandoned
+SUBWORKER_REPLY_GRACE = 5.0
+
+
+class _DiscardReply:
+    """Respondent for tasks that must not reply, e.g. members of a batch submission."""
+
+    async def send(self, data: bytes):
+        pass
+
+    def close(self):
+        pass
+
+
+_NO_REPLY = _DiscardReply()
+
 
 class ControlPlaneWorker(Worker):
     """Control plane worker that manages subworkers and also processes tasks.
@@ -34,7 +67,7 @@ class ControlPlaneWorker(Worker):
     - FASTWORKER_WORKER_ID: Worker ID (default: control-plane)
     - FASTWORKER_BASE_ADDRESS: Base address (default: tcp://127.0.0.1:5555)
     - FASTWORKER_DISCOVERY_ADDRESS: Discovery address (default: tcp://..:5550)
-    - FASTWORKER_SERIALIZATION_FORMAT: Serialization format (JSON or PICKLE)
+    - FASTWORKER_SERIALIZATION_FORMAT: Serialization format (JSON, PICKLE or MSGPACK)
     - FASTWORKER_SUBWORKER_PORT: Subworker management port (default: 5560)
     - FASTWORKER_RESULT_CACHE_SIZE: Maximum cached results (default: 10000)
     - FASTWORKER_RESULT_CACHE_TTL: Cache TTL in seconds (default: 3600)
@@ -66,10 +99,7 @@ class ControlPlaneWorker(Worker):
 
         # Parse serialization format from string if needed
         if serialization_format is None:
-            format_str = os.getenv("FASTWORKER_SERIALIZATION_FORMAT", "JSON").upper()
-            serialization_format = (
-                SerializationFormat.PICKLE if format_str == "PICKLE" else SerializationFormat.JSON
-            )
+            serialization_format = SerializationFormat.from_env()
 
         subworker_management_port = subworker_management_port or int(
             os.getenv("FASTWORKER_SUBWORKER_PORT", "5560")
@@ -106,47 +136,49 @@ class ControlPlaneWorker(Worker):
             concurrency=concurrency,
         )
 
-        # Override patterns to use ReqRepPattern instead of SurveyorRespondentPattern.
-        # Clients use ReqRepPattern, so control plane must match.
-        parsed = urlparse(base_address)
-        host = parsed.hostname or "127.0.0.1"
-        base_port = parsed.port or 5555
-        scheme = parsed.scheme or "tcp"
-
-        priority_ports = {
-            "critical": base_port,
-            "high": base_port + 1,
-            "normal": base_port + 2,
-            "low": base_port + 3,
-        }
-
-        # Replace SurveyorRespondentPattern with ReqRepPattern (is_server=True means listen)
-        self.critical_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['critical']}", is_server=True
-        )
-        self.high_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['high']}", is_server=True
-        )
-        self.normal_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['normal']}", is_server=True
-        )
-        self.low_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['low']}", is_server=True
-        )
-
         # Event bus for state transition events → GUI SSE
         self.event_bus = EventBus()
 
         # Control plane specific attributes
         self.subworker_management_port = subworker_management_port
-        self.subworkers: Dict[str, Dict] = {}  # subworker_id -> {address, status, last_seen, load}
+        # subworker_id -> {address, status, load, last_seen_mono, ...}; the wall-clock
+        # last_seen is derived on demand by subworker_last_seen()
+        self.subworkers: Dict[str, Dict] = {}
         self.task_queue: Dict[TaskPriority, deque] = {
             TaskPriority.CRITICAL: deque(),
             TaskPriority.HIGH: deque(),
             TaskPriority.NORMAL: deque(),
             TaskPriority.LOW: deque(),
         }
+        # The same deques as a tuple in PRIORITY_ORDER, so the distributor can walk them
+        # without hashing enum keys (Enum.__hash__ is a Python-level call). The deques are
+        # only ever mutated in place so both views stay in sync.
+        self._task_queues: Tuple[deque, ...] = tuple(self.task_queue[p] for p in PRIORITY_ORDER)
         self.active_tasks: Dict[str, Task] = {}  # task_id -> Task
+        # Set when a task is queued so the distributor can sleep while the queues are empty
+        self._queue_event = asyncio.Event()
+
+        # Load index for _select_subworker: min-heap of (load, seq, subworker_id) with lazy
+        # deletion. Only the entry whose seq matches _load_seq[subworker_id] is current;
+        # inactive subworkers are keyed at infinity so they sort last.
+        self._load_heap: list[tuple] = []
+        self._load_seq: Dict[str, int] = {}
+        self._load_counter = itertools.count()
+        # IDs of subworkers whose status is "active", kept in step with the load index
+        self._active_subworkers: set[str] = set()
+
+        # Staleness index for _monitor_subworkers: min-heap of (last_seen_mono, subworker_id).
+        # Every heartbeat pushes a new entry; superseded entries are skipped when popped.
+        self._last_seen_heap: list[tuple[float, str]] = []
+        self._last_seen_indexed: set[str] = set()
+
+        # Persistent requesters to subworkers: (subworker_id, priority) -> requester.
+        # Each exchange runs on its own nng context, so tasks share the connection
+        # without serializing on it.
+        self._subworker_requesters: Dict[Tuple[str, str], ReqRepPattern] = {}
+        # Exchanges in flight per requester; a requester dropped from the cache is
+        # closed only once its count reaches zero, so other exchanges are not aborted
+        self._requester_in_flight: Dict[ReqRepPattern, int] = {}
 
         # Cancellation tracking: task_id -> asyncio.Event set when cancelled
         self._cancel_events: dict[str, asyncio.Event] = {}
@@ -163,19 +195,27 @@ class ControlPlaneWorker(Worker):
         self.result_cache_ttl_seconds = result_cache_ttl_seconds
         # OrderedDict for LRU eviction (most recently accessed at end)
         self.result_cache: OrderedDict[str, Dict] = OrderedDict()
-        # task_id -> {result: TaskResult, stored_at: datetime, last_accessed: datetime}
+        # task_id -> {result: TaskResult, stored_at: datetime, stored_mono: float,
+        #             accessed_mono: float, response: serialized query response (lazy)}
+        # TTL index: (stored_mono, task_id) in store order. LRU access reorders result_cache,
+        # so expiry is tracked separately; entries for evicted or re-stored results are
+        # skipped when they reach the front.
+        self._expiry_queue: deque[tuple[float, str]] = deque()
 
         # Result query endpoint (for clients to query task results)
-        result_query_port = base_port + 4  # Use port 5559
         self.result_query_server = ReqRepPattern(
-            f"{scheme}://{host}:{result_query_port}", is_server=True
+            offset_address(base_address, RESULT_QUERY_PORT_OFFSET), is_server=True
         )
 
         # Subworker management socket (for subworkers to register)
         self.subworker_registry = ReqRepPattern(
-            f"{scheme}://{host}:{subworker_management_port}", is_server=True
+            port_address(base_address, subworker_management_port), is_server=True
         )
 
+    def _create_respondent(self, address: str):
+        """Clients use ReqRepPattern, so control plane must match."""
+        return ReqRepPattern(address, is_server=True)
+
     async def start(self):
         """Start the control plane worker."""
         logger.info(f"Starting control plane worker {self.worker_id}")
@@ -201,9 +241,7 @@ class ControlPlaneWorker(Worker):
                 self._management_server = None
 
         # Set up signal handlers
-        loop = asyncio.get_running_loop()
-        for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, self._signal_handler, sig)
+        self._install_signal_handlers()
 
         try:
             # Start service discovery bus
@@ -236,14 +274,7 @@ class ControlPlaneWorker(Worker):
 
             # Start all task processing respondents
             logger.info("Starting task processing respondents...")
-            await self.critical_respondent.start()
-            logger.info("Critical priority listener started")
-            await self.high_respondent.start()
-            logger.info("High priority listener started")
-            await self.normal_respondent.start()
-            logger.info("Normal priority listener started")
-            await self.low_respondent.start()
-            logger.info("Low priority listener started")
+            await self._start_respondents()
 
         except Exception as e:
             logger.error(f"Failed to start control plane {self.worker_id}: {e}")
@@ -266,14 +297,13 @@ class ControlPlaneWorker(Worker):
         # Schedule periodic tasks before starting processing loops
         self._schedule_periodic_tasks()
 
+        # Queue sizes are sampled by the telemetry gauge on export, not per enqueue
+        for priority, queue in zip(PRIORITY_ORDER, self._task_queues, strict=True):
+            register_queue_size_source(self.worker_id, priority.value, lambda q=queue: len(q))
+
         # Start task processing
         task_runners = [
-            asyncio.create_task(
-                self._process_tasks(self.critical_respondent, TaskPriority.CRITICAL)
-            ),
-            asyncio.create_task(self._process_tasks(self.high_respondent, TaskPriority.HIGH)),
-            asyncio.create_task(self._process_tasks(self.normal_respondent, TaskPriority.NORMAL)),
-            asyncio.create_task(self._process_tasks(self.low_respondent, TaskPriority.LOW)),
+            *self._spawn_task_processors(),
             # Control plane specific tasks
             asyncio.create_task(self._distribute_queued_tasks()),
             asyncio.create_task(self._monitor_subworkers()),
@@ -297,7 +327,12 @@ class ControlPlaneWorker(Worker):
         for t in task_runners:
             t.cancel()
 
+        # Leave DRAINING before closing sockets, so the registration, result query and
+        # discovery loops see the shutdown and exit instead of retrying on closed sockets
+        await self.lifecycle.force_stop()
         self.stop()
+        await self.lifecycle.complete_stop()
+        logger.info(f"Control plane {self.worker_id} stopped")
 
     async def _periodic_announcements(self):
         """Periodically re-announce control plane presence."""
@@ -318,7 +353,7 @@ class ControlPlaneWorker(Worker):
             try:
                 # Receive registration request
                 data = await self.subworker_registry.recv()
-                registration = TaskSerializer.deserialize(data, self.serialization_format)
+                registration = self._deserialize(data)
 
                 subworker_id = registration.get("subworker_id")
                 subworker_address = registration.get("address")
@@ -329,77 +364,89 @@ class ControlPlaneWorker(Worker):
                 if subworker_id and subworker_address:
                     # Update last_seen timestamp
                     if subworker_id in self.subworkers:
-                        self.subworkers[subworker_id]["last_seen"] = datetime.now()
-                        self.subworkers[subworker_id]["status"] = status
+                        now_mono = time.monotonic()
+                        self.subworkers[subworker_id]["last_seen_mono"] = now_mono
+                        self._index_last_seen(subworker_id, now_mono)
+                        if self.subworkers[subworker_id]["status"] != status:
+                            self.subworkers[subworker_id]["status"] = status
+                            self._index_subworker_load(subworker_id)
                     else:
                         # New registration
+                        now = datetime.now()
+                        now_mono = time.monotonic()
                         self.subworkers[subworker_id] = {
                             "address": subworker_address,
+                            "priority_addresses": priority_addresses(subworker_address),
                             "status": status,
-                            "last_seen": datetime.now(),
+                            "last_seen_mono": now_mono,
                             "load": 0,
-                            "registered_at": datetime.now(),
+                            "registered_at": now,
+                            "registered_mono": now_mono,
                         }
+                        self._index_subworker_load(subworker_id)
+                        self._index_last_seen(subworker_id, now_mono)
                         logger.info(f"Registered subworker: {subworker_id} at {subworker_address}")
 
                     # Send acknowledgment
                     ack = {"status": "registered", "subworker_id": subworker_id}
-                    ack_data = TaskSerializer.serialize(ack, self.serialization_format)
+                    ack_data = self._serialize(ack)
                     await self.subworker_registry.send(ack_data)
 
             except Exception as e:
-                logger.error(f"Error handling subworker registration: {e}")
+                if self.running:
+                    logger.error(f"Error handling subworker registration: {e}")
 
     async def _handle_result_queries(self):
         """Handle result queries and cancel requests from clients."""
         while self.running:
             try:
                 data = await self.result_query_server.recv()
-                query = TaskSerializer.deserialize(data, self.serialization_format)
+                query = self._deserialize(data)
 
-                action = query.get("action", "query")
                 task_id = query.get("task_id")
 
                 if not task_id:
-                    response = {"error": "Missing task_id"}
-                    response_data = TaskSerializer.serialize(response, self.serialization_format)
-                    await self.result_query_server.send(response_data)
-                    continue
-
-                if action == "cancel":
+                    response_data = self._serialize({"error": "Missing task_id"})
+                elif query.get("action") == "cancel":
                     cancelled = await self._handle_cancel(task_id)
-                    response = {"cancelled": cancelled, "task_id": task_id}
-                    response_data = TaskSerializer.serialize(response, self.serialization_format)
-                    await self.result_query_server.send(response_data)
-                    continue
-
-                # Default: result query
-                result = self._get_result(task_id)
-
-                if result:
-                    response = {"found": True, "result": result.model_dump()}
-                    logger.debug(f"Returned result for task {task_id} to query")
+                    response_data = self._serialize({"cancelled": cancelled, "task_id": task_id})
                 else:
-                    response = {
-                        "found": False,
-                        "error": f"Task {task_id} not found in cache or expired",
-                    }
-                    logger.debug(f"Result for task {task_id} not found in cache")
+                    # Default: result query
+                    response_data = self._result_query_response(task_id)
 
-                response_data = TaskSerializer.serialize(response, self.serialization_format)
                 await self.result_query_server.send(response_data)
 
             except Exception as e:
-                logger.error(f"Error handling result query: {e}")
+                if self.running:
+                    logger.error(f"Error handling result query: {e}")
+
+    def _result_query_response(self, task_id: str) -> bytes:
+        """Serialized reply to a result query for ``task_id``."""
+        cache_entry = self._get_cache_entry(task_id)
+
+        if cache_entry is None:
+            logger.debug("Result for task %s not found in cache", task_id)
+            return self._serialize(
+                {"found": False, "error": f"Task {task_id} not found in cache or expired"}
+            )
+
+        # Results are immutable once cached, so the serialized response is
+        # built on the first query and reused for repeated polls
+        response_data = cache_entry.get("response")
+        if response_data is None:
+            response = {"found": True, "result": cache_entry["result"].model_dump()}
+            response_data = cache_entry["response"] = self._serialize(response)
+        logger.debug("Returned result for task %s to query", task_id)
+        return response_data
 
     async def _handle_cancel(self, task_id: str) -> bool:
         """Cancel a task: remove from queues, signal workers, or mark in-flight."""
         # Check queued tasks by priority
-        for priority in TaskPriority:
-            queue = self.task_queue[priority]
-            new_queue = deque(t for t in queue if t.id != task_id)
-            if len(new_queue) != len(queue):
-                self.task_queue[priority] = new_queue
+        for priority, queue in zip(PRIORITY_ORDER, self._task_queues, strict=True):
+            index = next((i for i, t in enumerate(queue) if t.id == task_id), None)
+            if index is not None:
+                # Remove in place - _task_queues shares these deque objects
+                del queue[index]
                 self._store_cancel_result(task_id)
                 logger.info(f"Task {task_id} cancelled from {priority} queue")
                 return True
@@ -458,21 +505,31 @@ class ControlPlaneWorker(Worker):
 
     async def _process_tasks(self, respondent, priority: TaskPriority):
         """Process tasks for a specific priority - decoupled recv/process to avoid blocking."""
-        while self.lifecycle.state == WorkerState.RUNNING:
+        # Resolve the per-message callables once for the lifetime of the loop
+        lifecycle = self.lifecycle
+        recv_request = respondent.recv_request
+        deserialize = self._deserialize
+
+        while lifecycle.state == WorkerState.RUNNING:
+            reply = None
             try:
-                # Receive task
-                data = await respondent.recv()
-                task_data = TaskSerializer.deserialize(data, self.serialization_format)
+                # Receive task on its own context, so the next request can be taken
+                # while this one is processed and each result reaches its sender
+                data, reply = await recv_request()
+                task_data = deserialize(data)
 
                 # Check for batch submission
                 if isinstance(task_data, dict) and task_data.get("action") == "batch_submit":
-                    await self._handle_batch_submit(task_data["tasks"], respondent, priority)
+                    await self._handle_batch_submit(task_data["tasks"], reply, priority)
                     continue
 
-                task = Task(**task_data)
+                task = Task.model_validate(task_data)
                 logger.info(
-                    f"Control plane {self.worker_id} received {priority} task "
-                    f"{task.id} ({task.name})"
+                    "Control plane %s received %s task %s (%s)",
+                    self.worker_id,
+                    priority,
+                    task.id,
+                    task.name,
                 )
 
                 # Create cancel event and add to tracking
@@ -491,16 +548,26 @@ class ControlPlaneWorker(Worker):
 
                 # Spawn as tracked task to avoid blocking the recv loop
                 exec_task = asyncio.create_task(
-                    self._process_and_respond(task, respondent, priority)
+                    # The received bytes are forwarded as-is if the task goes to a
+                    # subworker; only when the client set the ID, so both sides agree on it
+                    self._process_and_respond(
+                        task, reply, priority, data if "id" in task_data else None
+                    )
                 )
                 self._active_tasks.add(exec_task)
                 exec_task.add_done_callback(lambda t, tid=task.id: self._cleanup_task(tid))
 
             except Exception as e:
+                # The request will never be answered; release its context
+                if reply is not None:
+                    reply.close()
                 if self.lifecycle.state == WorkerState.RUNNING:
+                    # Per-message path: only format the traceback when debugging
                     logger.error(
-                        f"Error in task processing loop for {priority}: {e}",
-                        exc_info=True,
+                        "Error in task processing loop for %s: %s",
+                        priority,
+                        e,
+                        exc_info=logger.isEnabledFor(logging.DEBUG),
                     )
 
     def _cleanup_task(self, task_id: str):
@@ -514,12 +581,13 @@ class ControlPlaneWorker(Worker):
         """Handle a batch task submission — create all tasks atomically."""
         task_ids = []
         for td in task_dicts:
-            task = Task(**td)
+            task = Task.model_validate(td)
             task_ids.append(task.id)
             cancel_event = asyncio.Event()
             self._cancel_events[task.id] = cancel_event
             self.active_tasks[task.id] = task
-            exec_task = asyncio.create_task(self._process_and_respond(task, respondent, priority))
+            # The batch ack is the only reply; results are fetched through result queries
+            exec_task = asyncio.create_task(self._process_and_respond(task, _NO_REPLY, priority))
             self._active_tasks.add(exec_task)
             exec_task.add_done_callback(lambda t, tid=task.id: self._cleanup_task(tid))
 
@@ -528,14 +596,21 @@ class ControlPlaneWorker(Worker):
         )
 
         # Send acknowledgment back to client
-        ack = TaskSerializer.serialize(
-            {"batch_accepted": True, "task_ids": task_ids},
-            self.serialization_format,
-        )
+        ack = self._serialize({"batch_accepted": True, "task_ids": task_ids})
         await respondent.send(ack)
 
-    async def _process_and_respond(self, task: Task, respondent, priority: TaskPriority):
-        """Process a single task and send the result back to the client."""
+    async def _process_and_respond(
+        self,
+        task: Task,
+        respondent,
+        priority: TaskPriority,
+        task_bytes: Optional[bytes] = None,
+    ):
+        """Process a single task and send the result back to the client.
+
+        ``task_bytes`` is the task as received from the client, if it can be
+        forwarded to a subworker without re-serializing.
+        """
         # Check if task has a future ETA — schedule it
         if task.eta and task.eta > datetime.now():
             import heapq
@@ -545,6 +620,8 @@ class ControlPlaneWorker(Worker):
                 f"Task {task.id} scheduled for {task.eta.isoformat()} "
                 f"(in {(task.eta - datetime.now()).total_seconds():.1f}s)"
             )
+            # The result is delivered through result queries once the task runs
+            respondent.close()
             return
 
         # Attach cancel event to the task object for the worker to check
@@ -561,14 +638,15 @@ class ControlPlaneWorker(Worker):
         try:
             subworker = self._select_subworker(priority)
 
-            if subworker:
-                await self._send_task_to_subworker(task, subworker, respondent)
-            else:
+            # A failed dispatch falls back to running the task here, so the client is
+            # still answered on its own request
+            if not (
+                subworker
+                and await self._send_task_to_subworker(task, subworker, respondent, task_bytes)
+            ):
                 result = await self._execute_task(task)
                 self._store_result(result)
-                result_data = TaskSerializer.serialize(
-                    result.model_dump(), self.serialization_format
-                )
+                result_data = self._serialize_model(result)
                 await respondent.send(result_data)
                 logger.info(f"Control plane sent result for task {task.id}")
 
@@ -601,9 +679,7 @@ class ControlPlaneWorker(Worker):
                 },
             )
             try:
-                error_data = TaskSerializer.serialize(
-                    error_result.model_dump(), self.serialization_format
-                )
+                error_data = self._serialize_model(error_result)
                 await respondent.send(error_data)
             except Exception as send_error:
                 logger.error(f"Failed to send error for task {task.id}: {send_error}")
@@ -666,7 +742,7 @@ class ControlPlaneWorker(Worker):
                         # Execute and reschedule
                         asyncio.create_task(self._execute_periodic(task, task_name, meta, now))
                     else:
-                        self.task_queue[task.priority].append(task)
+                        self._enqueue_task(task)
 
             except Exception as e:
                 logger.error(f"Error processing scheduled tasks: {e}")
@@ -791,15 +867,12 @@ class ControlPlaneWorker(Worker):
         """Distribute queued tasks to subworkers or process locally."""
         while self.running:
             try:
-                # Check each priority queue
-                for priority in [
-                    TaskPriority.CRITICAL,
-                    TaskPriority.HIGH,
-                    TaskPriority.NORMAL,
-                    TaskPriority.LOW,
-                ]:
-                    if self.task_queue[priority]:
-                        task = self.task_queue[priority].popleft()
+                # Drain the queues in priority order, up to a batch per pass
+                dispatched = 0
+                for priority, queue in zip(PRIORITY_ORDER, self._task_queues, strict=True):
+                    while queue and dispatched < MAX_DISPATCH_BATCH:
+                        task = queue.popleft()
+                        dispatched += 1
 
                         # Decide: process locally or distribute to subworker
                         subworker = self._select_subworker(priority)
@@ -812,105 +885,268 @@ class ControlPlaneWorker(Worker):
                             # Process locally (control plane acts as worker)
                             asyncio.create_task(self._execute_task(task))
 
-                await asyncio.sleep(0.1)  # Small delay to avoid busy waiting
+                if dispatched >= MAX_DISPATCH_BATCH:
+                    await asyncio.sleep(0)  # More work queued - just let other tasks run
+                    continue
+
+                # Queues are empty: wait for the next enqueue instead of polling. The timeout
+                # also picks up tasks appended to task_queue without going through
+                # _enqueue_task and rechecks self.running.
+                self._queue_event.clear()
+                if not any(self._task_queues):
+                    try:
+                        await asyncio.wait_for(self._queue_event.wait(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        pass
 
             except Exception as e:
                 logger.error(f"Error distributing tasks: {e}")
                 await asyncio.sleep(0.1)
 
+    def _enqueue_task(self, task: Task, front: bool = False):
+        """Queue a task for the distributor and wake it up."""
+        if front:
+            self.task_queue[task.priority].appendleft(task)
+        else:
+            self.task_queue[task.priority].append(task)
+        self._queue_event.set()
+
     def _select_subworker(self, priority: TaskPriority) -> Optional[str]:
         """Select best subworker for a task based on load and priority."""
-        # Filter active subworkers
-        active_subworkers = {
-            sid: info for sid, info in self.subworkers.items() if info["status"] == "active"
-        }
-
-        if not active_subworkers:
-            return None
-
-        # Select subworker with lowest load
-        best_subworker = min(active_subworkers.items(), key=lambda x: x[1]["load"])
-        return best_subworker[0] if best_subworker else None
-
-    async def _send_task_to_subworker(self, task: Task, subworker_id: str, original_respondent):
-        """Send a task to a subworker and forward the result back."""
-        try:
-            subworker_info = self.subworkers[subworker_id]
-            subworker_address = subworker_info["address"]
-
-            # Parse address and create connection
-            parsed = urlparse(subworker_address)
-            host = parsed.hostname or "127.0.0.1"
-            base_port = parsed.port or 5555
-            scheme = parsed.scheme or "tcp"
-
-            priority_ports = {
-                "critical": base_port,
-                "high": base_port + 1,
-                "normal": base_port + 2,
-                "low": base_port + 3,
-            }
+        heap = self._load_heap
+        if len(self._load_seq) != len(self.subworkers):
+            self._sync_load_index()
+
+        while heap:
+            key, seq, subworker_id = heap[0]
+            info = self.subworkers.get(subworker_id)
+            if info is None or self._load_seq.get(subworker_id) != seq:
+                # Superseded entry or removed subworker
+                heapq.heappop(heap)
+                if info is None and self._load_seq.get(subworker_id) == seq:
+                    del self._load_seq[subworker_id]
+                continue
 
-            priority_address = f"{scheme}://{host}:{priority_ports[task.priority.value]}"
+            current = self._load_key(info)
+            if current != key:
+                # Load or status changed without going through the index - refresh it
+                seq = next(self._load_counter)
+                heapq.heapreplace(heap, (current, seq, subworker_id))
+                self._load_seq[subworker_id] = seq
+                self._track_active(subworker_id, info)
+                continue
 
-            # Create requester to send task
-            requester = ReqRepPattern(priority_address, is_server=False)
+            # Select subworker with lowest load; infinity means none are active
+            return subworker_id if key != float("inf") else None
+
+        return None
+
+    @staticmethod
+    def _load_key(info: Dict) -> float:
+        """Heap key for a subworker: its load when active, infinity otherwise."""
+        return info["load"] if info["status"] == "active" else float("inf")
+
+    def _track_active(self, subworker_id: str, info: Dict):
+        """Add or remove a subworker from the active set according to its status."""
+        if info["status"] == "active":
+            self._active_subworkers.add(subworker_id)
+        else:
+            self._active_subworkers.discard(subworker_id)
+
+    def _index_subworker_load(self, subworker_id: str):
+        """Push a subworker's current load onto the heap, superseding older entries."""
+        info = self.subworkers[subworker_id]
+        seq = next(self._load_counter)
+        self._load_seq[subworker_id] = seq
+        heapq.heappush(self._load_heap, (self._load_key(info), seq, subworker_id))
+        self._track_active(subworker_id, info)
+
+        # Stale entries are only dropped when they reach the top; rebuild if they pile up
+        if len(self._load_heap) > 2 * len(self.subworkers) + 64:
+            self._rebuild_load_index()
+
+    def _sync_load_index(self):
+        """Index subworkers added or removed without going through the index helpers."""
+        for subworker_id in [sid for sid in self._load_seq if sid not in self.subworkers]:
+            del self._load_seq[subworker_id]
+            self._active_subworkers.discard(subworker_id)
+        for subworker_id in self.subworkers:
+            if subworker_id not in self._load_seq:
+                self._index_subworker_load(subworker_id)
+
+    def _rebuild_load_index(self):
+        """Rebuild the load heap from scratch, dropping all stale entries."""
+        self._load_heap = []
+        self._load_seq = {}
+        self._active_subworkers = set()
+        for subworker_id, info in self.subworkers.items():
+            seq = next(self._load_counter)
+            self._load_seq[subworker_id] = seq
+            self._load_heap.append((self._load_key(info), seq, subworker_id))
+            self._track_active(subworker_id, info)
+        heapq.heapify(self._load_heap)
+
+    @staticmethod
+    def _last_seen_mono(info: Dict) -> float:
+        """Monotonic time a subworker was last heard from."""
+        if "last_seen_mono" in info:
+            return info["last_seen_mono"]
+        return time.monotonic() - (datetime.now() - info["last_seen"]).total_seconds()
+
+    def _index_last_seen(self, subworker_id: str, last_seen_mono: float):
+        """Record a heartbeat in the staleness index."""
+        heapq.heappush(self._last_seen_heap, (last_seen_mono, subworker_id))
+        self._last_seen_indexed.add(subworker_id)
+
+    def _pop_stale_subworkers(self, cutoff: float) -> list[str]:
+        """Pop heartbeats older than ``cutoff`` and return the subworkers that went stale.
+
+        Only the oldest heap entries are examined, so a pass costs O(k log n) for k
+        expired heartbeats instead of a scan over every subworker. An expired entry
+        is ignored if the subworker has been heard from since (a newer entry is
+        already queued), was removed, or is already inactive.
+        """
+        if len(self._last_seen_indexed) != len(self.subworkers):
+            self._rebuild_last_seen_index()
+
+        heap = self._last_seen_heap
+        stale = []
+        while heap and heap[0][0] < cutoff:
+            _, subworker_id = heapq.heappop(heap)
+            info = self.subworkers.get(subworker_id)
+            if info is None or info["status"] == "inactive":
+                continue
+            if self._last_seen_mono(info) < cutoff:
+                stale.append(subworker_id)
+        return stale
+
+    def _rebuild_last_seen_index(self):
+        """Index subworkers added or removed without going through the registry handler."""
+        self._last_seen_heap = [
+            (self._last_seen_mono(info), subworker_id)
+            for subworker_id, info in self.subworkers.items()
+        ]
+        heapq.heapify(self._last_seen_heap)
+        self._last_seen_indexed = set(self.subworkers)
+
+    def _adjust_subworker_load(self, subworker_id: str, delta: int):
+        """Change a subworker's load (never below zero) and update the load index."""
+        info = self.subworkers[subworker_id]
+        info["load"] = max(0, info["load"] + delta)
+        self._index_subworker_load(subworker_id)
+
+    async def _get_subworker_requester(self, subworker_id: str, priority: str) -> ReqRepPattern:
+        """Return the cached requester for a subworker priority port, connecting on first use."""
+        key = (subworker_id, priority)
+        requester = self._subworker_requesters.get(key)
+        if requester is None:
+            info = self.subworkers[subworker_id]
+            addresses = info.get("priority_addresses")
+            if addresses is None:
+                # Entry was not created by the registration handler
+                addresses = info["priority_addresses"] = priority_addresses(info["address"])
+
+            requester = ReqRepPattern(addresses[priority], is_server=False)
             await requester.start()
+            self._subworker_requesters[key] = requester
+        return requester
 
-            try:
-                # Send task
-                task_data = TaskSerializer.serialize(task.model_dump(), self.serialization_format)
-                await requester.send(task_data)
+    def _close_subworker_requesters(self, subworker_id: Optional[str] = None):
+        """Close cached requesters for one subworker, or for all when no ID is given.
 
-                # Update subworker load
-                self.subworkers[subworker_id]["load"] += 1
+        For a single subworker, requesters with exchanges in flight are only dropped
+        from the cache and closed when their last exchange ends.
+        """
+        for key in list(self._subworker_requesters):
+            if subworker_id is None or key[0] == subworker_id:
+                requester = self._subworker_requesters.pop(key)
+                if subworker_id is None or not self._requester_in_flight.get(requester):
+                    requester.close()
+
+    def _release_subworker_requester(self, key: Tuple[str, str], requester: ReqRepPattern):
+        """End one exchange on a requester, closing it if it was dropped and is now idle."""
+        remaining = self._requester_in_flight[requester] - 1
+        if remaining:
+            self._requester_in_flight[requester] = remaining
+            return
+        del self._requester_in_flight[requester]
+        if self._subworker_requesters.get(key) is not requester:
+            requester.close()
 
-                # Receive result
-                result_data = await requester.recv()
-                result_dict = TaskSerializer.deserialize(result_data, self.serialization_format)
-                result = TaskResult(**result_dict)
+    async def _send_task_to_subworker(
+        self,
+        task: Task,
+        subworker_id: str,
+        original_respondent,
+        task_bytes: Optional[bytes] = None,
+    ) -> bool:
+        """Send a task to a subworker and forward the result back.
+
+        ``task_bytes`` is sent instead of re-serializing ``task`` when given.
+        Returns False, without replying, when the subworker did not produce a
+        result; the caller then still owns ``original_respondent``.
+        """
+        # Count the task against the subworker before the first await, so tasks
+        # dispatched meanwhile see the load and spread to other subworkers
+        self._adjust_subworker_load(subworker_id, 1)
+        key = (subworker_id, task.priority.value)
+        requester = None
+        try:
+            requester = await self._get_subworker_requester(*key)
+            self._requester_in_flight[requester] = self._requester_in_flight.get(requester, 0) + 1
 
-                # Store result in cache
-                self._store_result(result)
+            if task_bytes is None:
+                task_bytes = self._serialize_model(task)
 
-                # Update subworker load
-                self.subworkers[subworker_id]["load"] = max(
-                    0, self.subworkers[subworker_id]["load"] - 1
-                )
+            # A hung subworker must not hold the client's request forever
+            reply_timeout = (task.timeout or self.task_timeout) + SUBWORKER_REPLY_GRACE
+            result_data = await asyncio.wait_for(
+                requester.request(task_bytes), timeout=reply_timeout
+            )
+            result = self._decode_result(result_data)
 
-                # Forward result back to original client
-                await original_respondent.send(result_data)
+        except Exception as e:
+            logger.error(f"Error sending task to subworker {subworker_id}: {e}")
+            # A timeout only abandons this exchange's context. A failed connection is
+            # dropped so the next task reconnects; it closes once its last exchange ends.
+            if (
+                isinstance(e, pynng.NNGException)
+                and self._subworker_requesters.get(key) is requester
+            ):
+                del self._subworker_requesters[key]
+            return False
 
-                logger.info(f"Task {task.id} completed by subworker {subworker_id}")
+        finally:
+            if requester is not None:
+                self._release_subworker_requester(key, requester)
+            self._adjust_subworker_load(subworker_id, -1)
 
-            except Exception as e:
-                logger.error(f"Error sending task to subworker {subworker_id}: {e}")
-                # Update subworker load
-                self.subworkers[subworker_id]["load"] = max(
-                    0, self.subworkers[subworker_id]["load"] - 1
-                )
-                # Re-queue task or process locally
-                self.task_queue[task.priority].appendleft(task)
-                requester.close()
+        # Store result in cache
+        self._store_result(result)
 
+        # Forward result back to original client; the cached result stands either way
+        try:
+            await original_respondent.send(result_data)
         except Exception as e:
-            logger.error(f"Error in _send_task_to_subworker: {e}")
-            # Re-queue task
-            self.task_queue[task.priority].appendleft(task)
+            logger.error(f"Failed to forward result for task {task.id}: {e}")
+            return True
+
+        logger.info(f"Task {task.id} completed by subworker {subworker_id}")
+        return True
 
     async def _monitor_subworkers(self):
         """Monitor subworker health and status."""
         while self.running:
             try:
-                current_time = datetime.now()
+                now_mono = time.monotonic()
                 # Check for stale subworkers (haven't been seen in 30 seconds)
                 stale_threshold = 30.0
 
-                for subworker_id, info in list(self.subworkers.items()):
-                    time_since_seen = (current_time - info["last_seen"]).total_seconds()
-                    if time_since_seen > stale_threshold:
-                        logger.warning(f"Subworker {subworker_id} appears stale, marking inactive")
-                        info["status"] = "inactive"
+                for subworker_id in self._pop_stale_subworkers(now_mono - stale_threshold):
+                    logger.warning(f"Subworker {subworker_id} appears stale, marking inactive")
+                    self.subworkers[subworker_id]["status"] = "inactive"
+                    self._index_subworker_load(subworker_id)
+                    self._close_subworker_requesters(subworker_id)
 
                 await asyncio.sleep(5.0)  # Check every 5 seconds
 
@@ -922,49 +1158,63 @@ class ControlPlaneWorker(Worker):
         """Store a task result in the cache with LRU eviction."""
         task_id = result.task_id
         now = datetime.now()
+        now_mono = time.monotonic()
+
+        cache = self.result_cache
 
         # Remove old entry if it exists (to update access time)
-        if task_id in self.result_cache:
-            del self.result_cache[task_id]
+        cache.pop(task_id, None)
+
+        # A full cache drops expired results before evicting live ones; this only
+        # visits the expired front of the expiry queue
+        if len(cache) >= self.result_cache_max_size:
+            self._expire_results(now_mono)
 
         # Check if we need to evict (LRU - remove oldest accessed)
-        while len(self.result_cache) >= self.result_cache_max_size:
-            # Remove least recently accessed (first item in OrderedDict)
-            oldest_task_id = next(iter(self.result_cache))
-            del self.result_cache[oldest_task_id]
-            logger.debug(f"Evicted result for task {oldest_task_id} due to cache size limit")
-
-        # Store new result
-        self.result_cache[task_id] = {
+        while len(cache) >= self.result_cache_max_size:
+            # Remove least recently accessed (first item in OrderedDict) in a single
+            # C-level call rather than iterating to it and deleting by key
+            oldest_task_id, _ = cache.popitem(last=False)
+            logger.debug("Evicted result for task %s due to cache size limit", oldest_task_id)
+
+        # Store new result; TTL checks use the monotonic clock, stored_at is for display
+        cache[task_id] = {
             "result": result,
             "stored_at": now,
-            "last_accessed": now,
+            "stored_mono": now_mono,
+            "accessed_mono": now_mono,
         }
-        logger.debug(
-            f"Stored result for task {task_id} in cache (cache size: {len(self.result_cache)})"
-        )
+        self._expiry_queue.append((now_mono, task_id))
+        if len(self._expiry_queue) > 2 * self.result_cache_max_size:
+            self._compact_expiry_queue()
+        logger.debug("Stored result for task %s in cache (cache size: %d)", task_id, len(cache))
 
     def _get_result(self, task_id: str) -> Optional[TaskResult]:
         """Get a task result from cache, updating access time."""
-        if task_id not in self.result_cache:
-            return None
+        cache_entry = self._get_cache_entry(task_id)
+        return cache_entry["result"] if cache_entry else None
 
-        cache_entry = self.result_cache[task_id]
+    def _get_cache_entry(self, task_id: str) -> Optional[Dict]:
+        """Get a live result cache entry, updating access time and LRU order."""
+        cache_entry = self.result_cache.get(task_id)
+        if cache_entry is None:
+            return None
 
         # Check expiration
-        age = (datetime.now() - cache_entry["stored_at"]).total_seconds()
+        now_mono = time.monotonic()
+        age = now_mono - cache_entry["stored_mono"]
         if age > self.result_cache_ttl_seconds:
             # Expired - remove it
             del self.result_cache[task_id]
-            logger.debug(f"Result for task {task_id} expired (age: {age}s)")
+            logger.debug("Result for task %s expired (age: %ss)", task_id, age)
             return None
 
         # Update last accessed time and move to end (LRU)
-        cache_entry["last_accessed"] = datetime.now()
+        cache_entry["accessed_mono"] = now_mono
         # Move to end of OrderedDict (most recently accessed)
         self.result_cache.move_to_end(task_id)
 
-        return cache_entry["result"]
+        return cache_entry
 
     async def _cleanup_result_cache(self):
         """Periodically clean up expired results from cache."""
@@ -972,25 +1222,38 @@ class ControlPlaneWorker(Worker):
             try:
                 await asyncio.sleep(60.0)  # Check every minute
 
-                now = datetime.now()
-                expired_tasks = []
-
-                for task_id, cache_entry in list(self.result_cache.items()):
-                    age = (now - cache_entry["stored_at"]).total_seconds()
-                    if age > self.result_cache_ttl_seconds:
-                        expired_tasks.append(task_id)
-
-                # Remove expired entries
-                for task_id in expired_tasks:
-                    del self.result_cache[task_id]
+                expired = self._expire_results(time.monotonic())
 
-                if expired_tasks:
-                    logger.info(f"Cleaned up {len(expired_tasks)} expired results from cache")
+                if expired:
+                    logger.info(f"Cleaned up {expired} expired results from cache")
                     logger.debug(f"Cache size after cleanup: {len(self.result_cache)}")
 
             except Exception as e:
                 logger.error(f"Error cleaning up result cache: {e}")
 
+    def _expire_results(self, now_mono: float) -> int:
+        """Drop results older than the TTL, oldest first; returns how many were removed.
+
+        Only the expired front of the expiry queue is visited, so a pass where nothing
+        has expired costs O(1) instead of a scan over the whole cache.
+        """
+        expired = 0
+        queue = self._expiry_queue
+        while queue and now_mono - queue[0][0] > self.result_cache_ttl_seconds:
+            stored_mono, task_id = queue.popleft()
+            cache_entry = self.result_cache.get(task_id)
+            # Skip results that were evicted or stored again since this entry was queued
+            if cache_entry is not None and cache_entry["stored_mono"] == stored_mono:
+                del self.result_cache[task_id]
+                expired += 1
+        return expired
+
+    def _compact_expiry_queue(self):
+        """Rebuild the expiry queue from the live cache entries, dropping stale ones."""
+        self._expiry_queue = deque(
+            sorted((entry["stored_mono"], task_id) for task_id, entry in self.result_cache.items())
+        )
+
     def stop(self):
         """Stop the control plane worker — called after drain in start()."""
         logger.info(f"Stopping control plane worker {self.worker_id}")
@@ -999,30 +1262,37 @@ class ControlPlaneWorker(Worker):
             self._management_server.stop()
             self._management_server = None
 
+        Worker._instances.discard(self)
         self.shutdown_event.set()
+        unregister_queue_size_sources(self.worker_id)
         if hasattr(self, "subworker_registry"):
             self.subworker_registry.close()
         if hasattr(self, "result_query_server"):
             self.result_query_server.close()
+        self._close_subworker_requesters()
 
         self._close_sockets()
 
+    def active_subworker_count(self) -> int:
+        """Number of active subworkers, read from the load index instead of a scan."""
+        if len(self._load_seq) != len(self.subworkers):
+            self._sync_load_index()
+        return len(self._active_subworkers)
+
     def get_subworker_status(self) -> Dict:
         """Get status of all subworkers."""
         return {
             "total_subworkers": len(self.subworkers),
-            "active_subworkers": len(
-                [s for s in self.subworkers.values() if s["status"] == "active"]
-            ),
+            "active_subworkers": self.active_subworker_count(),
             "subworkers": {
                 sid: {
                     "address": info["address"],
                     "status": info["status"],
                     "load": info["load"],
                     "last_seen": (
-                        info["last_seen"].isoformat()
-                        if isinstance(info["last_seen"], datetime)
-                        else str(info["last_seen"])
+                        last_seen.isoformat()
+                        if isinstance(last_seen := subworker_last_seen(info), datetime)
+                        else str(last_seen)
                     ),
                 }
                 for sid, info in self.subworkers.items()
@@ -3,17 +3,22 @@
 import asyncio
 import logging
 import os
-import signal
 from typing import Optional
-from urllib.parse import urlparse
 
 from fastworker.patterns.nng_patterns import BusPattern, ReqRepPattern
-from fastworker.tasks.models import TaskPriority
-from fastworker.tasks.serializer import SerializationFormat, TaskSerializer
+from fastworker.tasks.serializer import SerializationFormat
+from fastworker.utils.addresses import MANAGEMENT_PORT_OFFSET, offset_address
 from fastworker.workers.worker import Worker
 
 logger = logging.getLogger(__name__)
 
+# Seconds between heartbeats while registered, and how long to wait for each ack
+HEARTBEAT_INTERVAL = 10.0
+HEARTBEAT_ACK_TIMEOUT = 1.0
+# Retry delays for re-registration after the control plane stops answering
+REREGISTER_MIN_BACKOFF = 1.0
+REREGISTER_MAX_BACKOFF = 30.0
+
 
 class SubWorker(Worker):
     """Subworker that registers with control plane and processes tasks.
@@ -23,7 +28,7 @@ class SubWorker(Worker):
     - FASTWORKER_CONTROL_PLANE_ADDRESS: Control plane address (required)
     - FASTWORKER_BASE_ADDRESS: Base address (default: tcp://127.0.0.1:5555)
     - FASTWORKER_DISCOVERY_ADDRESS: Discovery address (default: tcp://..:5550)
-    - FASTWORKER_SERIALIZATION_FORMAT: Serialization format (JSON or PICKLE)
+    - FASTWORKER_SERIALIZATION_FORMAT: Serialization format (JSON, PICKLE or MSGPACK)
     """
 
     def __init__(
@@ -59,10 +64,7 @@ class SubWorker(Worker):
 
         # Parse serialization format from string if needed
         if serialization_format is None:
-            format_str = os.getenv("FASTWORKER_SERIALIZATION_FORMAT", "JSON").upper()
-            serialization_format = (
-                SerializationFormat.PICKLE if format_str == "PICKLE" else SerializationFormat.JSON
-            )
+            serialization_format = SerializationFormat.from_env()
         if concurrency is None:
             concurrency = int(os.getenv("FASTWORKER_WORKER_CONCURRENCY", "1"))
 
@@ -74,72 +76,49 @@ class SubWorker(Worker):
             concurrency=concurrency,
         )
 
-        # Override discovery bus - subworkers should DIAL, not LISTEN
-        # Only the control plane listens on the discovery bus
+        # Subworkers find the control plane through registration and never join the
+        # discovery bus. This is an unstarted placeholder (it never opens a socket) that
+        # replaces the base class's listening bus, so the inherited close() is a no-op.
         self.discovery_bus = BusPattern(discovery_address, listen=False)
 
-        # Override patterns to use ReqRepPattern instead of SurveyorRespondentPattern.
-        # Control plane uses ReqRepPattern to send tasks, so subworker must match.
-        parsed = urlparse(base_address)
-        host = parsed.hostname or "127.0.0.1"
-        base_port = parsed.port or 5555
-        scheme = parsed.scheme or "tcp"
-
-        priority_ports = {
-            "critical": base_port,
-            "high": base_port + 1,
-            "normal": base_port + 2,
-            "low": base_port + 3,
-        }
-
-        # Replace SurveyorRespondentPattern with ReqRepPattern (is_server=True means listen)
-        self.critical_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['critical']}", is_server=True
-        )
-        self.high_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['high']}", is_server=True
-        )
-        self.normal_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['normal']}", is_server=True
-        )
-        self.low_respondent = ReqRepPattern(
-            f"{scheme}://{host}:{priority_ports['low']}", is_server=True
-        )
-
         self.control_plane_address = control_plane_address
         self.registered = False
 
-        # Parse control plane address to get management port
-        parsed_cp = urlparse(control_plane_address)
-        host_cp = parsed_cp.hostname or "127.0.0.1"
-        scheme_cp = parsed_cp.scheme or "tcp"
         # Assume control plane management port is base_port + 5 (5560)
-        base_port_cp = parsed_cp.port or 5555
-        management_port = base_port_cp + 5
-
         self.control_plane_registry = ReqRepPattern(
-            f"{scheme_cp}://{host_cp}:{management_port}", is_server=False
+            offset_address(control_plane_address, MANAGEMENT_PORT_OFFSET), is_server=False
         )
 
+        # Registration and heartbeat payloads never change, so encode them once
+        registration = {
+            "subworker_id": self.worker_id,
+            "address": self.base_address,
+            "status": "active",
+        }
+        self._registration_frame = self._serialize(registration)
+        self._heartbeat_frame = self._serialize({**registration, "heartbeat": True})
+
+    def _create_respondent(self, address: str):
+        """Control plane uses ReqRepPattern to send tasks, so subworker must match."""
+        return ReqRepPattern(address, is_server=True)
+
     async def start(self):
         """Start the subworker and register with control plane."""
         logger.info(f"Starting subworker {self.worker_id}")
 
-        # Set up signal handlers
-        loop = asyncio.get_running_loop()
-        for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, self._signal_handler, sig)
+        # Transition INIT → STARTING
+        if not await self.lifecycle.start():
+            logger.error(f"Subworker {self.worker_id} failed to transition from INIT")
+            return
 
-        # Start service discovery bus
-        await self.discovery_bus.start()
+        # Set up signal handlers
+        self._install_signal_handlers()
 
         # Start all respondents (for receiving tasks from control plane)
-        await self.critical_respondent.start()
-        await self.high_respondent.start()
-        await self.normal_respondent.start()
-        await self.low_respondent.start()
+        await self._start_respondents()
 
-        self.running = True
+        # Transition STARTING → RUNNING
+        await self.lifecycle.ready()
 
         # Register with control plane
         await self._register_with_control_plane()
@@ -150,14 +129,7 @@ class SubWorker(Worker):
         logger.info(f"Subworker {self.worker_id} started and registered")
 
         # Start processing tasks for each priority
-        tasks = [
-            asyncio.create_task(
-                self._process_tasks(self.critical_respondent, TaskPriority.CRITICAL)
-            ),
-            asyncio.create_task(self._process_tasks(self.high_respondent, TaskPriority.HIGH)),
-            asyncio.create_task(self._process_tasks(self.normal_respondent, TaskPriority.NORMAL)),
-            asyncio.create_task(self._process_tasks(self.low_respondent, TaskPriority.LOW)),
-        ]
+        tasks = self._spawn_task_processors()
 
         # Wait for shutdown
         await self.shutdown_event.wait()
@@ -167,24 +139,20 @@ class SubWorker(Worker):
             task.cancel()
 
         self.stop()
+        await self._do_force_stop()
 
     async def _register_with_control_plane(self):
         """Register this subworker with the control plane."""
         try:
-            await self.control_plane_registry.start()
-
-            registration = {
-                "subworker_id": self.worker_id,
-                "address": self.base_address,
-                "status": "active",
-            }
+            # Dial once; retries reuse the socket, which nng reconnects on its own
+            if self.control_plane_registry.socket is None:
+                await self.control_plane_registry.start()
 
-            registration_data = TaskSerializer.serialize(registration, self.serialization_format)
-            await self.control_plane_registry.send(registration_data)
+            await self.control_plane_registry.send(self._registration_frame)
 
             # Wait for acknowledgment
             ack_data = await asyncio.wait_for(self.control_plane_registry.recv(), timeout=5.0)
-            ack = TaskSerializer.deserialize(ack_data, self.serialization_format)
+            ack = self._deserialize(ack_data)
 
             if ack.get("status") == "registered":
                 self.registered = True
@@ -200,40 +168,52 @@ class SubWorker(Worker):
             self.registered = False
 
     async def _periodic_reregistration(self):
-        """Periodically re-register with control plane to maintain connection."""
+        """Heartbeat the control plane, re-registering whenever it stops acknowledging.
+
+        While registered, a heartbeat goes out every HEARTBEAT_INTERVAL seconds. Once a
+        heartbeat or registration fails, registration is retried after a delay that
+        starts at REREGISTER_MIN_BACKOFF and doubles up to REREGISTER_MAX_BACKOFF, so a
+        restarted control plane is found within seconds while a dead one is not polled
+        in a tight loop.
+        """
+        delay = HEARTBEAT_INTERVAL
+        backoff = REREGISTER_MIN_BACKOFF
         while self.running:
             try:
-                await asyncio.sleep(10.0)  # Re-register every 10 seconds
+                await asyncio.sleep(delay)
+                if not self.running:
+                    break
+                if self.registered:
+                    await self._send_heartbeat()
                 if not self.registered:
                     await self._register_with_control_plane()
-                else:
-                    # Send heartbeat/update
-                    try:
-                        update = {
-                            "subworker_id": self.worker_id,
-                            "address": self.base_address,
-                            "status": "active",
-                            "heartbeat": True,
-                        }
-                        update_data = TaskSerializer.serialize(update, self.serialization_format)
-                        await self.control_plane_registry.send(update_data)
-                        # Wait for ack (non-blocking, with timeout)
-                        try:
-                            ack_data = await asyncio.wait_for(
-                                self.control_plane_registry.recv(), timeout=1.0
-                            )
-                            ack = TaskSerializer.deserialize(ack_data, self.serialization_format)
-                            if ack.get("status") != "registered":
-                                self.registered = False
-                        except asyncio.TimeoutError:
-                            # No response, but that's okay for heartbeat
-                            pass
-                    except Exception as e:
-                        logger.debug(f"Error sending heartbeat: {e}")
-                        self.registered = False
             except Exception as e:
                 logger.error(f"Error in periodic re-registration: {e}")
-                await asyncio.sleep(10.0)
+                self.registered = False
+
+            if self.registered:
+                delay = HEARTBEAT_INTERVAL
+                backoff = REREGISTER_MIN_BACKOFF
+            else:
+                delay = backoff
+                backoff = min(backoff * 2, REREGISTER_MAX_BACKOFF)
+
+    async def _send_heartbeat(self):
+        """Send one heartbeat; an error, missing ack or rejection marks us unregistered."""
+        try:
+            await self.control_plane_registry.send(self._heartbeat_frame)
+            ack_data = await asyncio.wait_for(
+                self.control_plane_registry.recv(), timeout=HEARTBEAT_ACK_TIMEOUT
+            )
+            ack = self._deserialize(ack_data)
+            if ack.get("status") != "registered":
+                self.registered = False
+        except asyncio.TimeoutError:
+            logger.warning(f"Control plane did not acknowledge heartbeat from {self.worker_id}")
+            self.registered = False
+        except Exception as e:
+            logger.debug(f"Error sending heartbeat: {e}")
+            self.registered = False
 
     def stop(self):
         """Stop the subworker."""
@@ -4,8 +4,10 @@ import asyncio
 import logging
 import os
 import signal
+import time
+import weakref
 from datetime import datetime
-from urllib.parse import urlparse
+from typing import Dict, List, Optional
 
 from fastworker.patterns.nng_patterns import (
     BusPattern,
@@ -19,9 +21,11 @@ from fastworker.tasks.models import (
     TaskStatus,
 )
 from fastworker.tasks.registry import task_registry
-from fastworker.tasks.serializer import SerializationFormat, TaskSerializer
+from fastworker.tasks.serializer import ORJSON_AVAILABLE, SerializationFormat, TaskSerializer
 from fastworker.telemetry.metrics import record_task_metric
-from fastworker.telemetry.tracer import trace_operation
+from fastworker.telemetry.tracer import trace_operation, tracing_active
+from fastworker.utils.addresses import priority_addresses
+from fastworker.utils.announce import decode_announcement, encode_announcement
 from fastworker.workers.state import WorkerState, WorkerStateMachine
 
 logger = logging.getLogger(__name__)
@@ -29,10 +33,49 @@ logger = logging.getLogger(__name__)
 DEFAULT_TASK_TIMEOUT = 300.0  # 5 minutes
 DEFAULT_SHUTDOWN_TIMEOUT = 30.0  # 30 seconds for graceful drain
 
+# Tasks per concurrency slot a priority loop may take off its socket ahead of execution
+PREFETCH_PER_SLOT = 2
+
+# Callback listeners are Pair sockets that accept one peer at a time, so a worker holds
+# a callback connection only briefly: it is kept CALLBACK_LINGER seconds after its last
+# send (letting the send flush and back-to-back callbacks reuse it), takes no new
+# callbacks once CALLBACK_MAX_HOLD seconds old, and a send that waits longer than
+# CALLBACK_SEND_TIMEOUT (e.g. behind another worker's connection) is dropped
+CALLBACK_LINGER = 0.05
+CALLBACK_MAX_HOLD = 1.0
+CALLBACK_SEND_TIMEOUT = 5.0
+
+# Priorities from highest to lowest: the order of Worker.respondents and of queue draining
+PRIORITY_ORDER = (TaskPriority.CRITICAL, TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.LOW)
+
+# Discovery announcements handled per wakeup, and the pause after a bus error
+PEER_DRAIN_BATCH = 32
+PEER_ERROR_BACKOFF = 0.1
+
+
+class _CallbackConnection:
+    """A pooled callback socket and the state deciding when it is released."""
+
+    __slots__ = ("socket", "lock", "users", "opened", "closing", "closed", "timer")
+
+    def __init__(self, socket: PairPattern, opened: float):
+        self.socket = socket
+        self.lock = asyncio.Lock()  # serializes sends on the socket
+        self.users = 0  # callbacks currently sending on it
+        self.opened = opened  # loop time it was dialed
+        self.closing = False
+        self.closed = asyncio.Event()  # set once the address may be dialed again
+        self.timer: Optional[asyncio.TimerHandle] = None
+
 
 class Worker:
     """Worker that executes tasks using nng patterns with built-in service discovery."""
 
+    # Started workers in this process, and the event loops that already route
+    # SIGTERM/SIGINT to them (one handler per loop, shared by every worker)
+    _instances: "weakref.WeakSet[Worker]" = weakref.WeakSet()
+    _signal_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+
     def __init__(
         self,
         worker_id: str,
@@ -47,6 +90,15 @@ class Worker:
         self.base_address = base_address
         self.discovery_address = discovery_address
         self.serialization_format = serialization_format
+        self._serialize, self._deserialize = TaskSerializer.bind(serialization_format)
+        self._serialize_model = TaskSerializer.bind_model(serialization_format)
+        self._decode_task = TaskSerializer.bind_model_decoder(Task, serialization_format)
+        self._decode_result = TaskSerializer.bind_model_decoder(TaskResult, serialization_format)
+        # orjson writes datetimes exactly as isoformat() does, so JSON callbacks can
+        # carry them as-is; the other encoders need the string form built up front
+        self._native_datetimes = (
+            serialization_format == SerializationFormat.JSON and ORJSON_AVAILABLE
+        )
         self.task_timeout = task_timeout
         self.shutdown_timeout = shutdown_timeout
         self.concurrency = concurrency or int(os.getenv("FASTWORKER_WORKER_CONCURRENCY", "1"))
@@ -61,37 +113,26 @@ class Worker:
         # Track in-flight tasks for graceful shutdown
         self._active_tasks: set[asyncio.Task] = set()
 
-        # Parse base address to extract host and port
-        parsed = urlparse(base_address)
-        host = parsed.hostname or "127.0.0.1"
-        base_port = parsed.port or 5555
-        scheme = parsed.scheme or "tcp"
-
-        # Create addresses for different priorities using different ports
-        priority_ports = {
-            "critical": base_port,
-            "high": base_port + 1,
-            "normal": base_port + 2,
-            "low": base_port + 3,
-        }
-
-        # Create patterns for different priorities - workers LISTEN
-        self.critical_respondent = SurveyorRespondentPattern(
-            f"{scheme}://{host}:{priority_ports['critical']}", is_surveyor=False
-        )
-        self.high_respondent = SurveyorRespondentPattern(
-            f"{scheme}://{host}:{priority_ports['high']}", is_surveyor=False
-        )
-        self.normal_respondent = SurveyorRespondentPattern(
-            f"{scheme}://{host}:{priority_ports['normal']}", is_surveyor=False
-        )
-        self.low_respondent = SurveyorRespondentPattern(
-            f"{scheme}://{host}:{priority_ports['low']}", is_surveyor=False
-        )
+        # Callback connections by address, released shortly after each burst
+        self._callback_sockets: Dict[str, _CallbackConnection] = {}
+
+        # One listening pattern per priority port, as (priority, pattern) in PRIORITY_ORDER
+        addresses = priority_addresses(base_address)
+        self.respondents = [
+            (priority, self._create_respondent(addresses[priority.value]))
+            for priority in PRIORITY_ORDER
+        ]
+        (
+            self.critical_respondent,
+            self.high_respondent,
+            self.normal_respondent,
+            self.low_respondent,
+        ) = (respondent for _, respondent in self.respondents)
 
         # Built-in service discovery bus
         self.discovery_bus = BusPattern(discovery_address, listen=True)
-        self.peers = set()
+        # peer_id -> address; a re-announced peer replaces its old address
+        self.peers: Dict[str, str] = {}
 
     @property
     def running(self) -> bool:
@@ -108,9 +149,7 @@ class Worker:
             return
 
         # Set up signal handlers for graceful shutdown
-        loop = asyncio.get_running_loop()
-        for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, self._signal_handler, sig)
+        self._install_signal_handlers()
 
         try:
             # Start service discovery bus
@@ -123,10 +162,7 @@ class Worker:
             asyncio.create_task(self._listen_for_peers())
 
             # Start all respondents
-            await self.critical_respondent.start()
-            await self.high_respondent.start()
-            await self.normal_respondent.start()
-            await self.low_respondent.start()
+            await self._start_respondents()
 
         except Exception as e:
             logger.error(f"Failed to start worker {self.worker_id}: {e}")
@@ -143,14 +179,7 @@ class Worker:
         logger.info(f"Worker {self.worker_id} started with built-in discovery")
 
         # Start processing tasks for each priority
-        task_runners = [
-            asyncio.create_task(
-                self._process_tasks(self.critical_respondent, TaskPriority.CRITICAL)
-            ),
-            asyncio.create_task(self._process_tasks(self.high_respondent, TaskPriority.HIGH)),
-            asyncio.create_task(self._process_tasks(self.normal_respondent, TaskPriority.NORMAL)),
-            asyncio.create_task(self._process_tasks(self.low_respondent, TaskPriority.LOW)),
-        ]
+        task_runners = self._spawn_task_processors()
 
         # Wait for shutdown signal
         await self.shutdown_event.wait()
@@ -183,38 +212,79 @@ class Worker:
         await self.lifecycle.complete_stop()
         logger.info(f"Worker {self.worker_id} stopped")
 
+    def _create_respondent(self, address: str):
+        """Pattern that listens for tasks on one priority port."""
+        return SurveyorRespondentPattern(address, is_surveyor=False)
+
+    async def _start_respondents(self):
+        """Start listening on every priority port."""
+        for priority, respondent in self.respondents:
+            await respondent.start()
+            logger.debug("%s priority listener started", priority.value)
+
+    def _spawn_task_processors(self) -> List[asyncio.Task]:
+        """Start one task processing loop per priority."""
+        return [
+            asyncio.create_task(self._process_tasks(respondent, priority))
+            for priority, respondent in self.respondents
+        ]
+
     def _close_sockets(self):
         """Close all socket patterns."""
-        self.critical_respondent.close()
-        self.high_respondent.close()
-        self.normal_respondent.close()
-        self.low_respondent.close()
+        for _, respondent in self.respondents:
+            respondent.close()
         self.discovery_bus.close()
+        for address in list(self._callback_sockets):
+            self._close_callback_socket(address)
 
     async def _announce_presence(self):
         """Announce worker presence to network."""
-        await self.discovery_bus.send(
-            f"WORKER_ANNOUNCE:{self.worker_id}:{self.base_address}".encode()
-        )
+        await self.discovery_bus.send(encode_announcement(self.worker_id, self.base_address))
 
     async def _listen_for_peers(self):
         """Listen for peer announcements."""
+        bus = self.discovery_bus
         while self.running:
             try:
-                data = await self.discovery_bus.recv()
-                message = data.decode()
-
-                if message.startswith("WORKER_ANNOUNCE:"):
-                    parts = message.split(":")
-                    if len(parts) >= 3:
-                        peer_id = parts[1]
-                        peer_address = parts[2]
-                        self.peers.add((peer_id, peer_address))
+                # Announcements arrive in bursts; take whatever else is queued in one pass
+                frames = [await bus.recv()]
+                frames.extend(bus.recv_pending(PEER_DRAIN_BATCH - 1))
+
+                for data in frames:
+                    announcement = decode_announcement(data)
+                    if announcement is None:
+                        continue
+                    peer_id, peer_address = announcement
+                    if self.peers.get(peer_id) != peer_address:
+                        self.peers[peer_id] = peer_address
                         logger.info(f"Discovered peer worker: {peer_id} at {peer_address}")
 
             except Exception as e:
                 if self.running:
                     logger.error(f"Error in peer discovery: {e}")
+                    # A persistent error (e.g. a closed socket) must not spin the loop
+                    await asyncio.sleep(PEER_ERROR_BACKOFF)
+
+    def _install_signal_handlers(self):
+        """Route shutdown signals to this worker.
+
+        A loop holds one handler per signal, so each worker registering its own
+        would replace the previous one. The first worker on a loop installs a
+        handler that notifies every started worker instead.
+        """
+        Worker._instances.add(self)
+        loop = asyncio.get_running_loop()
+        if loop in Worker._signal_loops:
+            return
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, Worker._dispatch_signal, sig)
+        Worker._signal_loops.add(loop)
+
+    @staticmethod
+    def _dispatch_signal(sig):
+        """Deliver a shutdown signal to every started worker."""
+        for worker in list(Worker._instances):
+            worker._signal_handler(sig)
 
     def _signal_handler(self, sig):
         """Handle shutdown signals."""
@@ -223,52 +293,85 @@ class Worker:
 
     async def _process_tasks(self, respondent, priority: TaskPriority):
         """Process tasks for a specific priority."""
-        while self.lifecycle.state == WorkerState.RUNNING:
+        # Resolve the per-message callables once for the lifetime of the loop
+        lifecycle = self.lifecycle
+        recv_request = respondent.recv_request
+        decode_task = self._decode_task
+
+        # Receiving overlaps with execution, but only up to a bounded backlog: beyond
+        # it a burst waits in the socket instead of piling up as coroutines blocked
+        # on the concurrency limit. Each request arrives on its own nng context, so
+        # results can be answered in whatever order the tasks finish.
+        intake = asyncio.Semaphore(PREFETCH_PER_SLOT * self.concurrency)
+
+        def release_intake(_):
+            intake.release()
+
+        while lifecycle.state == WorkerState.RUNNING:
+            await intake.acquire()
+            reply = None
             try:
                 # Receive task
-                data = await respondent.recv()
-                task_data = TaskSerializer.deserialize(data, self.serialization_format)
+                data, reply = await recv_request()
 
-                # Create task object
-                task = Task(**task_data)
+                # Decode straight into a Task
+                task = decode_task(data)
                 logger.info(
-                    f"Worker {self.worker_id} received {priority} task {task.id} ({task.name})"
+                    "Worker %s received %s task %s (%s)",
+                    self.worker_id,
+                    priority,
+                    task.id,
+                    task.name,
                 )
 
                 # Spawn execution as a tracked task
-                exec_task = asyncio.create_task(self._execute_and_respond(task, respondent))
+                exec_task = asyncio.create_task(self._execute_and_respond(task, reply))
                 self._active_tasks.add(exec_task)
                 exec_task.add_done_callback(self._active_tasks.discard)
+                exec_task.add_done_callback(release_intake)
 
             except Exception as e:
+                intake.release()
+                if reply is not None:
+                    reply.close()
                 if self.lifecycle.state == WorkerState.RUNNING:
                     logger.error(
-                        f"Error processing {priority} task in worker {self.worker_id}: {e}"
+                        "Error processing %s task in worker %s: %s", priority, self.worker_id, e
                     )
 
-    async def _execute_and_respond(self, task: Task, respondent) -> None:
-        """Execute a task and send the result back."""
-        async with self._concurrency_semaphore:
-            result = await self._execute_task(task)
-        result_data = TaskSerializer.serialize(result.model_dump(), self.serialization_format)
-        await respondent.send(result_data)
+    async def _execute_and_respond(self, task: Task, reply) -> None:
+        """Execute a task and send the result back on the request's reply context."""
+        try:
+            async with self._concurrency_semaphore:
+                result = await self._execute_task(task)
+            result_data = self._serialize_model(result)
+        except BaseException:
+            reply.close()
+            raise
+        await reply.send(result_data)
 
     async def _execute_task(self, task: Task) -> TaskResult:
         """Execute a task with timeout and cancellation enforcement."""
         task.status = TaskStatus.RUNNING
         task.started_at = datetime.now()
+        started_ns = time.perf_counter_ns()
 
         timeout = task.timeout or self.task_timeout
+        priority = task.priority.value
 
-        with trace_operation(
-            "worker.execute_task",
-            attributes={
+        # Span attributes are only built when a span will actually record them
+        span_attributes = (
+            {
                 "task.id": task.id,
                 "task.name": task.name,
-                "task.priority": task.priority.value,
+                "task.priority": priority,
                 "worker.id": self.worker_id,
-            },
-        ):
+            }
+            if tracing_active()
+            else None
+        )
+
+        with trace_operation("worker.execute_task", attributes=span_attributes):
             try:
                 task_info = task_registry.get_task_info(task.name)
                 if not task_info:
@@ -289,13 +392,13 @@ class Worker:
 
                 # Run before hook
                 if task_info.before:
-                    if asyncio.iscoroutinefunction(task_info.before):
+                    if task_info.before_is_async:
                         await task_info.before(task)
                     else:
                         task_info.before(task)
 
                 # Execute with timeout
-                if asyncio.iscoroutinefunction(func):
+                if task_info.is_async:
                     result_value = await asyncio.wait_for(
                         func(*task.args, **task.kwargs), timeout=timeout
                     )
@@ -307,7 +410,7 @@ class Worker:
 
                 # Run after hook
                 if task_info.after:
-                    if asyncio.iscoroutinefunction(task_info.after):
+                    if task_info.after_is_async:
                         await task_info.after(task)
                     else:
                         task_info.after(task)
@@ -323,7 +426,7 @@ class Worker:
                     )
 
                 completed_at = datetime.now()
-                duration_ms = (completed_at - task.started_at).total_seconds() * 1000
+                duration_ns = time.perf_counter_ns() - started_ns
 
                 task_result = TaskResult(
                     task_id=task.id,
@@ -334,14 +437,16 @@ class Worker:
                     callback=task.callback,
                 )
 
-                logger.info(f"Task {task.id} completed successfully in {duration_ms:.2f}ms")
+                logger.info(
+                    "Task %s completed successfully in %.2fms", task.id, duration_ns / 1_000_000
+                )
 
                 record_task_metric(
                     "completed",
                     task.name,
-                    priority=task.priority.value,
+                    priority=priority,
                     worker_id=self.worker_id,
-                    duration_ms=duration_ms,
+                    duration_ns=duration_ns,
                 )
 
                 if task.callback:
@@ -359,11 +464,11 @@ class Worker:
                     completed_at=completed_at,
                     callback=task.callback,
                 )
-                logger.error(f"Task {task.id} timed out after {timeout}s")
+                logger.error("Task %s timed out after %ss", task.id, timeout)
                 record_task_metric(
                     "failed",
                     task.name,
-                    priority=task.priority.value,
+                    priority=priority,
                     worker_id=self.worker_id,
                 )
                 return task_result
@@ -378,12 +483,12 @@ class Worker:
                     completed_at=completed_at,
                     callback=task.callback,
                 )
-                logger.error(f"Task {task.id} failed: {e}")
+                logger.error("Task %s failed: %s", task.id, e)
 
                 record_task_metric(
                     "failed",
                     task.name,
-                    priority=task.priority.value,
+                    priority=priority,
                     worker_id=self.worker_id,
                 )
 
@@ -397,39 +502,104 @@ class Worker:
         if not task_result.callback:
             return
 
+        address = task_result.callback.address
         try:
-            callback_socket = PairPattern(task_result.callback.address, is_server=False)
-            await callback_socket.start()
+            started_at = task_result.started_at
+            completed_at = task_result.completed_at
+            if not self._native_datetimes:
+                started_at = started_at.isoformat() if started_at else None
+                completed_at = completed_at.isoformat() if completed_at else None
+
+            callback_data = {
+                "task_id": task_result.task_id,
+                "status": task_result.status.value,
+                "result": task_result.result,
+                "error": task_result.error,
+                "started_at": started_at,
+                "completed_at": completed_at,
+                "callback_data": task_result.callback.data,
+            }
+            serialized_data = self._serialize(callback_data)
+
+            await self._deliver_callback(address, serialized_data)
+
+            logger.info("Callback sent for task %s to %s", task_result.task_id, address)
 
-            try:
-                callback_data = {
-                    "task_id": task_result.task_id,
-                    "status": task_result.status.value,
-                    "result": task_result.result,
-                    "error": task_result.error,
-                    "started_at": (
-                        task_result.started_at.isoformat() if task_result.started_at else None
-                    ),
-                    "completed_at": (
-                        task_result.completed_at.isoformat() if task_result.completed_at else None
-                    ),
-                    "callback_data": task_result.callback.data,
-                }
-
-                serialized_data = TaskSerializer.serialize(callback_data, self.serialization_format)
-                await callback_socket.send(serialized_data)
+        except Exception as e:
+            logger.error("Failed to send callback for task %s: %s", task_result.task_id, e)
 
-                logger.info(
-                    f"Callback sent for task {task_result.task_id} "
-                    f"to {task_result.callback.address}"
+    async def _deliver_callback(self, address: str, data: bytes):
+        """Send one callback on the pooled connection for its address."""
+        connection = await self._acquire_callback_connection(address)
+        try:
+            async with connection.lock:
+                await asyncio.wait_for(connection.socket.send(data), timeout=CALLBACK_SEND_TIMEOUT)
+        except Exception:
+            # Take no more callbacks on a failed connection; later ones dial afresh
+            connection.opened = float("-inf")
+            raise
+        finally:
+            connection.users -= 1
+            if not connection.users:
+                connection.timer = asyncio.get_running_loop().call_later(
+                    CALLBACK_LINGER, self._release_callback_connection, address, connection
                 )
-            finally:
-                callback_socket.close()
 
-        except Exception as e:
-            logger.error(f"Failed to send callback for task {task_result.task_id}: {e}")
+    async def _acquire_callback_connection(self, address: str) -> _CallbackConnection:
+        """Join the address's current connection, or dial one once it is free."""
+        loop = asyncio.get_running_loop()
+        while True:
+            connection = self._callback_sockets.get(address)
+            if connection is None:
+                callback_socket = PairPattern(address, is_server=False)
+                await callback_socket.start()
+                # Another callback may have connected while this one was starting
+                if address in self._callback_sockets:
+                    callback_socket.close()
+                    continue
+                connection = _CallbackConnection(callback_socket, loop.time())
+                self._callback_sockets[address] = connection
+            elif connection.closing or loop.time() - connection.opened >= CALLBACK_MAX_HOLD:
+                # Let it close so other senders get the listener before dialing again
+                await connection.closed.wait()
+                continue
+
+            if connection.timer is not None:
+                connection.timer.cancel()
+                connection.timer = None
+            connection.users += 1
+            return connection
+
+    def _release_callback_connection(self, address: str, connection: _CallbackConnection):
+        """Linger timer: close an idle connection and free its address a moment later."""
+        connection.timer = None
+        if connection.users or connection.closing:
+            return
+        connection.closing = True
+        connection.socket.close()
+        # The listener drops a peer that connects before it has seen the previous one leave
+        asyncio.get_running_loop().call_later(
+            CALLBACK_LINGER, self._forget_callback_connection, address, connection
+        )
+
+    def _forget_callback_connection(self, address: str, connection: _CallbackConnection):
+        """Remove a closed connection so waiting callbacks can dial the address again."""
+        if self._callback_sockets.get(address) is connection:
+            del self._callback_sockets[address]
+        connection.closed.set()
+
+    def _close_callback_socket(self, address: str):
+        """Close and forget the callback connection for an address."""
+        connection = self._callback_sockets.pop(address, None)
+        if connection is not None:
+            if connection.timer is not None:
+                connection.timer.cancel()
+            connection.socket.close()
+            connection.closed.set()
 
     def stop(self):
         """Stop the worker — initiates drain then force stop."""
         logger.info(f"Stopping worker {self.worker_id}")
+        # A stopped worker no longer takes part in signal dispatch
+        Worker._instances.discard(self)
         self.shutdown_event.set()
@@ -1,12 +1,18 @@
-"""Integration test for FastWorker."""
+"""Integration test for FastWorker.
+
+Runs a control plane and a client in one event loop and submits a real task
+over nng. Not collected by pytest; run with ``python tests/integration_test.py``.
+"""
 
 import asyncio
-import signal
-import subprocess
-import time
 
 from fastworker.clients.client import Client
+from fastworker.tasks.models import TaskStatus
 from fastworker.tasks.registry import task
+from fastworker.workers.control_plane import ControlPlaneWorker
+
+DISCOVERY_ADDRESS = "tcp://127.0.0.1:5560"
+BASE_ADDRESS = "tcp://127.0.0.1:5565"
 
 
 # Define a test task
@@ -16,105 +22,66 @@ def add_numbers(x: int, y: int) -> int:
     return x + y
 
 
+async def wait_until(predicate, timeout: float = 10.0, interval: float = 0.01):
+    """Poll ``predicate`` until it returns a truthy value, failing after ``timeout``."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        value = await predicate()
+        if value:
+            return value
+        if loop.time() >= deadline:
+            raise AssertionError("Timed out waiting for condition")
+        await asyncio.sleep(interval)
+
+
 # Test the integration
 async def test_integration():
-    """Test the integration of worker and client."""
+    """Test the integration of control plane and client."""
     print("Starting integration test...")
 
-    # Start service discovery first
-    discovery_process = subprocess.Popen(
-        [
-            "python",
-            "-c",
-            """
-import asyncio
-from fastworker.clients.discovery import ServiceDiscovery
-
-async def run_discovery():
-    discovery = ServiceDiscovery("tcp://127.0.0.1:5560")
-    await discovery.start()
-    print("Service discovery started")
-    try:
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
-        pass
-    finally:
-        discovery.stop()
-
-asyncio.run(run_discovery())
-""",
-        ]
+    control_plane = ControlPlaneWorker(
+        worker_id="test-control-plane",
+        base_address=BASE_ADDRESS,
+        discovery_address=DISCOVERY_ADDRESS,
+        subworker_management_port=5570,
+        gui_enabled=False,
     )
+    control_plane_task = asyncio.create_task(control_plane.start())
 
-    # Wait a bit for discovery to start
-    time.sleep(1)
-
-    # Start a worker in a subprocess
-    worker_process = subprocess.Popen(
-        [
-            "python",
-            "-c",
-            """
-import asyncio
-from fastworker.workers.worker import Worker
-from fastworker.tasks.registry import task
-
-@task
-def add_numbers(x: int, y: int) -> int:
-    return x + y
+    async def control_plane_running():
+        return control_plane.running
 
-async def run_worker():
-    worker = Worker(
-        worker_id="test_worker",
-        base_address="tcp://127.0.0.1:5565",
-        discovery_address="tcp://127.0.0.1:5560"
-    )
-    print("Worker started")
+    client = Client(discovery_address=DISCOVERY_ADDRESS)
     try:
-        await worker.start()
-    except KeyboardInterrupt:
-        worker.stop()
-
-asyncio.run(run_worker())
-""",
-        ]
-    )
-
-    # Wait a bit for the worker to start
-    time.sleep(2)
+        # Ready as soon as its sockets are bound, no fixed startup sleep
+        await wait_until(control_plane_running)
+        print("Control plane started")
 
-    try:
-        # Create a client
-        client = Client(discovery_address="tcp://127.0.0.1:5560")
         await client.start()
 
         # Submit a task - delay() returns task_id string
         task_id = await client.delay("add_numbers", 5, 3)
-
         print(f"Task submitted, ID: {task_id}")
 
-        # Wait for result
-        result = await client.get_task_result(task_id, timeout=10.0)
+        async def finished_result():
+            result = await client.get_task_result(task_id)
+            if result and result.status in (TaskStatus.SUCCESS, TaskStatus.FAILURE):
+                return result
+            return None
 
+        result = await wait_until(finished_result)
         print(f"Task result: {result}")
-        if result and result.status.value == "success":
-            print(f"Result: {result.result}")
-            assert result.result == 8
-        else:
-            error_msg = result.error if result else "No result returned"
-            print(f"Error: {error_msg}")
-            raise AssertionError("Task failed")
+        assert result.status == TaskStatus.SUCCESS, result.error
+        assert result.result == 8
 
         print("Integration test passed!")
-        client.stop()
 
     finally:
-        # Stop the worker and discovery
-        worker_process.send_signal(signal.SIGINT)
-        discovery_process.send_signal(signal.SIGINT)
-        worker_process.wait()
-        discovery_process.wait()
+        client.stop()
+        # Same path as SIGTERM: start() drains, closes its sockets and returns
+        control_plane.shutdown_event.set()
+        await asyncio.wait_for(control_plane_task, timeout=10.0)
 
 
 if __name__ == "__main__":
@@ -33,3 +33,186 @@ def test_task_with_callback():
     assert task.callback is not None
     assert task.callback.address == "tcp://127.0.0.1:5570"
     assert task.callback.data == {"test": "data"}
+
+
+@pytest.mark.asyncio
+async def test_callback_connection_shared_by_burst_then_closed():
+    """Test that a burst of callbacks shares one connection that closes right after it."""
+    import asyncio
+    from unittest.mock import AsyncMock, patch
+
+    from fastworker.tasks.models import TaskResult, TaskStatus
+    from fastworker.workers.worker import Worker
+
+    worker = Worker(worker_id="cb-worker", base_address="tcp://127.0.0.1:5555")
+    callback_info = CallbackInfo(address="tcp://127.0.0.1:5570", data={"test": "data"})
+
+    release = asyncio.Event()
+
+    async def send(data):
+        await release.wait()
+
+    with (
+        patch("fastworker.workers.worker.PairPattern") as MockPair,
+        patch("fastworker.workers.worker.CALLBACK_LINGER", 0.01),
+    ):
+        callback_socket = MockPair.return_value
+        callback_socket.start = AsyncMock()
+        callback_socket.send = AsyncMock(side_effect=send)
+
+        burst = asyncio.gather(
+            *(
+                worker._send_callback(
+                    TaskResult(task_id=f"t{i}", status=TaskStatus.SUCCESS, callback=callback_info)
+                )
+                for i in range(3)
+            )
+        )
+        await asyncio.sleep(0.01)
+        callback_socket.close.assert_not_called()
+        release.set()
+        await burst
+        # A callback right behind the burst still reuses the connection
+        await worker._send_callback(
+            TaskResult(task_id="t3", status=TaskStatus.SUCCESS, callback=callback_info)
+        )
+
+        MockPair.assert_called_once_with("tcp://127.0.0.1:5570", is_server=False)
+        assert callback_socket.send.await_count == 4
+        callback_socket.close.assert_not_called()
+
+        await asyncio.sleep(0.05)
+        callback_socket.close.assert_called_once()
+        assert not worker._callback_sockets
+
+
+@pytest.mark.asyncio
+async def test_callback_connection_released_under_sustained_traffic():
+    """Test that a busy connection is closed and redialed once it has been held too long."""
+    import asyncio
+    from unittest.mock import AsyncMock, patch
+
+    from fastworker.tasks.models import TaskResult, TaskStatus
+    from fastworker.workers.worker import Worker
+
+    worker = Worker(worker_id="cb-worker", base_address="tcp://127.0.0.1:5555")
+    callback_info = CallbackInfo(address="tcp://127.0.0.1:5570")
+
+    with (
+        patch("fastworker.workers.worker.PairPattern") as MockPair,
+        patch("fastworker.workers.worker.CALLBACK_LINGER", 0.01),
+        patch("fastworker.workers.worker.CALLBACK_MAX_HOLD", 0.0),
+    ):
+        callback_socket = MockPair.return_value
+        callback_socket.start = AsyncMock()
+        callback_socket.send = AsyncMock()
+
+        for i in range(3):
+            await worker._send_callback(
+                TaskResult(task_id=f"t{i}", status=TaskStatus.SUCCESS, callback=callback_info)
+            )
+        await asyncio.sleep(0.05)
+
+    assert MockPair.call_count == 3
+    assert callback_socket.send.await_count == 3
+    assert callback_socket.close.call_count == 3
+    assert not worker._callback_sockets
+
+
+@pytest.mark.asyncio
+async def test_callbacks_from_two_workers_reach_one_listener():
+    """Test that a worker releases the listener's single Pair slot after its callbacks."""
+    import asyncio
+
+    from fastworker.patterns.nng_patterns import PairPattern
+    from fastworker.tasks.models import TaskResult, TaskStatus
+    from fastworker.workers.worker import Worker
+
+    address = "tcp://127.0.0.1:47140"
+    listener = PairPattern(address, is_server=True)
+    await listener.start()
+    callback_info = CallbackInfo(address=address)
+    first = Worker(worker_id="cb-first")
+    second = Worker(worker_id="cb-second")
+
+    received = []
+
+    async def listen():
+        while True:
+            received.append(first._deserialize(await listener.recv())["task_id"])
+
+    async def wait_for_count(count):
+        for _ in range(200):
+            if len(received) >= count:
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"only received {received}")
+
+    receiver = asyncio.create_task(listen())
+    try:
+        for i in range(3):
+            await first._send_callback(
+                TaskResult(task_id=f"a{i}", status=TaskStatus.SUCCESS, callback=callback_info)
+            )
+        await wait_for_count(3)
+        for _ in range(50):
+            if not first._callback_sockets:
+                break
+            await asyncio.sleep(0.01)
+        assert not first._callback_sockets
+
+        # The first worker no longer holds the listener's only Pair slot
+        await asyncio.wait_for(
+            second._send_callback(
+                TaskResult(task_id="b0", status=TaskStatus.SUCCESS, callback=callback_info)
+            ),
+            timeout=2.0,
+        )
+        await wait_for_count(4)
+        assert received == ["a0", "a1", "a2", "b0"]
+    finally:
+        receiver.cancel()
+        listener.close()
+
+
+@pytest.mark.parametrize("fmt", ["json", "msgpack"])
+@pytest.mark.asyncio
+async def test_callback_timestamps_are_iso_strings(fmt):
+    """Test that callback timestamps decode as ISO 8601 strings in every format."""
+    from datetime import datetime
+    from unittest.mock import AsyncMock, patch
+
+    from fastworker.tasks.models import TaskResult, TaskStatus
+    from fastworker.tasks.serializer import SerializationFormat, TaskSerializer
+    from fastworker.workers.worker import Worker
+
+    if fmt == "msgpack":
+        pytest.importorskip("msgpack")
+    serialization_format = SerializationFormat(fmt)
+    worker = Worker(
+        worker_id="cb-worker",
+        base_address="tcp://127.0.0.1:5555",
+        serialization_format=serialization_format,
+    )
+    started_at = datetime(2026, 1, 2, 3, 4, 5, 678901)
+    callback_info = CallbackInfo(address="tcp://127.0.0.1:5570")
+
+    with patch("fastworker.workers.worker.PairPattern") as MockPair:
+        callback_socket = MockPair.return_value
+        callback_socket.start = AsyncMock()
+        callback_socket.send = AsyncMock()
+        await worker._send_callback(
+            TaskResult(
+                task_id="t1",
+                status=TaskStatus.SUCCESS,
+                started_at=started_at,
+                callback=callback_info,
+            )
+        )
+        worker._close_callback_socket("tcp://127.0.0.1:5570")
+
+    payload = TaskSerializer.deserialize(
+        callback_socket.send.await_args.args[0], serialization_format
+    )
+    assert payload["started_at"] == started_at.isoformat()
+    assert payload["completed_at"] is None
@@ -2,9 +2,17 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from fastworker.cli import list_tasks, load_tasks, main, start_worker, submit_task
 
 
+@pytest.fixture(autouse=True)
+def stdlib_event_loop(monkeypatch):
+    """Keep worker commands from installing uvloop for the rest of the session."""
+    monkeypatch.setenv("FASTWORKER_UVLOOP", "false")
+
+
 def test_load_tasks_success():
     """Test successful task loading."""
     with patch("fastworker.cli.importlib.import_module") as mock_import:
@@ -114,6 +122,20 @@ def test_main_no_command():
             mock_help.assert_called_once()
 
 
+def test_parser_built_once_and_dispatches_current_handler():
+    """Test that the parser is cached and still calls the handler patched in later."""
+    from fastworker import cli
+
+    parser = cli._build_parser()
+    assert cli._build_parser() is parser
+
+    with patch("sys.argv", ["fastworker", "list"]):
+        with patch("fastworker.cli.list_tasks") as mock_list:
+            main()
+            mock_list.assert_called_once()
+    assert cli._build_parser() is parser
+
+
 def test_main_with_worker_command():
     """Test main function with worker command."""
     test_args = [
@@ -160,3 +182,54 @@ def test_main_with_list_command():
         with patch("fastworker.cli.list_tasks") as mock_list:
             main()
             mock_list.assert_called_once()
+
+
+def test_install_uvloop_by_default_unless_disabled(monkeypatch):
+    """Test that uvloop is installed when available unless FASTWORKER_UVLOOP=false."""
+    import asyncio
+
+    from fastworker.cli import install_uvloop
+
+    monkeypatch.setenv("FASTWORKER_UVLOOP", "false")
+    assert install_uvloop() is False
+
+    uvloop = pytest.importorskip("uvloop")
+    monkeypatch.delenv("FASTWORKER_UVLOOP", raising=False)
+    try:
+        assert install_uvloop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(None)
+
+
+def test_cli_import_defers_worker_stack():
+    """Test that importing the CLI (as --help does) loads no worker or client modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, fastworker.cli; "
+        "print(any(m in sys.modules for m in "
+        "('pydantic', 'pynng', 'fastworker.clients.client', 'fastworker.workers.worker')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_lazy_names_resolve_on_attribute_access():
+    """Test that lazily imported CLI names resolve to the real objects."""
+    import fastworker.cli as cli
+    from fastworker.workers.worker import Worker
+
+    assert cli.Worker is Worker
+    with pytest.raises(AttributeError):
+        cli.__getattr__("not_a_cli_name")
+
+
+def test_load_tasks_skips_import_machinery_for_loaded_modules():
+    """Test that task modules already in sys.modules are not re-imported."""
+    with patch("fastworker.cli.importlib.import_module") as mock_import:
+        load_tasks(["fastworker.tasks.registry"])
+        mock_import.assert_not_called()
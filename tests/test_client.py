@@ -5,7 +5,7 @@ from unittest.mock import patch
 import pytest
 
 from fastworker.clients.client import Client
-from fastworker.tasks.models import TaskPriority, TaskStatus
+from fastworker.tasks.models import Task, TaskPriority, TaskResult, TaskStatus
 
 
 @pytest.mark.asyncio
@@ -30,6 +30,28 @@ async def test_client_start():
         mock_listen.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_client_start_returns_on_first_discovery():
+    """Test that start() returns once a worker is announced instead of waiting it out."""
+    import asyncio
+    import time
+
+    async def announce(self):
+        self.workers.add(("worker1", "tcp://127.0.0.1:5555"))
+        self._worker_discovered.set()
+
+    with patch.object(Client, "_listen_for_workers", announce):
+        client = Client()
+        began = time.monotonic()
+        await client.start()
+        elapsed = time.monotonic() - began
+        client.stop()
+        await asyncio.sleep(0)
+
+    assert elapsed < 1.0
+    assert client.workers
+
+
 @pytest.mark.asyncio
 async def test_client_stop():
     """Test client stop functionality."""
@@ -52,6 +74,42 @@ async def test_worker_discovery():
     assert ("worker1", "tcp://127.0.0.1:5555") in client.workers
 
 
+@pytest.mark.asyncio
+async def test_listen_for_workers_drains_announcement_burst():
+    """Test that a burst of announcements, including repeats, is drained into the worker set."""
+    import asyncio
+
+    from fastworker.patterns.nng_patterns import BusPattern
+    from fastworker.utils.announce import encode_announcement
+
+    client = Client()
+    listener = BusPattern("inproc://test-client-discovery", listen=True)
+    announcer = BusPattern("inproc://test-client-discovery", listen=False)
+    await listener.start()
+    await announcer.start()
+    client.discovery_bus = listener
+    client.running = True
+
+    for _ in range(3):
+        await announcer.send(encode_announcement("cp", "tcp://10.0.0.1:5555"))
+    await announcer.send(b"not an announcement")
+    await announcer.send(encode_announcement("cp-2", "tcp://10.0.0.2:5555"))
+
+    listen = asyncio.create_task(client._listen_for_workers())
+    try:
+        for _ in range(50):
+            if len(client.workers) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert client.workers == {("cp", "tcp://10.0.0.1:5555"), ("cp-2", "tcp://10.0.0.2:5555")}
+        assert client._worker_discovered.is_set()
+    finally:
+        client.running = False
+        listener.close()
+        announcer.close()
+        await asyncio.wait_for(listen, timeout=1.0)
+
+
 @pytest.mark.asyncio
 async def test_submit_task_no_workers():
     """Test submitting task when no workers are available - task is queued."""
@@ -71,6 +129,55 @@ async def test_submit_task_no_workers():
     assert len(client.pending_tasks) == 1
 
 
+@pytest.mark.asyncio
+async def test_pending_tasks_flushed_when_worker_discovered():
+    """Test that queued tasks are submitted as soon as a worker is discovered."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    client = Client()
+    client.running = True
+    client._submit_task_internal = AsyncMock()
+    processor = asyncio.create_task(client._process_pending_tasks())
+    try:
+        await asyncio.sleep(0)
+        client.pending_tasks.extend(
+            Task(name="test_task", args=(), kwargs={}, priority=TaskPriority.NORMAL)
+            for _ in range(3)
+        )
+        client.workers.add(("worker1", "tcp://127.0.0.1:5555"))
+        client._pending_event.set()
+
+        # Well under the processor's fallback timeout
+        await asyncio.sleep(0.05)
+        assert not client.pending_tasks
+        assert client._submit_task_internal.await_count == 3
+    finally:
+        client.running = False
+        processor.cancel()
+
+
+@pytest.mark.asyncio
+async def test_unserializable_task_fails_without_retrying():
+    """Test that a task that cannot be serialized fails before any connection is made."""
+    from unittest.mock import Mock
+
+    client = Client(retries=3)
+    client.running = True
+    client.workers.add(("worker1", "tcp://127.0.0.1:5555"))
+    client._serialize_model = Mock(side_effect=TypeError("cannot serialize"))
+    task = Task(name="test_task", args=(), kwargs={}, priority=TaskPriority.NORMAL)
+
+    with patch("fastworker.clients.client.ReqRepPattern") as mock_requester:
+        result = await client._submit_task_internal(task)
+
+    assert result.status == TaskStatus.FAILURE
+    assert result.error == "cannot serialize"
+    assert client.get_result(task.id) is result
+    client._serialize_model.assert_called_once()
+    mock_requester.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_delay_method():
     """Test delay method interface."""
@@ -92,6 +199,23 @@ async def test_delay_method():
     assert result.status == TaskStatus.PENDING
 
 
+def test_task_results_bounded_lru():
+    """Test that stored task results are capped, evicting the least recently used."""
+    client = Client(max_results=3)
+    for i in range(3):
+        client._record_result(TaskResult(task_id=f"t{i}", status=TaskStatus.PENDING))
+
+    # Reading t0 makes t1 the least recently used
+    assert client.get_status("t0") == TaskStatus.PENDING
+    client._record_result(TaskResult(task_id="t3", status=TaskStatus.PENDING))
+    assert list(client.task_results) == ["t2", "t0", "t3"]
+
+    # Updating an existing result does not evict anything
+    client._record_result(TaskResult(task_id="t2", status=TaskStatus.SUCCESS, result=1))
+    assert list(client.task_results) == ["t0", "t3", "t2"]
+    assert client.get_result("t1") is None
+
+
 @pytest.mark.asyncio
 async def test_custom_client_settings():
     """Test client with custom settings."""
@@ -100,3 +224,17 @@ async def test_custom_client_settings():
     assert client.discovery_address == "tcp://127.0.0.1:6000"
     assert client.timeout == 60
     assert client.retries == 5
+
+
+def test_worker_addresses_derived_once():
+    """Test that per-port worker addresses are derived from the base address and cached."""
+    from fastworker.utils.addresses import (
+        RESULT_QUERY_PORT_OFFSET,
+        offset_address,
+        priority_addresses,
+    )
+
+    assert offset_address("tcp://10.0.0.5:6000", RESULT_QUERY_PORT_OFFSET) == "tcp://10.0.0.5:6004"
+    assert offset_address("", 1) == "tcp://127.0.0.1:5556"
+    assert priority_addresses("tcp://10.0.0.5:6000")["low"] == "tcp://10.0.0.5:6003"
+    assert priority_addresses("tcp://10.0.0.5:6000") is priority_addresses("tcp://10.0.0.5:6000")
@@ -3,6 +3,7 @@
 from collections import OrderedDict
 from datetime import datetime
 
+import pynng
 import pytest
 
 from fastworker.tasks.models import (
@@ -99,9 +100,9 @@ def test_result_cache_ttl_expiration(control_plane):
     assert control_plane._get_result(task_id) is not None
 
     # Wait for TTL to expire
-    import asyncio
+    import time
 
-    asyncio.get_event_loop().run_until_complete(asyncio.sleep(1.1))
+    time.sleep(1.1)
 
     # Result should be expired
     assert control_plane._get_result(task_id) is None
@@ -436,3 +437,521 @@ def test_result_cache_double_store(control_plane):
     # Should return the second result
     cached = control_plane._get_result(task_id)
     assert cached.result["value"] == 2
+
+
+@pytest.mark.asyncio
+async def test_send_task_to_subworker_reuses_requester(control_plane):
+    """Test that tasks to the same subworker priority share one connection."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from fastworker.tasks.serializer import TaskSerializer
+
+    control_plane.subworkers["sw1"] = {
+        "address": "tcp://127.0.0.1:5561",
+        "status": "active",
+        "last_seen": datetime.now(),
+        "load": 0,
+    }
+    respondent = MagicMock()
+    respondent.send = AsyncMock()
+
+    with patch("fastworker.workers.control_plane.ReqRepPattern") as MockReqRep:
+        requester = MockReqRep.return_value
+        requester.start = AsyncMock()
+
+        requester.request = AsyncMock()
+        for _ in range(3):
+            task = Task(name="add", args=(1, 2), priority=TaskPriority.HIGH)
+            result = TaskResult(task_id=task.id, status=TaskStatus.SUCCESS, result=3)
+            requester.request.return_value = TaskSerializer.serialize(
+                result.model_dump(), control_plane.serialization_format
+            )
+            await control_plane._send_task_to_subworker(task, "sw1", respondent)
+
+        MockReqRep.assert_called_once_with("tcp://127.0.0.1:5562", is_server=False)
+        assert requester.start.await_count == 1
+        assert requester.request.await_count == 3
+        assert respondent.send.await_count == 3
+        assert control_plane.subworkers["sw1"]["load"] == 0
+
+        control_plane._close_subworker_requesters("sw1")
+        requester.close.assert_called_once()
+        assert not control_plane._subworker_requesters
+
+
+@pytest.mark.asyncio
+async def test_send_task_to_subworker_overlaps_concurrent_tasks(control_plane):
+    """Test that concurrent tasks to one subworker priority run in parallel and count as load."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    control_plane.subworkers["sw1"] = {
+        "address": "tcp://127.0.0.1:5561",
+        "status": "active",
+        "last_seen": datetime.now(),
+        "load": 0,
+    }
+    respondent = MagicMock()
+    respondent.send = AsyncMock()
+    in_flight = 0
+    peak = 0
+    peak_load = 0
+    release = asyncio.Event()
+
+    async def request(data):
+        nonlocal in_flight, peak, peak_load
+        in_flight += 1
+        peak = max(peak, in_flight)
+        peak_load = max(peak_load, control_plane.subworkers["sw1"]["load"])
+        await release.wait()
+        in_flight -= 1
+        task = Task.model_validate(control_plane._deserialize(data))
+        result = TaskResult(task_id=task.id, status=TaskStatus.SUCCESS, result=3)
+        return control_plane._serialize_model(result)
+
+    with patch("fastworker.workers.control_plane.ReqRepPattern") as MockReqRep:
+        requester = MockReqRep.return_value
+        requester.start = AsyncMock()
+        requester.request = request
+
+        tasks = [Task(name="add", args=(1, 2)) for _ in range(3)]
+        sends = asyncio.gather(
+            *(control_plane._send_task_to_subworker(t, "sw1", respondent) for t in tasks)
+        )
+        for _ in range(50):
+            if in_flight == 3:
+                break
+            await asyncio.sleep(0.01)
+        release.set()
+        await sends
+
+    assert peak == 3
+    assert peak_load == 3
+    assert MockReqRep.call_count == 1
+    assert respondent.send.await_count == 3
+    assert control_plane.subworkers["sw1"]["load"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_subworker_dispatch_runs_task_locally(control_plane):
+    """Test that a failed subworker exchange still answers the client on its own context."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from fastworker.patterns.nng_patterns import ReplyContext
+    from fastworker.tasks.registry import task
+
+    @task
+    def fallback_add(x: int, y: int) -> int:
+        return x + y
+
+    control_plane.subworkers["sw1"] = {
+        "address": "tcp://127.0.0.1:5561",
+        "status": "active",
+        "last_seen": datetime.now(),
+        "load": 0,
+    }
+    context = MagicMock()
+    context.asend = AsyncMock()
+    submitted = Task(name="fallback_add", args=(1, 2))
+
+    with patch("fastworker.workers.control_plane.ReqRepPattern") as MockReqRep:
+        requester = MockReqRep.return_value
+        requester.start = AsyncMock()
+        requester.request = AsyncMock(side_effect=pynng.ConnectionRefused("subworker gone", 0))
+
+        await control_plane._process_and_respond(
+            submitted, ReplyContext(context), TaskPriority.NORMAL
+        )
+
+    requester.close.assert_called_once()
+    reply = TaskResult.model_validate(control_plane._deserialize(context.asend.await_args.args[0]))
+    assert (reply.status, reply.result) == (TaskStatus.SUCCESS, 3)
+    context.close.assert_called_once()
+    assert control_plane._get_result(submitted.id).result == 3
+    # Answered here, so nothing is left queued to run a second time
+    assert not any(control_plane._task_queues)
+    assert control_plane.subworkers["sw1"]["load"] == 0
+
+
+@pytest.mark.asyncio
+async def test_send_task_to_subworker_timeout_keeps_shared_requester(control_plane):
+    """Test that one timed-out exchange leaves the shared connection open for the others."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    control_plane.subworkers["sw1"] = {
+        "address": "tcp://127.0.0.1:5561",
+        "status": "active",
+        "last_seen": datetime.now(),
+        "load": 0,
+    }
+    respondent = MagicMock()
+    respondent.send = AsyncMock()
+    hang = asyncio.Event()
+
+    async def hang_request(data):
+        await hang.wait()
+
+    with (
+        patch("fastworker.workers.control_plane.ReqRepPattern") as MockReqRep,
+        patch("fastworker.workers.control_plane.SUBWORKER_REPLY_GRACE", 0.0),
+    ):
+        requester = MockReqRep.return_value
+        requester.start = AsyncMock()
+        requester.request = hang_request
+
+        await control_plane._send_task_to_subworker(
+            Task(name="add", args=(1, 2), timeout=0.01), "sw1", respondent
+        )
+
+    requester.close.assert_not_called()
+    assert control_plane._subworker_requesters[("sw1", "normal")] is requester
+    assert not control_plane._requester_in_flight
+
+
+@pytest.mark.asyncio
+async def test_send_task_to_subworker_closes_failed_requester_after_last_exchange(control_plane):
+    """Test that a broken connection is dropped at once but closed only when it goes idle."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    control_plane.subworkers["sw1"] = {
+        "address": "tcp://127.0.0.1:5561",
+        "status": "active",
+        "last_seen": datetime.now(),
+        "load": 0,
+    }
+    respondent = MagicMock()
+    respondent.send = AsyncMock()
+    release = asyncio.Event()
+    calls = 0
+
+    async def request(data):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release.wait()
+            task = Task.model_validate(control_plane._deserialize(data))
+            result = TaskResult(task_id=task.id, status=TaskStatus.SUCCESS, result=3)
+            return control_plane._serialize_model(result)
+        raise pynng.ConnectionReset("reset", 0)
+
+    with patch("fastworker.workers.control_plane.ReqRepPattern") as MockReqRep:
+        requester = MockReqRep.return_value
+        requester.start = AsyncMock()
+        requester.request = request
+
+        slow = asyncio.create_task(
+            control_plane._send_task_to_subworker(Task(name="add"), "sw1", respondent)
+        )
+        await asyncio.sleep(0)
+        await control_plane._send_task_to_subworker(Task(name="add"), "sw1", MagicMock())
+
+        assert not control_plane._subworker_requesters
+        requester.close.assert_not_called()
+
+        release.set()
+        await slow
+
+    requester.close.assert_called_once()
+    respondent.send.assert_awaited_once()
+    assert not control_plane._requester_in_flight
+    assert control_plane.subworkers["sw1"]["load"] == 0
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_advances_reported_last_seen(control_plane):
+    """Test that registrations keep no wall-clock last_seen and status derives it from heartbeats."""
+    import asyncio
+
+    from fastworker.patterns.nng_patterns import ReqRepPattern
+
+    control_plane.subworker_registry = ReqRepPattern("inproc://test-cp-registry", is_server=True)
+    await control_plane.subworker_registry.start()
+    subworker = ReqRepPattern("inproc://test-cp-registry")
+    await subworker.start()
+    await control_plane.lifecycle.start()
+    await control_plane.lifecycle.ready()
+    handler = asyncio.create_task(control_plane._handle_subworker_registrations())
+    registration = {"subworker_id": "sw1", "address": "tcp://127.0.0.1:5561"}
+
+    try:
+        await subworker.send(control_plane._serialize(registration))
+        await subworker.recv()
+        info = control_plane.subworkers["sw1"]
+        assert "last_seen" not in info
+        registered = datetime.fromisoformat(
+            control_plane.get_subworker_status()["subworkers"]["sw1"]["last_seen"]
+        )
+
+        await asyncio.sleep(0.05)
+        await subworker.send(control_plane._serialize({**registration, "heartbeat": True}))
+        await subworker.recv()
+        heartbeat = datetime.fromisoformat(
+            control_plane.get_subworker_status()["subworkers"]["sw1"]["last_seen"]
+        )
+        assert heartbeat > registered
+        assert "last_seen" not in info
+    finally:
+        await control_plane.lifecycle.force_stop()
+        subworker.close()
+        control_plane.subworker_registry.close()
+        await asyncio.gather(handler, return_exceptions=True)
+
+
+def test_subworker_selection_tracks_load_changes(control_plane):
+    """Test that the load index follows load and status changes."""
+    for sid, load in (("sw1", 0), ("sw2", 1), ("sw3", 2)):
+        control_plane.subworkers[sid] = {
+            "address": "tcp://127.0.0.1:5561",
+            "status": "active",
+            "last_seen": datetime.now(),
+            "load": load,
+        }
+
+    assert control_plane._select_subworker(TaskPriority.NORMAL) == "sw1"
+
+    control_plane._adjust_subworker_load("sw1", 5)
+    assert control_plane._select_subworker(TaskPriority.NORMAL) == "sw2"
+
+    control_plane.subworkers["sw2"]["status"] = "inactive"
+    control_plane._index_subworker_load("sw2")
+    assert control_plane._select_subworker(TaskPriority.NORMAL) == "sw3"
+    assert control_plane._active_subworkers == {"sw1", "sw3"}
+    assert control_plane.active_subworker_count() == 2
+
+    # Removed subworkers are dropped from the index
+    del control_plane.subworkers["sw3"]
+    control_plane._adjust_subworker_load("sw1", 10)
+    assert control_plane._select_subworker(TaskPriority.NORMAL) == "sw1"
+
+    control_plane.subworkers["sw1"]["status"] = "inactive"
+    control_plane._index_subworker_load("sw1")
+    assert control_plane._select_subworker(TaskPriority.NORMAL) is None
+
+
+def test_expire_results_removes_only_expired_front(control_plane):
+    """Test that expiry follows store order even after LRU access reorders the cache."""
+    import time
+
+    control_plane.result_cache_ttl_seconds = 10
+    for i in range(3):
+        control_plane._store_result(
+            TaskResult(task_id=f"task-{i}", status=TaskStatus.SUCCESS, result=i)
+        )
+
+    # Touch the oldest result so it moves to the LRU end of the cache
+    control_plane._get_result("task-0")
+    stored_mono = control_plane.result_cache["task-0"]["stored_mono"]
+
+    assert control_plane._expire_results(stored_mono + 5) == 0
+    assert control_plane._expire_results(time.monotonic() + 11) == 3
+    assert len(control_plane.result_cache) == 0
+    assert not control_plane._expiry_queue
+
+
+def test_full_cache_drops_expired_results_before_live_ones(control_plane):
+    """Test that storing into a full cache evicts expired results, not the LRU live one."""
+    control_plane.result_cache_max_size = 3
+    control_plane.result_cache_ttl_seconds = 10
+    for i in range(3):
+        control_plane._store_result(
+            TaskResult(task_id=f"task-{i}", status=TaskStatus.SUCCESS, result=i)
+        )
+
+    # task-1 expired; task-0 is live but least recently used
+    control_plane.result_cache["task-1"]["stored_mono"] -= 60
+    control_plane._compact_expiry_queue()
+
+    control_plane._store_result(TaskResult(task_id="task-3", status=TaskStatus.SUCCESS, result=3))
+    assert list(control_plane.result_cache) == ["task-0", "task-2", "task-3"]
+
+
+def test_display_times_derived_from_monotonic_clock(control_plane):
+    """Test that last-seen/last-accessed datetimes are derived from monotonic readings."""
+    from datetime import timedelta
+
+    from fastworker.utils.timestamps import result_last_accessed, subworker_last_seen
+
+    registered_at = datetime(2024, 1, 1, 12, 0, 0)
+    info = {"registered_at": registered_at, "registered_mono": 100.0, "last_seen_mono": 130.0}
+    assert subworker_last_seen(info) == registered_at + timedelta(seconds=30)
+    assert subworker_last_seen({"last_seen": registered_at}) == registered_at
+
+    control_plane._store_result(TaskResult(task_id="t", status=TaskStatus.SUCCESS))
+    entry = control_plane.result_cache["t"]
+    entry["accessed_mono"] = entry["stored_mono"] + 2.5
+    assert result_last_accessed(entry) == entry["stored_at"] + timedelta(seconds=2.5)
+
+
+@pytest.mark.asyncio
+async def test_result_query_response_is_serialized_once(control_plane):
+    """Test that repeated result queries reuse the cached serialized response."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+    from fastworker.tasks.serializer import TaskSerializer
+
+    control_plane._store_result(TaskResult(task_id="q1", status=TaskStatus.SUCCESS, result=7))
+    query = TaskSerializer.serialize({"task_id": "q1"}, control_plane.serialization_format)
+
+    server = MagicMock()
+    server.recv = AsyncMock(side_effect=[query, query, asyncio.CancelledError()])
+    server.send = AsyncMock()
+    control_plane.result_query_server = server
+
+    with patch.object(ControlPlaneWorker, "running", new_callable=PropertyMock, return_value=True):
+        with pytest.raises(asyncio.CancelledError):
+            await control_plane._handle_result_queries()
+
+    first, second = (call.args[0] for call in server.send.await_args_list)
+    assert first is second
+    response = TaskSerializer.deserialize(first, control_plane.serialization_format)
+    assert response["found"] is True
+    assert response["result"]["result"] == 7
+
+
+@pytest.mark.asyncio
+async def test_distribute_queued_tasks_drains_burst(control_plane):
+    """Test that the distributor drains a burst at once and wakes on enqueue."""
+    import asyncio
+    from unittest.mock import AsyncMock, PropertyMock, patch
+
+    control_plane._execute_task = AsyncMock()
+
+    with patch.object(ControlPlaneWorker, "running", new_callable=PropertyMock, return_value=True):
+        distributor = asyncio.create_task(control_plane._distribute_queued_tasks())
+        await asyncio.sleep(0.01)  # distributor is now waiting on the empty queues
+
+        for i in range(5):
+            control_plane._enqueue_task(Task(name=f"task-{i}", priority=TaskPriority.LOW))
+        control_plane._enqueue_task(Task(name="urgent", priority=TaskPriority.CRITICAL))
+        await asyncio.sleep(0.05)
+
+        distributor.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await distributor
+
+    assert control_plane._execute_task.await_count == 6
+    assert all(not q for q in control_plane.task_queue.values())
+
+
+def test_task_queue_views_share_deques(control_plane):
+    """Test that the priority-ordered tuple aliases the task_queue deques."""
+    from fastworker.workers.control_plane import PRIORITY_ORDER
+
+    assert len(control_plane._task_queues) == len(PRIORITY_ORDER)
+    for priority, queue in zip(PRIORITY_ORDER, control_plane._task_queues, strict=True):
+        assert queue is control_plane.task_queue[priority]
+
+
+def test_pop_stale_subworkers_skips_refreshed_heartbeats(control_plane):
+    """Test that only subworkers without a newer heartbeat are reported stale."""
+    for sid, seen in (("sw-old", 10.0), ("sw-fresh", 10.0), ("sw-new", 50.0)):
+        control_plane.subworkers[sid] = {
+            "address": f"tcp://127.0.0.1:{sid}",
+            "status": "active",
+            "last_seen_mono": seen,
+            "load": 0,
+        }
+        control_plane._index_last_seen(sid, seen)
+
+    # A later heartbeat supersedes the old heap entry
+    control_plane.subworkers["sw-fresh"]["last_seen_mono"] = 45.0
+    control_plane._index_last_seen("sw-fresh", 45.0)
+
+    assert control_plane._pop_stale_subworkers(40.0) == ["sw-old"]
+    control_plane.subworkers["sw-old"]["status"] = "inactive"
+    assert control_plane._pop_stale_subworkers(40.0) == []
+    assert sorted(control_plane._pop_stale_subworkers(60.0)) == ["sw-fresh", "sw-new"]
+    assert not control_plane._last_seen_heap
+
+
+def test_pop_stale_subworkers_indexes_unregistered_entries(control_plane):
+    """Test that subworkers added directly to the dict are still monitored."""
+    import time
+
+    control_plane.subworkers["sw-1"] = {
+        "address": "tcp://127.0.0.1:6000",
+        "status": "active",
+        "last_seen": datetime(2000, 1, 1),
+        "load": 0,
+    }
+
+    assert control_plane._pop_stale_subworkers(time.monotonic() - 30.0) == ["sw-1"]
+
+
+def test_priority_addresses_from_base_address():
+    """Test that the per-priority subworker addresses are derived from the base port."""
+    from fastworker.workers.control_plane import priority_addresses
+
+    assert priority_addresses("tcp://10.0.0.5:6000") == {
+        "critical": "tcp://10.0.0.5:6000",
+        "high": "tcp://10.0.0.5:6001",
+        "normal": "tcp://10.0.0.5:6002",
+        "low": "tcp://10.0.0.5:6003",
+    }
+
+
+@pytest.mark.asyncio
+async def test_result_queries_reply_to_every_request(control_plane):
+    """Test that missing IDs, unknown tasks and cancels each get exactly one reply."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+    from fastworker.tasks.serializer import TaskSerializer
+
+    fmt = control_plane.serialization_format
+    queries = [
+        TaskSerializer.serialize({}, fmt),
+        TaskSerializer.serialize({"task_id": "missing"}, fmt),
+        TaskSerializer.serialize({"action": "cancel", "task_id": "missing"}, fmt),
+    ]
+
+    server = MagicMock()
+    server.recv = AsyncMock(side_effect=[*queries, asyncio.CancelledError()])
+    server.send = AsyncMock()
+    control_plane.result_query_server = server
+
+    with patch.object(ControlPlaneWorker, "running", new_callable=PropertyMock, return_value=True):
+        with pytest.raises(asyncio.CancelledError):
+            await control_plane._handle_result_queries()
+
+    missing_id, not_found, cancel = (
+        TaskSerializer.deserialize(call.args[0], fmt) for call in server.send.await_args_list
+    )
+    assert missing_id == {"error": "Missing task_id"}
+    assert not_found["found"] is False
+    assert cancel == {"cancelled": False, "task_id": "missing"}
+
+
+@pytest.mark.asyncio
+async def test_send_task_to_subworker_forwards_received_bytes(control_plane):
+    """Test that the client's task bytes are forwarded without re-serializing."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from fastworker.tasks.serializer import TaskSerializer
+
+    control_plane.subworkers["sw1"] = {
+        "address": "tcp://127.0.0.1:5561",
+        "status": "active",
+        "last_seen": datetime.now(),
+        "load": 0,
+    }
+    respondent = MagicMock()
+    respondent.send = AsyncMock()
+    task = Task(name="add", args=(1, 2))
+    result = TaskResult(task_id=task.id, status=TaskStatus.SUCCESS, result=3)
+
+    with patch("fastworker.workers.control_plane.ReqRepPattern") as MockReqRep:
+        requester = MockReqRep.return_value
+        requester.start = AsyncMock()
+        requester.request = AsyncMock(
+            return_value=TaskSerializer.serialize(
+                result.model_dump(), control_plane.serialization_format
+            )
+        )
+
+        await control_plane._send_task_to_subworker(task, "sw1", respondent, b"raw-task")
+
+    requester.request.assert_awaited_once_with(b"raw-task")
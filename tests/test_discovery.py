@@ -1,6 +1,7 @@
 """Test cases for FastWorker ServiceDiscovery."""
 
 import json
+import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -284,3 +285,74 @@ def test_service_discovery_get_services_returns_list():
     result = discovery.get_services()
     assert isinstance(result, list)
     assert len(result) == 1
+
+
+def test_get_services_by_type_tracks_changes():
+    """Test that the by-type index follows re-registration, removal and reassignment."""
+    discovery = ServiceDiscovery(discovery_address="tcp://127.0.0.1:5550")
+
+    discovery.services["a"] = {"type": "control-plane", "address": "tcp://127.0.0.1:5555"}
+    discovery.services["b"] = {"type": "control-plane", "address": "tcp://127.0.0.1:5556"}
+    discovery.services["c"] = {"type": "subworker", "address": "tcp://127.0.0.1:5561"}
+
+    # Re-registering under another type moves the service between buckets
+    discovery.services["a"] = {"type": "subworker", "address": "tcp://127.0.0.1:5562"}
+    assert [s["address"] for s in discovery.get_services("control-plane")] == [
+        "tcp://127.0.0.1:5556"
+    ]
+    assert [s["address"] for s in discovery.get_services("subworker")] == [
+        "tcp://127.0.0.1:5561",
+        "tcp://127.0.0.1:5562",
+    ]
+
+    del discovery.services["b"]
+    discovery.services.pop("c")
+    assert discovery.get_services("control-plane") == []
+    assert len(discovery.get_services("subworker")) == 1
+
+    discovery.services = {"d": {"type": "worker", "address": "tcp://127.0.0.1:5570"}}
+    assert isinstance(discovery.services, dict)
+    assert discovery.get_services("subworker") == []
+    assert len(discovery.get_services("worker")) == 1
+
+
+@pytest.mark.asyncio
+async def test_announcements_applied_from_bus():
+    """Test that register/unregister announcements on the bus update the registry."""
+    import asyncio
+
+    from fastworker.patterns.nng_patterns import BusPattern
+
+    discovery = ServiceDiscovery(discovery_address="inproc://test-service-discovery")
+    peer = ServiceDiscovery(discovery_address="inproc://test-service-discovery")
+    peer.bus_pattern = BusPattern("inproc://test-service-discovery", listen=False)
+    await discovery.bus_pattern.start()
+    await peer.bus_pattern.start()
+    discovery.running = True
+    listen = asyncio.create_task(discovery._listen_for_announcements())
+
+    async def wait_for(predicate):
+        for _ in range(100):
+            if predicate():
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError("announcement not applied")
+
+    try:
+        await peer.register_service("cp1", "control-plane", "tcp://127.0.0.1:5555")
+        await peer.register_service("sw1", "subworker", "tcp://127.0.0.1:5561")
+        await wait_for(lambda: len(discovery.services) == 2)
+        assert discovery.services["cp1"]["type"] is sys.intern("control-plane")
+
+        await peer.unregister_service("sw1")
+        await wait_for(lambda: "sw1" not in discovery.services)
+
+        assert [s["address"] for s in discovery.get_services("control-plane")] == [
+            "tcp://127.0.0.1:5555"
+        ]
+        assert discovery.get_services("subworker") == []
+    finally:
+        discovery.running = False
+        discovery.bus_pattern.close()
+        peer.bus_pattern.close()
+        await asyncio.wait_for(listen, timeout=1.0)
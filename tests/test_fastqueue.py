@@ -32,3 +32,34 @@ def test_task_model(sample_task_obj):
     assert sample_task_obj.args == (2, 3)
     assert sample_task_obj.priority == TaskPriority.NORMAL
     assert sample_task_obj.id is not None
+
+
+def test_task_info_resolves_coroutine_functions_at_registration():
+    """Test that sync/async dispatch is decided once, when the task is registered."""
+
+    async def before_hook(t):
+        pass
+
+    @task(before=before_hook)
+    async def async_func():
+        return "test"
+
+    info = task_registry.get_task_info("async_func")
+    assert info.is_async is True
+    assert info.before_is_async is True
+    assert info.after_is_async is False
+
+
+def test_get_task_info_sees_later_registrations():
+    """Test that the bound task lookup reflects tasks registered after construction."""
+    from fastworker.tasks.registry import TaskRegistry
+
+    registry = TaskRegistry()
+    assert registry.get_task_info("late") is None
+
+    def late():
+        return "late"
+
+    registry.register(late)
+    assert registry.get_task_info("late").func is late
+    assert registry.get_task("late") is late
@@ -152,3 +152,35 @@ def test_send_error_response():
     h.send_error_response("something broke", 503)
     assert h._status == 503
     assert h._response_data["error"] == "something broke"
+
+
+def test_offer_event_drops_oldest_when_full():
+    import queue
+
+    from fastworker.gui.server import _offer_event
+
+    q = queue.Queue(maxsize=2)
+    for i in range(4):
+        _offer_event(q, {"name": "task_completed", "data": {"i": i}})
+
+    assert q.qsize() == 2
+    assert [q.get_nowait()["data"]["i"] for _ in range(2)] == [2, 3]
+
+
+def test_offer_event_warns_once_per_interval_about_drops(caplog, monkeypatch):
+    import logging
+    import queue
+
+    from fastworker.gui import server
+
+    monkeypatch.setattr(server, "_dropped_events", 0)
+    monkeypatch.setattr(server, "_last_drop_warning", float("-inf"))
+    q = queue.Queue(maxsize=1)
+    with caplog.at_level(logging.WARNING, logger="fastworker.gui.server"):
+        for i in range(5):
+            server._offer_event(q, {"name": "task_completed", "data": {"i": i}})
+
+    warnings = [r for r in caplog.records if "dropped" in r.getMessage()]
+    assert len(warnings) == 1
+    # The rest are counted toward the next warning
+    assert server._dropped_events == 3
@@ -1,5 +1,6 @@
 """Tests for NNG communication patterns."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -34,6 +35,15 @@ def test_reqrep_client_uses_req0():
         assert not MockRep.called
 
 
+@pytest.mark.asyncio
+async def test_reqrep_start_binds_socket_methods():
+    with patch("fastworker.patterns.nng_patterns.pynng.Rep0") as MockRep:
+        p = ReqRepPattern("tcp://127.0.0.1:5555", is_server=True)
+        await p.start()
+        assert p.send is MockRep.return_value.asend
+        assert p.recv is MockRep.return_value.arecv
+
+
 def test_reqrep_close_when_no_socket():
     p = ReqRepPattern("tcp://127.0.0.1:5555", is_server=True)
     p.socket = None
@@ -122,3 +132,81 @@ def test_close_calls_socket_close():
     p.socket = mock_socket
     p.close()
     mock_socket.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reqrep_recv_request_replies_out_of_order():
+    server = ReqRepPattern("inproc://fastworker-recv-request", is_server=True)
+    await server.start()
+    clients = [ReqRepPattern("inproc://fastworker-recv-request") for _ in range(2)]
+    for client in clients:
+        await client.start()
+
+    try:
+        for i, client in enumerate(clients):
+            await client.send(f"req-{i}".encode())
+        first, first_reply = await server.recv_request()
+        second, second_reply = await server.recv_request()
+
+        # Answer the newer request first; each reply still reaches its own sender
+        await second_reply.send(b"re:" + second)
+        await first_reply.send(b"re:" + first)
+        assert await clients[0].recv() == b"re:req-0"
+        assert await clients[1].recv() == b"re:req-1"
+    finally:
+        for client in clients:
+            client.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_reqrep_request_runs_concurrent_exchanges_on_one_socket():
+    import asyncio
+
+    server = ReqRepPattern("inproc://fastworker-request-contexts", is_server=True)
+    await server.start()
+    client = ReqRepPattern("inproc://fastworker-request-contexts")
+    await client.start()
+
+    try:
+        pending = [asyncio.create_task(client.request(f"req-{i}".encode())) for i in range(2)]
+        first, first_reply = await server.recv_request()
+        second, second_reply = await server.recv_request()
+
+        await second_reply.send(b"re:" + second)
+        await first_reply.send(b"re:" + first)
+        assert await asyncio.gather(*pending) == [b"re:req-0", b"re:req-1"]
+    finally:
+        client.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_context_errors_survive_closed_socket():
+    import pynng
+
+    from fastworker.patterns.nng_patterns import ReplyContext
+
+    server = ReqRepPattern("inproc://fastworker-closed-contexts", is_server=True)
+    await server.start()
+    client = ReqRepPattern("inproc://fastworker-closed-contexts")
+    await client.start()
+
+    pending = asyncio.create_task(client.request(b"req"))
+    data, reply = await server.recv_request()
+    client.close()
+    server.close()
+
+    # Closing the socket already tore the contexts down; the exchange error surfaces
+    with pytest.raises(pynng.Closed):
+        await pending
+    with pytest.raises(pynng.Closed):
+        await reply.send(b"late")
+    reply.close()
+
+    # A context whose close fails after the socket went away keeps the original error
+    context = MagicMock()
+    context.asend = AsyncMock(side_effect=pynng.ConnectionReset("reset", 0))
+    context.close.side_effect = pynng.Closed("closed", 0)
+    with pytest.raises(pynng.ConnectionReset):
+        await ReplyContext(context).send(b"reply")
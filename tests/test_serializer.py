@@ -1,5 +1,10 @@
 """Test cases for FastWorker serializer."""
 
+import math
+from datetime import datetime
+
+import pytest
+
 from fastworker.tasks.serializer import SerializationFormat, TaskSerializer
 
 
@@ -122,3 +127,143 @@ def test_large_data_serialization():
         serialized = TaskSerializer.serialize(large_data, format_type)
         deserialized = TaskSerializer.deserialize(serialized, format_type)
         assert deserialized == large_data
+
+
+def test_msgpack_serialization():
+    """Test MessagePack serialization and deserialization of a task payload."""
+    pytest.importorskip("msgpack")
+    from fastworker.tasks.models import Task
+
+    task = Task(name="test_task", args=(1, 2), kwargs={"key": "value"})
+
+    serialized = TaskSerializer.serialize(task.model_dump(), SerializationFormat.MSGPACK)
+    assert isinstance(serialized, bytes)
+
+    deserialized = TaskSerializer.deserialize(serialized, SerializationFormat.MSGPACK)
+    assert deserialized["name"] == "test_task"
+    # datetimes travel as strings, as with JSON, and validate back into the model
+    assert Task(**deserialized).created_at == task.created_at
+
+
+def test_msgpack_requires_msgpack(monkeypatch):
+    """Test that MSGPACK without msgpack installed raises a helpful error."""
+    from fastworker.tasks import serializer
+
+    monkeypatch.setattr(serializer, "MSGPACK_AVAILABLE", False)
+    with pytest.raises(ImportError, match="fastworker\\[msgpack\\]"):
+        TaskSerializer.serialize({"a": 1}, SerializationFormat.MSGPACK)
+
+
+def test_bind_returns_format_functions():
+    """Test that bound functions round-trip like serialize/deserialize."""
+    data = {"name": "test_task", "args": [1, 2], "kwargs": {}}
+
+    serialize, deserialize = TaskSerializer.bind(SerializationFormat.JSON)
+    assert serialize(data) == TaskSerializer.serialize(data, SerializationFormat.JSON)
+    assert deserialize(serialize(data)) == data
+
+    with pytest.warns(RuntimeWarning):
+        serialize, deserialize = TaskSerializer.bind(SerializationFormat.PICKLE)
+    assert deserialize(serialize(data)) == data
+
+
+def test_bound_msgpack_packer_is_reusable():
+    """Test that the bound MessagePack packer gives the same bytes on every call."""
+    pytest.importorskip("msgpack")
+    from datetime import datetime
+
+    data = {"name": "test_task", "args": [1, 2], "eta": datetime(2024, 1, 1)}
+    expected = TaskSerializer.serialize(data, SerializationFormat.MSGPACK)
+
+    serialize, deserialize = TaskSerializer.bind(SerializationFormat.MSGPACK)
+    assert serialize(data) == expected
+    assert serialize(data) == expected
+    assert deserialize(expected)["eta"] == "2024-01-01 00:00:00"
+
+    class Unprintable:
+        def __str__(self):
+            raise ValueError("no str")
+
+    # A failed call does not leave partial output behind for the next one
+    with pytest.raises(ValueError):
+        serialize({"args": [1, Unprintable()]})
+    assert serialize(data) == expected
+
+
+def test_json_serialization_falls_back_for_values_orjson_rejects():
+    """Test that JSON output stays compatible whichever encoder is used."""
+    data = {"big": 2**70, 1: "int key", "nan": float("nan")}
+
+    serialized = TaskSerializer.serialize(data, SerializationFormat.JSON)
+    deserialized = TaskSerializer.deserialize(serialized, SerializationFormat.JSON)
+
+    assert deserialized["big"] == 2**70
+    assert deserialized["1"] == "int key"
+    # NaN from a stdlib-encoding peer must still decode
+    assert math.isnan(TaskSerializer.deserialize(b'{"x": NaN}', SerializationFormat.JSON)["x"])
+
+
+def test_json_fallback_keeps_datetimes_in_iso_format():
+    """Test that datetimes are encoded the same way when orjson rejects the payload."""
+    stamp = datetime(2024, 1, 2, 3, 4, 5, 678000)
+    data = {"big": 2**70, "at": stamp}
+
+    serialized = TaskSerializer.serialize(data, SerializationFormat.JSON)
+    deserialized = TaskSerializer.deserialize(serialized, SerializationFormat.JSON)
+
+    assert deserialized["at"] == stamp.isoformat()
+
+
+def test_serialize_model_matches_dict_path():
+    """Test that models encoded directly decode like their model_dump()."""
+    from fastworker.tasks.models import Task, TaskResult, TaskStatus
+
+    task = Task(name="test_task", args=(1, 2), kwargs={"key": "value"})
+    serialized = TaskSerializer.serialize_model(task, SerializationFormat.JSON)
+    assert TaskSerializer.bind_model(SerializationFormat.JSON)(task) == serialized
+    deserialized = TaskSerializer.deserialize(serialized, SerializationFormat.JSON)
+    assert Task.model_validate(deserialized) == task
+
+    with pytest.warns(RuntimeWarning):
+        serialized = TaskSerializer.serialize_model(task, SerializationFormat.PICKLE)
+        deserialized = TaskSerializer.deserialize(serialized, SerializationFormat.PICKLE)
+    assert deserialized == task.model_dump()
+
+    # Values without a JSON encoding fall back to str(), as in serialize()
+    result = TaskResult(task_id="t1", status=TaskStatus.SUCCESS, result={"obj": object})
+    deserialized = TaskSerializer.deserialize(
+        TaskSerializer.serialize_model(result, SerializationFormat.JSON), SerializationFormat.JSON
+    )
+    assert deserialized["result"]["obj"] == str(object)
+
+
+def test_serialization_format_from_env(monkeypatch):
+    """Test reading the format from FASTWORKER_SERIALIZATION_FORMAT."""
+    monkeypatch.delenv("FASTWORKER_SERIALIZATION_FORMAT", raising=False)
+    assert SerializationFormat.from_env() == SerializationFormat.JSON
+
+    for name, expected in (
+        ("msgpack", SerializationFormat.MSGPACK),
+        ("PICKLE", SerializationFormat.PICKLE),
+        ("orjson", SerializationFormat.JSON),
+        ("bogus", SerializationFormat.JSON),
+    ):
+        monkeypatch.setenv("FASTWORKER_SERIALIZATION_FORMAT", name)
+        assert SerializationFormat.from_env() == expected
+
+
+def test_bind_model_decoder_matches_dict_path():
+    """Test that decoding bytes straight into a model matches model_validate."""
+    from fastworker.tasks.models import Task
+
+    task = Task(name="test_task", args=(1, 2**70), kwargs={"key": [1.5, None]})
+    decode = TaskSerializer.bind_model_decoder(Task, SerializationFormat.JSON)
+
+    assert decode(TaskSerializer.serialize(task.model_dump(), SerializationFormat.JSON)) == task
+    assert decode(TaskSerializer.serialize_model(task, SerializationFormat.JSON)) == task
+
+    decode = TaskSerializer.bind_model_decoder(Task, SerializationFormat.PICKLE)
+    with pytest.warns(RuntimeWarning):
+        assert (
+            decode(TaskSerializer.serialize(task.model_dump(), SerializationFormat.PICKLE)) == task
+        )
@@ -1,7 +1,10 @@
 """Test cases for FastWorker SubWorker."""
 
+from unittest.mock import AsyncMock
+
 import pytest
 
+from fastworker.workers.state import WorkerState
 from fastworker.workers.subworker import SubWorker
 
 
@@ -248,4 +251,117 @@ def test_subworker_peers_initialized():
 
     # Base Worker class initializes peers
     assert hasattr(subworker, "peers")
-    assert isinstance(subworker.peers, set)
+    assert isinstance(subworker.peers, dict)
+
+
+def test_subworker_precomputes_registration_frames():
+    """Test that registration and heartbeat payloads are encoded once at init."""
+    from fastworker.tasks.serializer import TaskSerializer
+
+    subworker = SubWorker(
+        worker_id="sw-frames",
+        control_plane_address="tcp://127.0.0.1:5555",
+        base_address="tcp://127.0.0.1:5561",
+    )
+    fmt = subworker.serialization_format
+
+    registration = TaskSerializer.deserialize(subworker._registration_frame, fmt)
+    heartbeat = TaskSerializer.deserialize(subworker._heartbeat_frame, fmt)
+    assert registration == {
+        "subworker_id": "sw-frames",
+        "address": "tcp://127.0.0.1:5561",
+        "status": "active",
+    }
+    assert heartbeat == {**registration, "heartbeat": True}
+
+
+@pytest.mark.asyncio
+async def test_subworker_start_does_not_dial_discovery_bus():
+    """Test that starting a subworker opens no discovery bus socket."""
+    subworker = SubWorker(
+        worker_id="test-subworker",
+        control_plane_address="tcp://127.0.0.1:5555",
+    )
+    for respondent in (
+        subworker.critical_respondent,
+        subworker.high_respondent,
+        subworker.normal_respondent,
+        subworker.low_respondent,
+    ):
+        respondent.start = AsyncMock()
+    subworker._register_with_control_plane = AsyncMock()
+    subworker._periodic_reregistration = AsyncMock()
+    subworker._process_tasks = AsyncMock()
+    subworker.shutdown_event.set()
+
+    await subworker.start()
+
+    assert subworker.discovery_bus.socket is None
+    assert subworker.lifecycle.state == WorkerState.STOPPED
+
+
+def test_subworker_respondents_built_once_per_priority():
+    """Test that subworker respondents are created as ReqRep patterns, one per priority."""
+    from fastworker.patterns.nng_patterns import ReqRepPattern
+    from fastworker.tasks.models import TaskPriority
+
+    subworker = SubWorker(
+        worker_id="test-subworker",
+        control_plane_address="tcp://127.0.0.1:5555",
+        base_address="tcp://127.0.0.1:5600",
+    )
+
+    priorities = [priority for priority, _ in subworker.respondents]
+    assert priorities == [
+        TaskPriority.CRITICAL,
+        TaskPriority.HIGH,
+        TaskPriority.NORMAL,
+        TaskPriority.LOW,
+    ]
+    assert all(isinstance(r, ReqRepPattern) for _, r in subworker.respondents)
+    assert subworker.respondents[0][1] is subworker.critical_respondent
+    assert subworker.respondents[3][1].address == "tcp://127.0.0.1:5603"
+
+
+@pytest.mark.asyncio
+async def test_reregistration_backs_off_then_resumes_heartbeats():
+    """Test that failed registrations retry with a growing delay until one succeeds."""
+    from unittest.mock import patch
+
+    from fastworker.workers import subworker as subworker_module
+
+    subworker = SubWorker(
+        worker_id="test-subworker",
+        control_plane_address="tcp://127.0.0.1:5555",
+    )
+    await subworker.lifecycle.start()
+    await subworker.lifecycle.ready()
+
+    attempts = []
+
+    async def register():
+        attempts.append(1)
+        subworker.registered = len(attempts) >= 4
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 6:
+            await subworker.lifecycle.force_stop()
+
+    subworker._register_with_control_plane = register
+    subworker._send_heartbeat = AsyncMock()
+    with patch.object(subworker_module.asyncio, "sleep", fake_sleep):
+        await subworker._periodic_reregistration()
+
+    assert delays == [
+        subworker_module.HEARTBEAT_INTERVAL,
+        1.0,
+        2.0,
+        4.0,
+        subworker_module.HEARTBEAT_INTERVAL,
+        subworker_module.HEARTBEAT_INTERVAL,
+    ]
+    assert len(attempts) == 4
+    subworker._send_heartbeat.assert_awaited_once()
@@ -6,9 +6,10 @@ from fastworker.telemetry.metrics import (
     NoOpMeter,
     NoOpUpDownCounter,
     get_meter,
-    record_queue_size,
     record_task_metric,
     record_worker_metric,
+    register_queue_size_source,
+    unregister_queue_size_sources,
 )
 
 
@@ -60,6 +61,101 @@ def test_record_worker_metric_does_not_raise():
     record_worker_metric("queue_size", "w2", count=5)
 
 
-def test_record_queue_size_does_not_raise():
-    record_queue_size(worker_id="w1", priority="normal", size=10)
-    record_queue_size(worker_id="w1", priority="high", size=0)
+def test_register_queue_size_source():
+    from fastworker.telemetry import metrics
+
+    queue = [1, 2, 3]
+    register_queue_size_source("w1", "normal", lambda: len(queue))
+    register_queue_size_source("w1", "high", lambda: 0)
+    register_queue_size_source("w2", "normal", lambda: 7)
+
+    assert metrics._queue_size_sources[("w1", "normal")]() == 3
+
+    unregister_queue_size_sources("w1")
+    assert ("w1", "normal") not in metrics._queue_size_sources
+    assert ("w1", "high") not in metrics._queue_size_sources
+    assert ("w2", "normal") in metrics._queue_size_sources
+
+    unregister_queue_size_sources("w2")
+
+
+def test_meter_initialized_at_import():
+    from fastworker.telemetry import metrics
+
+    assert metrics._meter is not None
+    assert metrics._task_completed_counter is not None
+
+
+def test_reinitialize_after_fork_rebuilds_meter():
+    from fastworker.telemetry import metrics
+
+    old_lock = metrics._init_lock
+    metrics._reinitialize_after_fork()
+
+    assert metrics._meter is not None
+    assert metrics._init_lock is not old_lock
+    assert get_meter() is metrics._meter
+
+
+def test_noop_meter_returns_shared_singleton():
+    from fastworker.telemetry.metrics import _NOOP
+
+    assert _NOOP.create_counter("a") is _NOOP
+    assert _NOOP.create_histogram("b") is _NOOP
+    assert not hasattr(_NOOP, "__dict__")
+
+
+def test_record_functions_rebound_when_disabled():
+    from fastworker.telemetry import metrics
+
+    if metrics._telemetry_enabled:
+        return
+    assert metrics.record_task_metric is metrics._record_nothing
+    assert metrics.record_worker_metric is metrics._record_nothing
+
+
+def test_worker_active_emits_only_transitions():
+    from fastworker.telemetry import metrics
+
+    assert metrics._active_transition("wt", 1) == 1
+    assert metrics._active_transition("wt", 1) == 0
+    assert metrics._active_transition("wt", -1) == 0
+    assert metrics._active_transition("wt", -1) == -1
+    assert "wt" not in metrics._worker_active_counts
+    # Extra stops never drive the count negative
+    assert metrics._active_transition("wt", -1) == 0
+    assert metrics._active_transition("wt", 1) == 1
+    metrics._active_transition("wt", -1)
+
+
+def test_bootstrap_rebinds_entry_points_only_when_disabled(monkeypatch):
+    from fastworker.telemetry import bootstrap as bootstrap_module
+
+    fork_hooks = []
+    monkeypatch.setattr(
+        bootstrap_module.os,
+        "register_at_fork",
+        lambda after_in_child: fork_hooks.append(after_in_child),
+        raising=False,
+    )
+
+    def original():
+        pass
+
+    def stand_in():
+        pass
+
+    def reinit():
+        pass
+
+    calls = []
+    for enabled in ("false", "true"):
+        monkeypatch.setenv("FASTWORKER_TELEMETRY_ENABLED", enabled)
+        namespace = {"entry": original}
+        bootstrap_module.bootstrap(
+            namespace, lambda enabled=enabled: calls.append(enabled), reinit, {"entry": stand_in}
+        )
+        assert namespace["entry"] is (stand_in if enabled == "false" else original)
+
+    assert calls == ["false", "true"]
+    assert fork_hooks == [reinit, reinit]
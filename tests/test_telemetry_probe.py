@@ -0,0 +1,44 @@
+"""Tests for the OTLP endpoint connectivity check."""
+
+import socket
+
+import pytest
+
+from fastworker.telemetry import probe
+from fastworker.telemetry.probe import endpoint_reachable
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_cache():
+    probe._check.cache_clear()
+    yield
+    probe._check.cache_clear()
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_endpoint_reachable_with_listener():
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        assert endpoint_reachable(f"http://127.0.0.1:{port}")
+        assert endpoint_reachable(f"127.0.0.1:{port}")
+
+
+def test_endpoint_unreachable_without_listener():
+    assert not endpoint_reachable(f"http://127.0.0.1:{_free_port()}")
+
+
+def test_probe_disabled_with_zero_timeout(monkeypatch):
+    monkeypatch.setenv("FASTWORKER_TELEMETRY_PROBE_TIMEOUT", "0")
+    assert endpoint_reachable(f"http://127.0.0.1:{_free_port()}")
+
+
+def test_invalid_probe_timeout_uses_default(monkeypatch):
+    monkeypatch.setenv("FASTWORKER_TELEMETRY_PROBE_TIMEOUT", "soon")
+    assert probe._probe_timeout() == probe.DEFAULT_PROBE_TIMEOUT
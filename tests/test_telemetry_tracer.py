@@ -2,7 +2,13 @@
 
 import pytest
 
-from fastworker.telemetry.tracer import NoOpSpan, NoOpTracer, get_tracer, trace_operation
+from fastworker.telemetry.tracer import (
+    NoOpSpan,
+    NoOpTracer,
+    get_tracer,
+    trace_operation,
+    trace_task,
+)
 
 
 def test_noop_tracer_start_span_returns_noop_span():
@@ -51,3 +57,77 @@ async def test_trace_operation_nested():
 def test_trace_operation_with_attributes():
     with trace_operation("test.op", attributes={"task.id": "abc", "count": 5}):
         pass
+
+
+def test_tracer_initialized_at_import():
+    from fastworker.telemetry import tracer
+
+    assert tracer._tracer is not None
+
+
+def test_reinitialize_after_fork_rebuilds_tracer():
+    from fastworker.telemetry import tracer
+
+    old_lock = tracer._init_lock
+    tracer._reinitialize_after_fork()
+
+    assert tracer._tracer is not None
+    assert tracer._init_lock is not old_lock
+    assert get_tracer() is tracer._tracer
+
+
+def test_trace_task_sync_passes_through_result():
+    @trace_task
+    def add(x, y=0):
+        return x + y
+
+    assert add(2, y=3) == 5
+
+
+@pytest.mark.asyncio
+async def test_trace_task_async_passes_through_result():
+    @trace_task
+    async def add(x, y=0):
+        return x + y
+
+    assert await add(2, y=3) == 5
+
+
+def test_trace_task_returns_func_unchanged_when_disabled():
+    def add(x, y):
+        return x + y
+
+    assert trace_task(add) is add
+
+
+def test_noop_tracer_is_allocation_free_singleton():
+    from fastworker.telemetry.tracer import _NOOP
+
+    assert _NOOP.start_span("a") is _NOOP
+    with _NOOP.start_as_current_span("b") as span:
+        assert span is _NOOP
+    assert trace_operation("c") is _NOOP
+    assert not hasattr(_NOOP, "__dict__")
+
+
+def test_trace_operation_propagates_exceptions():
+    with pytest.raises(ValueError):
+        with trace_operation("failing.op"):
+            raise ValueError("boom")
+
+
+def test_tracer_functions_rebound_when_disabled():
+    from fastworker.telemetry import tracer
+
+    if tracer._telemetry_enabled:
+        return
+    assert tracer.trace_operation is tracer._untraced_operation
+    assert tracer.trace_task is tracer._untraced_task
+
+
+def test_tracing_active_reflects_tracer():
+    from fastworker.telemetry import tracer
+
+    assert tracer.tracing_active() is (tracer._tracer is not tracer._NOOP)
+    if not tracer._telemetry_enabled:
+        assert tracer.tracing_active() is False
@@ -95,3 +95,189 @@ def test_task_registry_operations():
     # Test listing tasks
     tasks = task_registry.list_tasks()
     assert "sample_task" in tasks
+
+
+@pytest.mark.asyncio
+async def test_process_tasks_bounds_prefetch(worker):
+    """Test that the receive loop stops taking tasks while the backlog is full."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from fastworker.workers.state import WorkerState
+    from fastworker.workers.worker import PREFETCH_PER_SLOT
+
+    release = asyncio.Event()
+
+    async def blocked_execute(task, reply):
+        await release.wait()
+
+    task_bytes = worker._serialize(Task(name="noop").model_dump())
+    respondent = MagicMock()
+    respondent.recv_request = AsyncMock(return_value=(task_bytes, MagicMock()))
+    worker._execute_and_respond = blocked_execute
+    await worker.lifecycle.start()
+    await worker.lifecycle.ready()
+    assert worker.lifecycle.state == WorkerState.RUNNING
+
+    loop_task = asyncio.create_task(worker._process_tasks(respondent, TaskPriority.NORMAL))
+    await asyncio.sleep(0.05)
+    assert respondent.recv_request.await_count == PREFETCH_PER_SLOT * worker.concurrency
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert respondent.recv_request.await_count > PREFETCH_PER_SLOT * worker.concurrency
+
+    loop_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await loop_task
+
+
+@pytest.mark.parametrize("kind", ["worker", "subworker"])
+@pytest.mark.asyncio
+async def test_process_tasks_answers_concurrent_requests_out_of_order(kind):
+    """Test that each concurrent requester gets its own result when tasks finish out of order."""
+    import asyncio
+
+    from fastworker.patterns.nng_patterns import ReqRepPattern, SurveyorRespondentPattern
+    from fastworker.tasks.models import TaskResult, TaskStatus
+    from fastworker.workers.subworker import SubWorker
+
+    @task
+    async def slow_echo(value: str) -> str:
+        await asyncio.sleep(0.2)
+        return value
+
+    @task
+    async def fast_echo(value: str) -> str:
+        return value
+
+    # Drive the worker's own respondent: surveys for a Worker, requests for a SubWorker
+    if kind == "worker":
+        worker = Worker(worker_id="ooo-worker", base_address="tcp://127.0.0.1:47120", concurrency=4)
+        clients = [
+            SurveyorRespondentPattern(worker.normal_respondent.address, is_surveyor=True)
+            for _ in range(2)
+        ]
+    else:
+        worker = SubWorker(
+            worker_id="ooo-subworker",
+            control_plane_address="tcp://127.0.0.1:47130",
+            base_address="tcp://127.0.0.1:47125",
+            concurrency=4,
+        )
+        clients = [ReqRepPattern(worker.normal_respondent.address) for _ in range(2)]
+
+    server = worker.normal_respondent
+    await server.start()
+    for client in clients:
+        await client.start()
+    await worker.lifecycle.start()
+    await worker.lifecycle.ready()
+    loop_task = asyncio.create_task(worker._process_tasks(server, TaskPriority.NORMAL))
+    # Let the dialers finish connecting before the first message goes out
+    await asyncio.sleep(0.05)
+
+    async def submit(client, name, value):
+        await client.send(worker._serialize(Task(name=name, args=(value,)).model_dump()))
+        data = await asyncio.wait_for(client.recv(), timeout=2.0)
+        return TaskResult.model_validate(
+            worker._deserialize(data)
+        ), asyncio.get_running_loop().time()
+
+    try:
+        slow = asyncio.create_task(submit(clients[0], "slow_echo", "A"))
+        await asyncio.sleep(0.05)
+        fast = asyncio.create_task(submit(clients[1], "fast_echo", "B"))
+        (slow_result, slow_done), (fast_result, fast_done) = await asyncio.gather(slow, fast)
+
+        assert fast_done < slow_done
+        assert (slow_result.status, slow_result.result) == (TaskStatus.SUCCESS, "A")
+        assert (fast_result.status, fast_result.result) == (TaskStatus.SUCCESS, "B")
+    finally:
+        loop_task.cancel()
+        await asyncio.gather(loop_task, return_exceptions=True)
+        for client in clients:
+            client.close()
+        server.close()
+
+
+def test_announcement_round_trip():
+    """Test that worker announcements survive ids and addresses containing colons."""
+    from fastworker.utils.announce import decode_announcement, encode_announcement
+
+    frame = encode_announcement("rack:1/worker", "tcp://[::1]:5555")
+    assert decode_announcement(frame) == ("rack:1/worker", "tcp://[::1]:5555")
+
+    # Older nodes announce in text form
+    legacy = b"WORKER_ANNOUNCE:worker1:tcp://127.0.0.1:5555"
+    assert decode_announcement(legacy) == ("worker1", "tcp://127.0.0.1:5555")
+
+    assert decode_announcement(b'{"action": "register"}') is None
+    assert decode_announcement(frame[:4]) is None
+
+
+@pytest.mark.asyncio
+async def test_listen_for_peers_keeps_latest_address_per_peer(worker):
+    """Test that a burst of announcements is drained into one entry per peer."""
+    import asyncio
+
+    from fastworker.patterns.nng_patterns import BusPattern
+    from fastworker.utils.announce import encode_announcement
+
+    listener = BusPattern("inproc://test-peer-discovery", listen=True)
+    announcer = BusPattern("inproc://test-peer-discovery", listen=False)
+    await listener.start()
+    await announcer.start()
+    worker.discovery_bus = listener
+    await worker.lifecycle.start()
+    await worker.lifecycle.ready()
+
+    await announcer.send(encode_announcement("peer-a", "tcp://10.0.0.1:5555"))
+    await announcer.send(encode_announcement("peer-b", "tcp://10.0.0.2:5555"))
+    await announcer.send(encode_announcement("peer-a", "tcp://10.0.0.3:5555"))
+
+    listen = asyncio.create_task(worker._listen_for_peers())
+    try:
+        for _ in range(50):
+            if worker.peers.get("peer-a") == "tcp://10.0.0.3:5555":
+                break
+            await asyncio.sleep(0.01)
+        assert worker.peers == {
+            "peer-a": "tcp://10.0.0.3:5555",
+            "peer-b": "tcp://10.0.0.2:5555",
+        }
+    finally:
+        # Closing the bus ends the pending recv; the loop exits once not running
+        await worker.lifecycle.force_stop()
+        listener.close()
+        announcer.close()
+        await asyncio.wait_for(listen, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_signal_handler_installed_once_per_loop_for_all_workers():
+    """Test that one signal handler per loop shuts down every started worker."""
+    import asyncio
+    import signal
+
+    first = Worker(worker_id="first")
+    second = Worker(worker_id="second")
+    loop = asyncio.get_running_loop()
+
+    with patch.object(loop, "add_signal_handler") as add_signal_handler:
+        first._install_signal_handlers()
+        second._install_signal_handlers()
+
+    assert add_signal_handler.call_count == 2  # SIGTERM and SIGINT, once each
+
+    Worker._dispatch_signal(signal.SIGTERM)
+    assert first.shutdown_event.is_set()
+    assert second.shutdown_event.is_set()
+
+    # A stopped worker is dropped from signal dispatch even while still referenced
+    first.stop()
+    first.shutdown_event.clear()
+    second.shutdown_event.clear()
+    Worker._dispatch_signal(signal.SIGTERM)
+    assert not first.shutdown_event.is_set()
+    assert second.shutdown_event.is_set()